@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+HTML Parser Benchmark
+
+Times BeautifulSoup parsing of a career page with every installed backend,
+optionally restricted to a container selector, to show what lxml and
+subtree parsing save on large job boards.
+
+Usage:
+    python benchmark_html_parsers.py page.html [--selector "#jobs"] [--runs 5]
+    python benchmark_html_parsers.py --company ukg [--runs 5]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from bs4 import BeautifulSoup
+from scrapers.html_parser import available_parsers, selector_strainer
+from scrapers.http_session import get_session, DEFAULT_TIMEOUT
+
+
+def load_page(args):
+    """
+    Load the HTML to benchmark from a file or a configured company's URL.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments
+
+    Returns:
+        tuple: (html, selector) - selector from the arguments or company config
+    """
+    if args.file:
+        return Path(args.file).read_text(encoding='utf-8', errors='replace'), args.selector
+
+    with open('companies_config.json', 'r') as f:
+        companies = json.load(f)['companies']
+    company = next((c for c in companies if c['slug'] == args.company), None)
+    if not company:
+        print(f"[ERROR] Company '{args.company}' not found")
+        sys.exit(1)
+
+    response = get_session().get(company['url'], timeout=DEFAULT_TIMEOUT)
+    response.raise_for_status()
+    return response.text, args.selector or company.get('jobs_container_selector')
+
+
+def time_parse(html, parser, runs, strainer=None):
+    """
+    Time parsing a page.
+
+    Args:
+        html (str): Page HTML
+        parser (str): BeautifulSoup parser name
+        runs (int): Number of parses to average
+        strainer (SoupStrainer): Optional subtree filter
+
+    Returns:
+        float: Average seconds per parse
+    """
+    start = time.perf_counter()
+    for _ in range(runs):
+        BeautifulSoup(html, parser, parse_only=strainer)
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    """Main function."""
+    arg_parser = argparse.ArgumentParser(description='Benchmark HTML parser backends')
+    arg_parser.add_argument('file', nargs='?', help='HTML file to parse')
+    arg_parser.add_argument('--company', help='Fetch the page of a configured company (slug)')
+    arg_parser.add_argument('--selector', help='Container selector for subtree parsing')
+    arg_parser.add_argument('--runs', type=int, default=5, help='Parses per backend (default: 5)')
+    args = arg_parser.parse_args()
+
+    if not args.file and not args.company:
+        arg_parser.error('give an HTML file or --company')
+
+    html, selector = load_page(args)
+    strainer = selector_strainer(selector) if selector else None
+
+    print("HTML Parser Benchmark")
+    print("=" * 60)
+    print(f"Page size: {len(html) / 1024:.0f} KB, {args.runs} runs per backend")
+    if selector and strainer is None:
+        print(f"Selector '{selector}' is too complex for subtree parsing")
+    print()
+
+    results = []
+    for parser in available_parsers():
+        results.append((parser, time_parse(html, parser, args.runs)))
+        if strainer is not None:
+            results.append((f"{parser} + {selector}", time_parse(html, parser, args.runs, strainer)))
+
+    baseline = next(seconds for name, seconds in results if name == 'html.parser')
+    for name, seconds in results:
+        print(f"  {name:<40} {seconds * 1000:>9.1f} ms  {baseline / seconds:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,11 +24,20 @@ def consolidate_jobs(input_file):
         list: Consolidated job data
     """
     # Read the original CSV
-    jobs = []
     with open(input_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        jobs = list(reader)
+        return consolidate_rows(list(csv.DictReader(f)))
 
+
+def consolidate_rows(jobs):
+    """
+    Consolidates job rows by title and department, grouping locations.
+
+    Args:
+        jobs (list): Job dictionaries (CSV rows)
+
+    Returns:
+        list: Consolidated job data
+    """
     if not jobs:
         return []
 
@@ -99,12 +108,13 @@ def save_consolidated_csv(jobs, output_file):
     print(f"  Consolidated data saved to {output_file}")
 
 
-def consolidate_company(company_slug):
+def consolidate_company(company_slug, rows=None):
     """
     Consolidate jobs for a specific company.
 
     Args:
         company_slug (str): Company slug (folder name)
+        rows (list): Today's job rows, if already read (otherwise today's CSV is read)
 
     Returns:
         bool: True if successful, False otherwise
@@ -125,16 +135,19 @@ def consolidate_company(company_slug):
     print(f"\nConsolidating jobs for: {company_slug}")
     print("-" * 60)
 
+    # Read the original CSV once for both the consolidation and the count
+    if rows is None:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+
     # Consolidate jobs
-    consolidated = consolidate_jobs(input_file)
+    consolidated = consolidate_rows(rows)
 
     if not consolidated:
         print("  No jobs to consolidate")
         return False
 
-    # Get original count
-    with open(input_file, 'r', encoding='utf-8') as f:
-        original_count = sum(1 for _ in csv.DictReader(f))
+    original_count = len(rows)
 
     print(f"  Original job postings: {original_count}")
     print(f"  Unique job titles: {len(consolidated)}")
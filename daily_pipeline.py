@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Daily Post-Scrape Pipeline
+
+Runs the post-scrape stages (new job detection, consolidation, job count
+history, snapshot archiving) for every company in a single process,
+optionally in parallel across companies. Each company's snapshot CSV is
+parsed once and the rows are shared by all stages. Each stage is the same
+function the standalone scripts run, so `python track_new_jobs.py <slug>`
+and this pipeline produce the same files.
+
+Usage:
+    python daily_pipeline.py                 # All enabled companies
+    python daily_pipeline.py --fund partners # One fund
+    python daily_pipeline.py --workers 4     # Process companies in parallel
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from consolidate_jobs import consolidate_company
+from snapshot_store import archive_snapshot
+from track_job_counts import track_counts_for_company
+from track_new_jobs import track_company
+
+
+# Stages run for each company, in order: (result key, description, function).
+# Each function takes the company slug and today's rows (rows=...).
+STAGES = [
+    ('new_jobs', 'Detecting new jobs', track_company),
+    ('consolidated', 'Consolidating jobs', consolidate_company),
+    ('tracked', 'Tracking job counts', track_counts_for_company),
+    ('archived', 'Archiving snapshot', archive_snapshot),
+]
+
+
+class _ThreadOutput(io.TextIOBase):
+    """
+    Stdout replacement that buffers each worker thread's output separately.
+
+    Lets companies be processed in parallel while their logs are still
+    printed as one uninterrupted block per company.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def start_capture(self):
+        self.local.buffer = io.StringIO()
+
+    def stop_capture(self):
+        buffer, self.local.buffer = self.local.buffer, None
+        return buffer.getvalue()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def load_companies(config_file='companies_config.json', fund=None):
+    """
+    Load the enabled companies from the configuration file.
+
+    Args:
+        config_file (str): Path to configuration file
+        fund (str): Optional fund filter ('partners' or 'scf')
+
+    Returns:
+        list: Enabled company configurations
+    """
+    with open(config_file, 'r', encoding='utf-8') as f:
+        companies = json.load(f)['companies']
+    return [c for c in companies
+            if c.get('enabled', True) and (not fund or c.get('fund') == fund)]
+
+
+def read_snapshot(csv_file):
+    """
+    Parse a daily snapshot CSV.
+
+    Args:
+        csv_file (Path): Path to the {slug}_jobs_{date}.csv file
+
+    Returns:
+        list: Job dictionaries, one per row
+    """
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def process_company(company_slug, company_name=None):
+    """
+    Run every post-scrape stage for a single company.
+
+    Today's snapshot CSV is read once and its rows are passed to every
+    stage. A failing stage is reported and the remaining stages still run.
+
+    Args:
+        company_slug (str): Company slug (folder name)
+        company_name (str): Company display name (defaults to the slug)
+
+    Returns:
+        dict: Results for this company, with one boolean per stage
+    """
+    company_name = company_name or company_slug
+    company_dir = Path('companies') / company_slug
+
+    if not company_dir.exists():
+        print(f"[SKIP] No data folder for {company_name}")
+        return {'company': company_name, 'slug': company_slug, 'success': False, 'reason': 'no_data'}
+
+    # Find today's CSV file
+    today = datetime.now().strftime('%Y-%m-%d')
+    csv_file = company_dir / f"{company_slug}_jobs_{today}.csv"
+
+    if not csv_file.exists():
+        print(f"[SKIP] No CSV file for {company_name} today")
+        return {'company': company_name, 'slug': company_slug, 'success': False, 'reason': 'no_csv'}
+
+    print(f"\n{'='*70}")
+    print(f"Processing: {company_name}")
+    print(f"{'='*70}")
+
+    results = {'company': company_name, 'slug': company_slug, 'success': True}
+
+    try:
+        rows = read_snapshot(csv_file)
+    except (OSError, csv.Error, UnicodeDecodeError) as e:
+        print(f"[ERROR] Could not read {csv_file}: {e}")
+        return {'company': company_name, 'slug': company_slug, 'success': False, 'reason': 'unreadable_csv'}
+
+    for key, description, stage in STAGES:
+        print(f"\n{description} for {company_name}...")
+        try:
+            results[key] = bool(stage(company_slug, rows=rows))
+        except Exception as e:
+            print(f"[ERROR] {description} failed for {company_name}: {e}")
+            results[key] = False
+        if not results[key]:
+            print(f"[WARNING] {description} did not complete for {company_name}")
+
+    return results
+
+
+def run_pipeline(companies, workers=1):
+    """
+    Run the post-scrape stages for many companies in one process.
+
+    With more than one worker, companies are processed in parallel and each
+    company's output is printed as a block once it finishes.
+
+    Args:
+        companies (list): Company configurations (need 'slug' and 'name')
+        workers (int): Companies processed at once
+
+    Returns:
+        list: Result dictionaries from process_company(), in the same order as companies
+    """
+    if workers <= 1 or len(companies) <= 1:
+        return [process_company(c['slug'], c.get('name')) for c in companies]
+
+    output = _ThreadOutput(sys.stdout)
+    print_lock = threading.Lock()
+
+    def process(company):
+        output.start_capture()
+        try:
+            return process_company(company['slug'], company.get('name'))
+        except Exception as e:
+            print(f"[ERROR] Processing failed for {company.get('name', company['slug'])}: {e}")
+            return {'company': company.get('name', company['slug']), 'slug': company['slug'],
+                    'success': False, 'reason': str(e)}
+        finally:
+            log = output.stop_capture()
+            with print_lock:
+                output.stream.write(log)
+                output.stream.flush()
+
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(process, companies))
+    finally:
+        sys.stdout = output.stream
+
+
+def print_pipeline_summary(results):
+    """
+    Print per-company stage status.
+
+    Args:
+        results (list): Result dictionaries from run_pipeline()
+    """
+    processed = [r for r in results if r['success']]
+    skipped = [r for r in results if not r['success']]
+
+    print(f"\nTotal companies: {len(results)}")
+    print(f"Processed: {len(processed)}")
+    print(f"Skipped: {len(skipped)}")
+
+    if processed:
+        print("\nProcessed companies:")
+        for r in processed:
+            status = []
+            if r.get('new_jobs'): status.append('new jobs detected')
+            if r.get('consolidated'): status.append('consolidated')
+            if r.get('tracked'): status.append('counts tracked')
+            if r.get('archived'): status.append('snapshot archived')
+
+            status_str = ', '.join(status) if status else 'processed'
+            print(f"  - {r['company']}: {status_str}")
+
+    if skipped:
+        print("\nSkipped companies:")
+        for r in skipped:
+            reason = r.get('reason', 'unknown')
+            print(f"  - {r['company']}: {reason}")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Run the post-scrape stages for all companies')
+    parser.add_argument('--fund', choices=['partners', 'scf'],
+                        help='Filter companies by fund (partners or scf)')
+    parser.add_argument('--company', type=str,
+                        help='Process a single company by slug')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of companies to process concurrently (default: 1)')
+    args = parser.parse_args()
+
+    start_time = datetime.now()
+
+    try:
+        companies = load_companies(fund=args.fund)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[ERROR] Failed to load companies config: {e}")
+        sys.exit(1)
+
+    if args.company:
+        companies = [c for c in companies if c['slug'] == args.company]
+        if not companies:
+            print(f"[ERROR] Company '{args.company}' not found or not enabled")
+            sys.exit(1)
+
+    print("Daily Pipeline (Multi-Company)")
+    print("=" * 70)
+    print(f"Companies: {len(companies)}, workers: {args.workers}")
+
+    results = run_pipeline(companies, workers=args.workers)
+
+    print("\n" + "=" * 70)
+    print("PIPELINE SUMMARY")
+    print("=" * 70)
+    print_pipeline_summary(results)
+
+    duration = (datetime.now() - start_time).total_seconds()
+    print(f"\nTotal duration: {duration:.1f} seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,8 @@ from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+from snapshot_store import SnapshotStore
+
 
 def load_company_config(fund=None):
     """Load company configuration to get display names, optionally filtered by fund."""
@@ -63,6 +65,20 @@ def load_titles_from_csv(filepath):
     return titles
 
 
+def load_titles_for_date(company_dir, company_slug, date):
+    """Load job titles for a day from its CSV, or from the snapshot store if the CSV was pruned."""
+    csv_file = company_dir / f"{company_slug}_jobs_{date}.csv"
+    if csv_file.exists():
+        return load_titles_from_csv(csv_file)
+
+    snapshot = SnapshotStore(company_dir).load(date)
+    if snapshot is None:
+        return None
+    header, rows, _ = snapshot
+    return [{field: job.get(field, '') for field in ('title', 'location', 'department')}
+            for job in (dict(zip(header, row)) for row in rows)]
+
+
 def classify_seniority(title):
     """Classify a job title by seniority level."""
     t = title.lower()
@@ -368,9 +384,9 @@ def generate_all_insights(date_current=None, date_previous=None, fund=None):
 
         # Find files to compare
         if date_current and date_previous:
-            current_file = company_dir / f"{slug}_jobs_{date_current}.csv"
-            previous_file = company_dir / f"{slug}_jobs_{date_previous}.csv"
-            if not current_file.exists() or not previous_file.exists():
+            current_jobs = load_titles_for_date(company_dir, slug, date_current)
+            previous_jobs = load_titles_for_date(company_dir, slug, date_previous)
+            if current_jobs is None or previous_jobs is None:
                 continue
         else:
             pair = find_two_most_recent_csvs(company_dir, slug)
@@ -380,11 +396,10 @@ def generate_all_insights(date_current=None, date_previous=None, fund=None):
             previous_file = pair[1][1]
             date_current = pair[0][0]
             date_previous = pair[1][0]
+            current_jobs = load_titles_from_csv(current_file)
+            previous_jobs = load_titles_from_csv(previous_file)
 
-        # Load and compare
-        current_jobs = load_titles_from_csv(current_file)
-        previous_jobs = load_titles_from_csv(previous_file)
-
+        # Compare
         prev_titles = set(j['title'] for j in previous_jobs)
         new_jobs = [j for j in current_jobs if j['title'] not in prev_titles]
 
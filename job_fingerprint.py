@@ -0,0 +1,175 @@
+"""
+Job Fingerprints
+
+Canonical identity of a job posting as a fixed-width integer. A job's
+identity is its (title, department, location) with whitespace collapsed and
+case folded, so "Senior  Engineer" and "senior engineer" are the same job.
+Fingerprints are 64-bit by default (signed, so they fit an SQLite INTEGER)
+and 128-bit on request.
+
+For scrapers that write a platform-native job ID (or a job-specific URL),
+prefer_native=True identifies jobs by that instead.
+"""
+
+import hashlib
+
+
+FINGERPRINT_BITS = 64
+
+# Fields that identify a job, in order
+IDENTITY_FIELDS = ('title', 'department', 'location')
+
+# Platform-native identifiers, tried in order when prefer_native is set
+NATIVE_ID_FIELDS = ('job_id', 'id', 'requisition_id', 'url')
+
+# Separates the fields in the hashed string (never part of normalized text)
+FIELD_SEPARATOR = '\x1f'
+
+
+def normalize(value):
+    """
+    Normalize a field for identity: collapse whitespace and fold case.
+
+    Args:
+        value: Field value (None counts as empty)
+
+    Returns:
+        str: Normalized text
+    """
+    return ' '.join(str(value if value is not None else '').split()).casefold()
+
+
+def identity_key(job, prefer_native=False):
+    """
+    Get the normalized identity of a job.
+
+    Args:
+        job (dict): Job dictionary (CSV row)
+        prefer_native (bool): Use the first NATIVE_ID_FIELDS value the job has
+
+    Returns:
+        tuple: Normalized identity, e.g. ('senior engineer', 'r&d', 'boston, ma')
+    """
+    if prefer_native:
+        for field in NATIVE_ID_FIELDS:
+            value = normalize(job.get(field))
+            if value:
+                return (field, value.split('#')[0].rstrip('/') if field == 'url' else value)
+
+    return tuple(normalize(job.get(field)) for field in IDENTITY_FIELDS)
+
+
+def fingerprint(key, bits=FINGERPRINT_BITS):
+    """
+    Hash a normalized identity to a fixed-width integer.
+
+    Args:
+        key (tuple): Normalized identity from identity_key()
+        bits (int): 64 (signed, SQLite-compatible) or 128 (unsigned)
+
+    Returns:
+        int: The fingerprint
+    """
+    digest = hashlib.blake2b(FIELD_SEPARATOR.join(key).encode('utf-8'), digest_size=bits // 8).digest()
+    return int.from_bytes(digest, 'big', signed=bits == 64)
+
+
+def job_fingerprint(job, prefer_native=False, bits=FINGERPRINT_BITS):
+    """
+    Get a job's fingerprint.
+
+    Args:
+        job (dict): Job dictionary (CSV row)
+        prefer_native (bool): Identify the job by a native ID or URL if it has one
+        bits (int): Fingerprint width (64 or 128)
+
+    Returns:
+        int: The fingerprint
+    """
+    return fingerprint(identity_key(job, prefer_native), bits)
+
+
+class FingerprintIndex:
+    """
+    Fingerprints of a set of jobs with a reverse lookup and collision check.
+
+    Maps each fingerprint to the first job (title, department, location)
+    seen with it. Two different identities hashing to the same fingerprint
+    are recorded in collisions instead of silently merged.
+    """
+
+    def __init__(self, prefer_native=False, bits=FINGERPRINT_BITS):
+        """
+        Initialize an empty index.
+
+        Args:
+            prefer_native (bool): Identify jobs by native ID or URL if they have one
+            bits (int): Fingerprint width (64 or 128)
+        """
+        self.prefer_native = prefer_native
+        self.bits = bits
+        self.jobs = {}
+        self.keys = {}
+        self.collisions = []
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def __contains__(self, fp):
+        return fp in self.jobs
+
+    def __iter__(self):
+        return iter(self.jobs)
+
+    def add(self, job):
+        """
+        Add a job to the index.
+
+        Args:
+            job (dict): Job dictionary (CSV row)
+
+        Returns:
+            int: The job's fingerprint
+        """
+        key = identity_key(job, self.prefer_native)
+        fp = fingerprint(key, self.bits)
+
+        if fp not in self.keys:
+            self.keys[fp] = key
+            self.jobs[fp] = tuple(job.get(field) or '' for field in IDENTITY_FIELDS)
+        elif self.keys[fp] != key:
+            self.collisions.append((fp, self.keys[fp], key))
+
+        return fp
+
+    def lookup(self, fp):
+        """
+        Get the job a fingerprint stands for.
+
+        Args:
+            fp (int): Fingerprint
+
+        Returns:
+            tuple or None: (title, department, location) as first seen
+        """
+        return self.jobs.get(fp)
+
+    def fingerprints(self):
+        """
+        Get the indexed fingerprints.
+
+        Returns:
+            set: Fingerprints
+        """
+        return set(self.jobs)
+
+
+def report_collisions(index):
+    """
+    Print a warning for each fingerprint collision in an index.
+
+    Args:
+        index (FingerprintIndex): Index to check
+    """
+    for fp, kept, dropped in index.collisions:
+        print(f"  [WARNING] Fingerprint collision {fp}: kept {kept}, dropped {dropped}")
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Job Store
+
+Per-company SQLite database (companies/<slug>/jobs.db) of every job posting
+ever seen, keyed by its 64-bit fingerprint (job_fingerprint.py), with the
+title, department and location it was first seen with, the dates it was
+first and last seen and whether it is still active. Replaces the
+jobs_tracking.json files, which were rewritten in full every day.
+
+New-job detection is an indexed anti-join of today's jobs against the
+store, and the daily update only upserts today's jobs and deactivates the
+ones that disappeared, so its cost follows the size of the day's snapshot
+instead of all history.
+
+Existing jobs_tracking.json files are imported automatically the first time
+a company's store is opened. To import all of them at once:
+    python job_store.py
+    python job_store.py veeva
+"""
+
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from job_fingerprint import FingerprintIndex, report_collisions
+
+
+DB_FILENAME = 'jobs.db'
+LEGACY_TRACKING_FILE = 'jobs_tracking.json'
+
+SCHEMA_VERSION = 1
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS jobs (
+        fingerprint INTEGER PRIMARY KEY,
+        title TEXT NOT NULL,
+        department TEXT NOT NULL,
+        location TEXT NOT NULL,
+        first_seen TEXT NOT NULL,
+        last_seen TEXT NOT NULL,
+        active INTEGER NOT NULL DEFAULT 1
+    )""",
+    "CREATE INDEX IF NOT EXISTS jobs_active ON jobs (last_seen) WHERE active = 1",
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)",
+]
+
+
+class JobStore:
+    """Every job seen for one company, with first/last seen dates and an active flag."""
+
+    def __init__(self, company_dir):
+        """
+        Open (and if needed create) the company's store.
+
+        A new store is seeded from the company's jobs_tracking.json, if any.
+
+        Args:
+            company_dir (Path): Company directory
+        """
+        self.company_dir = Path(company_dir)
+        self.path = self.company_dir / DB_FILENAME
+        # True if the store did not exist yet (first run, or the file was lost)
+        self.created = not self.path.exists()
+
+        self.conn = sqlite3.connect(self.path)
+        self._ensure_schema()
+
+        legacy_file = self.company_dir / LEGACY_TRACKING_FILE
+        if self.created and legacy_file.exists():
+            imported = self.import_tracking_json(legacy_file)
+            print(f"  Imported {imported} jobs from {legacy_file}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def _ensure_schema(self):
+        """Create the tables on first use."""
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] == SCHEMA_VERSION:
+            return
+
+        with self.conn:
+            # DDL does not open a transaction implicitly; a half-created schema must roll back
+            self.conn.execute('BEGIN')
+            for statement in SCHEMA:
+                self.conn.execute(statement)
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def _stage(self, jobs):
+        """
+        Load today's jobs into a temporary table for joins.
+
+        Args:
+            jobs (FingerprintIndex): Today's jobs
+        """
+        self.conn.execute('DROP TABLE IF EXISTS temp.snapshot')
+        self.conn.execute("""
+            CREATE TEMP TABLE snapshot (
+                fingerprint INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                department TEXT NOT NULL,
+                location TEXT NOT NULL
+            )
+        """)
+        self.conn.executemany('INSERT INTO temp.snapshot VALUES (?, ?, ?, ?)',
+                              [(fp, *jobs.lookup(fp)) for fp in jobs])
+
+    def is_empty(self):
+        """
+        Check whether the store has no jobs yet (first run for the company).
+
+        Returns:
+            bool: True if no job has been recorded
+        """
+        return self.conn.execute('SELECT NOT EXISTS (SELECT 1 FROM jobs)').fetchone()[0] == 1
+
+    def count(self, active_only=False):
+        """
+        Count recorded jobs.
+
+        Args:
+            active_only (bool): Only count jobs in the latest snapshot
+
+        Returns:
+            int: Number of jobs
+        """
+        query = 'SELECT COUNT(*) FROM jobs' + (' WHERE active = 1' if active_only else '')
+        return self.conn.execute(query).fetchone()[0]
+
+    def find_new(self, jobs):
+        """
+        Find jobs that have never been seen before.
+
+        Args:
+            jobs (FingerprintIndex): Today's jobs
+
+        Returns:
+            set: Fingerprints not in the store
+        """
+        self._stage(jobs)
+        rows = self.conn.execute("""
+            SELECT fingerprint FROM temp.snapshot
+            WHERE fingerprint NOT IN (SELECT fingerprint FROM jobs)
+        """)
+        return {fp for fp, in rows}
+
+    def lookup(self, fingerprints):
+        """
+        Get the jobs behind fingerprints (reverse lookup).
+
+        Args:
+            fingerprints (iterable): Fingerprints
+
+        Returns:
+            dict: Fingerprint -> (title, department, location) as first seen
+        """
+        query = 'SELECT title, department, location FROM jobs WHERE fingerprint = ?'
+        found = {}
+        for fp in fingerprints:
+            row = self.conn.execute(query, (fp,)).fetchone()
+            if row:
+                found[fp] = row
+        return found
+
+    def record_snapshot(self, jobs, date):
+        """
+        Record a day's jobs: upsert them as active and deactivate the rest.
+
+        Jobs are never deleted, so a job that disappears for a day and then
+        comes back is not reported as new again.
+
+        Args:
+            jobs (FingerprintIndex): The day's jobs
+            date (str): Snapshot date (YYYY-MM-DD)
+
+        Returns:
+            int: Number of jobs added to the store
+        """
+        self._stage(jobs)
+        before = self.count()
+
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO jobs (fingerprint, title, department, location, first_seen, last_seen, active)
+                SELECT fingerprint, title, department, location, ?1, ?1, 1 FROM temp.snapshot WHERE true
+                ON CONFLICT (fingerprint)
+                DO UPDATE SET last_seen = MAX(last_seen, excluded.last_seen), active = 1
+            """, (date,))
+            self.conn.execute("""
+                UPDATE jobs SET active = 0
+                WHERE active = 1 AND fingerprint NOT IN (SELECT fingerprint FROM temp.snapshot)
+            """)
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_updated', ?)",
+                              (datetime.now().isoformat(),))
+
+        return self.count() - before
+
+    def import_tracking_json(self, json_file):
+        """
+        Import the jobs of a legacy jobs_tracking.json file.
+
+        The file does not say when each job was seen, so its last_updated
+        date is used for both dates, and jobs are marked inactive until the
+        next snapshot sees them.
+
+        Args:
+            json_file (Path): jobs_tracking.json file
+
+        Returns:
+            int: Number of jobs imported
+        """
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        date = str(data.get('last_updated') or datetime.now().isoformat())[:10]
+        jobs = FingerprintIndex()
+        for job in data.get('jobs', []):
+            if len(job) == 3:
+                jobs.add(dict(zip(('title', 'department', 'location'), job)))
+        report_collisions(jobs)
+
+        with self.conn:
+            self.conn.executemany("""
+                INSERT OR IGNORE INTO jobs (fingerprint, title, department, location, first_seen, last_seen, active)
+                VALUES (?, ?, ?, ?, ?, ?, 0)
+            """, [(fp, *jobs.lookup(fp), date, date) for fp in jobs])
+
+        return len(jobs)
+
+
+def main():
+    """Import jobs_tracking.json files into job stores."""
+    companies_dir = Path('companies')
+    if not companies_dir.exists():
+        print("[ERROR] Companies directory not found")
+        sys.exit(1)
+
+    if len(sys.argv) > 1:
+        company_dirs = [companies_dir / slug for slug in sys.argv[1:]]
+    else:
+        company_dirs = sorted(d for d in companies_dir.iterdir() if d.is_dir())
+
+    for company_dir in company_dirs:
+        if not (company_dir / LEGACY_TRACKING_FILE).exists():
+            continue
+        if (company_dir / DB_FILENAME).exists():
+            print(f"{company_dir.name}: already imported")
+            continue
+        print(f"{company_dir.name}:")
+        with JobStore(company_dir) as store:
+            print(f"  {store.count()} jobs in {store.path}")
+
+
+if __name__ == "__main__":
+    main()
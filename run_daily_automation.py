@@ -8,14 +8,26 @@ Master script that runs the complete daily workflow:
 3. Create consolidated views
 4. Track job count history
 
-Run this script daily via Task Scheduler.
+Run this script daily via Task Scheduler. After a crash or timeout, rerun it
+with --resume to keep the companies already scraped today.
 """
 
+import argparse
 import subprocess
 import sys
-import json
 from datetime import datetime
-from pathlib import Path
+
+from daily_pipeline import load_companies, run_pipeline, print_pipeline_summary
+
+
+# The scraper skips companies not expected to finish within SCRAPE_DEADLINE,
+# leaving headroom before the hard timeout kills the whole run. Rerunning with
+# --resume after a crash or timeout continues from the checkpoint.
+SCRAPE_TIMEOUT = 600  # 10 minutes max
+SCRAPE_DEADLINE = 540
+
+# Companies post-processed at once (all stages run in this process)
+PIPELINE_WORKERS = 4
 
 
 def run_command(command, description, timeout=600):
@@ -62,76 +74,13 @@ def run_command(command, description, timeout=600):
         return False
 
 
-def process_company_tracking(company_slug, company_name):
-    """
-    Run tracking scripts for a single company.
-
-    Args:
-        company_slug (str): Company slug (folder name)
-        company_name (str): Company display name
-
-    Returns:
-        dict: Results for this company
-    """
-    company_dir = Path('companies') / company_slug
-
-    if not company_dir.exists():
-        print(f"[SKIP] No data folder for {company_name}")
-        return {'company': company_name, 'slug': company_slug, 'success': False, 'reason': 'no_data'}
-
-    # Find today's CSV file
-    today = datetime.now().strftime('%Y-%m-%d')
-    csv_file = company_dir / f"{company_slug}_jobs_{today}.csv"
-
-    if not csv_file.exists():
-        print(f"[SKIP] No CSV file for {company_name} today")
-        return {'company': company_name, 'slug': company_slug, 'success': False, 'reason': 'no_csv'}
-
-    print(f"\n{'='*70}")
-    print(f"Processing: {company_name}")
-    print(f"{'='*70}")
-
-    results = {
-        'company': company_name,
-        'slug': company_slug,
-        'success': True,
-        'new_jobs': False,
-        'consolidated': False,
-        'tracked': False
-    }
-
-    # Run track_new_jobs for this company
-    print(f"\nDetecting new jobs for {company_name}...")
-    success = run_command(
-        [sys.executable, 'track_new_jobs.py', company_slug],
-        f"Track new jobs - {company_name}",
-        timeout=60
-    )
-    results['new_jobs'] = success
-
-    # Run consolidate_jobs for this company
-    print(f"\nConsolidating jobs for {company_name}...")
-    success = run_command(
-        [sys.executable, 'consolidate_jobs.py', company_slug],
-        f"Consolidate jobs - {company_name}",
-        timeout=60
-    )
-    results['consolidated'] = success
-
-    # Run track_job_counts for this company
-    print(f"\nTracking job counts for {company_name}...")
-    success = run_command(
-        [sys.executable, 'track_job_counts.py', company_slug],
-        f"Track job counts - {company_name}",
-        timeout=60
-    )
-    results['tracked'] = success
-
-    return results
-
-
 def main():
     """Main automation workflow."""
+    parser = argparse.ArgumentParser(description='Run the daily scrape and tracking workflow')
+    parser.add_argument('--resume', action='store_true',
+                        help="Keep companies already scraped successfully today (after a crash or timeout)")
+    args = parser.parse_args()
+
     start_time = datetime.now()
 
     print("\n" + "="*70)
@@ -144,10 +93,15 @@ def main():
     print("\n[STEP 1/2] Scraping all companies...")
     print("="*70)
 
+    scrape_command = [sys.executable, 'scrape_all_companies.py', '--workers', '8',
+                      '--deadline', str(SCRAPE_DEADLINE)]
+    if args.resume:
+        scrape_command.append('--resume')
+
     scrape_success = run_command(
-        [sys.executable, 'scrape_all_companies.py'],
+        scrape_command,
         "Scrape all 16 companies",
-        timeout=600  # 10 minutes max
+        timeout=SCRAPE_TIMEOUT
     )
 
     if not scrape_success:
@@ -160,18 +114,13 @@ def main():
 
     # Load company config to get list of enabled companies
     try:
-        with open('companies_config.json', 'r') as f:
-            config = json.load(f)
-        companies = [c for c in config['companies'] if c.get('enabled', True)]
+        companies = load_companies()
     except Exception as e:
         print(f"[ERROR] Failed to load companies config: {e}")
         sys.exit(1)
 
-    # Process each company
-    tracking_results = []
-    for company in companies:
-        result = process_company_tracking(company['slug'], company['name'])
-        tracking_results.append(result)
+    # Process every company in-process (no interpreter per stage and company)
+    tracking_results = run_pipeline(companies, workers=PIPELINE_WORKERS)
 
     # Summary
     end_time = datetime.now()
@@ -181,29 +130,7 @@ def main():
     print("AUTOMATION SUMMARY")
     print("="*70)
 
-    successful_companies = [r for r in tracking_results if r['success']]
-    skipped_companies = [r for r in tracking_results if not r['success']]
-
-    print(f"\nTotal companies: {len(companies)}")
-    print(f"Processed: {len(successful_companies)}")
-    print(f"Skipped: {len(skipped_companies)}")
-
-    if successful_companies:
-        print(f"\nProcessed companies:")
-        for r in successful_companies:
-            status = []
-            if r.get('new_jobs'): status.append('new jobs detected')
-            if r.get('consolidated'): status.append('consolidated')
-            if r.get('tracked'): status.append('counts tracked')
-
-            status_str = ', '.join(status) if status else 'processed'
-            print(f"  - {r['company']}: {status_str}")
-
-    if skipped_companies:
-        print(f"\nSkipped companies:")
-        for r in skipped_companies:
-            reason = r.get('reason', 'unknown')
-            print(f"  - {r['company']}: {reason}")
+    print_pipeline_summary(tracking_results)
 
     print(f"\nCompleted at: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Total duration: {duration:.1f} seconds ({duration/60:.1f} minutes)")
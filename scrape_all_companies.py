@@ -7,36 +7,34 @@ Master script that scrapes job postings from multiple companies.
 
 import argparse
 import json
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
+from urllib.parse import urlparse
 
-from scrapers.veeva_scraper import VeevaScraper
-from scrapers.workday_scraper import WorkdayScraper
-from scrapers.greenhouse_scraper import GreenhouseScraper
-from scrapers.lever_scraper import LeverScraper
-from scrapers.procore_scraper import ProcoreScraper
-from scrapers.appfolio_scraper import AppFolioScraper
-from scrapers.certara_scraper import CertaraScraper
-from scrapers.kinaxis_scraper import KinaxisScraper
-from scrapers.servicetitan_scraper import ServiceTitanScraper
-from scrapers.dayforce_scraper import DayforceScraper
-from scrapers.toast_scraper import ToastScraper
-from scrapers.generic_scraper import GenericScraper
-from scrapers.ashby_scraper import AshbyScraper
-from scrapers.gem_scraper import GemScraper
-from scrapers.successfactors_scraper import SuccessFactorsScraper
-from scrapers.tyler_scraper import TylerScraper
-from scrapers.simulationsplus_scraper import SimulationsPlusScraper
-from scrapers.dassault_scraper import DassaultScraper
-from scrapers.yardi_scraper import YardiScraper
-from scrapers.teamtailor_scraper import TeamtailorScraper
-from scrapers.ultipro_scraper import UltiProScraper
-from scrapers.workable_scraper import WorkableScraper
-from scrapers.oracle_hcm_scraper import OracleHCMScraper
-from scrapers.adp_scraper import ADPScraper
-from scrapers.static_html_scraper import StaticHTMLScraper
+from scrapers import registry
+from scrapers.checkpoint import RunCheckpoint
+from scrapers.http_session import configure_session, close_session
+from scrapers.retry import open_circuits
+from scrapers.run_history import (load_run_history, save_run_history, history_path, estimate_duration,
+                                  order_longest_first, predict_makespan)
+from scrapers.rate_limiter import (configure_rate_limiter, save_learned_rates, rates_path,
+                                   DEFAULT_RATE, MAX_RATE)
+
+
+# Shared API hosts for platforms whose configured URL is the company's own site
+PLATFORM_API_HOSTS = {
+    'greenhouse_scraper': 'boards-api.greenhouse.io',
+    'lever_scraper': 'api.lever.co',
+    'ashby_scraper': 'api.ashbyhq.com',
+    'workable_scraper': 'apply.workable.com',
+}
+
+# Failed requests listed per company in the summary report
+MAX_RECORDED_ERRORS = 10
 
 
 def load_companies_config(config_file='companies_config.json', fund=None):
@@ -62,64 +60,39 @@ def get_scraper_class(scraper_name):
     """
     Get the appropriate scraper class based on name.
 
+    The scraper's module is imported on first use (see scrapers/registry.py).
+
     Args:
         scraper_name (str): Name of the scraper
 
     Returns:
         class: Scraper class
     """
-    scrapers = {
-        'veeva_scraper': VeevaScraper,
-        'workday_scraper': WorkdayScraper,
-        'greenhouse_scraper': GreenhouseScraper,
-        'lever_scraper': LeverScraper,
-        'procore_scraper': ProcoreScraper,
-        'appfolio_scraper': AppFolioScraper,
-        'certara_scraper': CertaraScraper,
-        'kinaxis_scraper': KinaxisScraper,
-        'servicetitan_scraper': ServiceTitanScraper,
-        'dayforce_scraper': DayforceScraper,
-        'toast_scraper': ToastScraper,
-        'generic_scraper': GenericScraper,
-        'ashby_scraper': AshbyScraper,
-        'gem_scraper': GemScraper,
-        'successfactors_scraper': SuccessFactorsScraper,
-        'tyler_scraper': TylerScraper,
-        'simulationsplus_scraper': SimulationsPlusScraper,
-        'dassault_scraper': DassaultScraper,
-        'yardi_scraper': YardiScraper,
-        'teamtailor_scraper': TeamtailorScraper,
-        'ultipro_scraper': UltiProScraper,
-        'workable_scraper': WorkableScraper,
-        'oracle_hcm_scraper': OracleHCMScraper,
-        'adp_scraper': ADPScraper,
-        'static_html_scraper': StaticHTMLScraper,
-    }
-    return scrapers.get(scraper_name, GenericScraper)
+    return registry.get_scraper_class(scraper_name)
 
 
-def scrape_company(company_config, delay=2):
+def scrape_company(company_config):
     """
     Scrape jobs for a single company.
 
+    Requests are paced by the per-host rate limiter (scrapers/rate_limiter.py),
+    so there is no fixed delay between companies.
+
     Args:
         company_config (dict): Company configuration
-        delay (int): Delay in seconds between requests
 
     Returns:
-        dict: Results dictionary with jobs and metadata
+        dict: Results dictionary with jobs and metadata (including the
+            wall-clock 'duration' in seconds, kept in the run history)
     """
     name = company_config['name']
     slug = company_config['slug']
+    start = time.monotonic()
 
     print(f"\n{'='*60}")
     print(f"Scraping: {name}")
     print(f"{'='*60}")
 
-    # Add delay to be respectful to servers
-    if delay > 0:
-        time.sleep(delay)
-
     try:
         # Get appropriate scraper
         scraper_class = get_scraper_class(company_config['scraper'])
@@ -133,7 +106,7 @@ def scrape_company(company_config, delay=2):
             csv_path = scraper.save_to_csv(jobs)
             print(f"[OK] Saved {len(jobs)} jobs to {csv_path}")
 
-            return {
+            result = {
                 'success': True,
                 'company': name,
                 'slug': slug,
@@ -142,7 +115,7 @@ def scrape_company(company_config, delay=2):
             }
         else:
             print(f"[WARN] No jobs found for {name}")
-            return {
+            result = {
                 'success': False,
                 'company': name,
                 'slug': slug,
@@ -150,18 +123,199 @@ def scrape_company(company_config, delay=2):
                 'csv_path': None,
                 'error': 'No jobs found'
             }
+            if scraper.request_errors:
+                result['error'] = f"No jobs found ({scraper.request_errors[-1]['error']})"
+
+        # Requests that failed even after retrying: jobs found alongside them may be incomplete
+        # (requests an open circuit breaker rejected without sending are counted apart)
+        if scraper.request_errors:
+            rejected = sum(1 for e in scraper.request_errors if e.get('cause') == 'circuit_open')
+            result['failed_requests'] = len(scraper.request_errors) - rejected
+            result['rejected_requests'] = rejected
+            result['request_errors'] = scraper.request_errors[:MAX_RECORDED_ERRORS]
+            if jobs:
+                result['partial'] = True
+                print(f"[WARN] {result['failed_requests']} requests failed, {rejected} rejected by an "
+                      f"open circuit breaker, results may be partial")
+
+        # Headless scrapers report page load timings (e.g. to compare resource blocking)
+        if getattr(scraper, 'page_load_times', None):
+            result['page_loads'] = scraper.get_page_load_stats()
 
     except Exception as e:
         print(f"[ERROR] Error scraping {name}: {e}")
-        return {
+        result = {
             'success': False,
             'company': name,
             'slug': slug,
             'job_count': 0,
             'csv_path': None,
-            'error': str(e)
+            'error': str(e),
+            'error_type': type(e).__name__
         }
 
+    result['duration'] = round(time.monotonic() - start, 1)
+    return result
+
+
+def skipped_result(company_config, reason):
+    """
+    Build the result for a company that was not scraped.
+
+    Args:
+        company_config (dict): Company configuration
+        reason (str): Why the company was skipped
+
+    Returns:
+        dict: Results dictionary marked as skipped
+    """
+    print(f"[SKIP] {company_config['name']}: {reason}")
+    return {
+        'success': False,
+        'company': company_config['name'],
+        'slug': company_config['slug'],
+        'job_count': 0,
+        'csv_path': None,
+        'error': f"Skipped: {reason}",
+        'skipped': True
+    }
+
+
+def fits_deadline(estimate, deadline):
+    """
+    Check whether a company is expected to finish before the run deadline.
+
+    Args:
+        estimate (float): Estimated seconds for the company
+        deadline (float or None): time.monotonic() value of the deadline
+
+    Returns:
+        bool: True if there is no deadline or the company should finish in time
+    """
+    return deadline is None or time.monotonic() + estimate <= deadline
+
+
+def get_company_host(company_config):
+    """
+    Get the host key used to group companies for per-host concurrency limits.
+
+    Tenant subdomains of shared platforms (e.g. *.myworkdayjobs.com) are
+    grouped under their parent domain so they share a single limit.
+
+    Args:
+        company_config (dict): Company configuration
+
+    Returns:
+        str: Host key (e.g. 'myworkdayjobs.com', 'greenhouse.io')
+    """
+    host = PLATFORM_API_HOSTS.get(company_config.get('scraper'))
+    if not host:
+        url = company_config.get('api_base') or company_config.get('url', '')
+        host = urlparse(url).netloc.lower().split(':')[0]
+
+    parts = host.split('.')
+    return '.'.join(parts[-2:]) if len(parts) > 2 else host
+
+
+def uses_browser(company_config):
+    """
+    Check whether a company is scraped with a headless browser.
+
+    Args:
+        company_config (dict): Company configuration
+
+    Returns:
+        bool: True if the company's scraper launches Chrome
+    """
+    scraper_class = get_scraper_class(company_config['scraper'])
+
+    # If the headless module was never imported, no loaded scraper can be a subclass
+    headless = sys.modules.get('scrapers.headless_scraper')
+    return headless is not None and issubclass(scraper_class, headless.HeadlessScraper)
+
+
+def scrape_companies_concurrently(companies, workers=8, per_host=2, max_browsers=2,
+                                  estimates=None, deadline=None, on_result=None):
+    """
+    Scrape companies in parallel with global, per-host and browser limits.
+
+    A company is only dispatched when its host has a free slot, so workers
+    never sit blocked behind a busy host while other hosts are idle. Once
+    the deadline is near, companies that are not expected to finish in time
+    are skipped instead of dispatched.
+
+    Args:
+        companies (list): Company configurations, in the order to dispatch them
+        workers (int): Maximum number of companies scraped at once
+        per_host (int): Maximum concurrent companies per host key
+        max_browsers (int): Maximum concurrent headless browser scrapes
+        estimates (dict): Slug -> estimated seconds (needed with a deadline)
+        deadline (float): time.monotonic() value after which no company should run
+        on_result (callable): Called with each result as soon as it is known
+            (from the dispatching thread)
+
+    Returns:
+        list: Results dictionaries, in the same order as companies
+    """
+    workers, per_host, max_browsers = max(1, workers), max(1, per_host), max(1, max_browsers)
+    total = len(companies)
+    results = [None] * total
+    pending = list(enumerate(companies))
+    hosts = {i: get_company_host(c) for i, c in pending}
+    browsers = {i: uses_browser(c) for i, c in pending}
+    host_in_flight = defaultdict(int)
+    browsers_in_flight = 0
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while pending or running:
+            # Dispatch every pending company whose host and browser budget allow it
+            for item in list(pending):
+                if len(running) >= workers:
+                    break
+                i, company = item
+                if host_in_flight[hosts[i]] >= per_host:
+                    continue
+                if browsers[i] and browsers_in_flight >= max_browsers:
+                    continue
+
+                pending.remove(item)
+                if estimates and not fits_deadline(estimates[company['slug']], deadline):
+                    results[i] = skipped_result(company, "would not finish before the deadline")
+                    if on_result:
+                        on_result(results[i])
+                    continue
+
+                host_in_flight[hosts[i]] += 1
+                if browsers[i]:
+                    browsers_in_flight += 1
+                print(f"\n[{total - len(pending)}/{total}] Dispatching {company['name']} ({hosts[i]})")
+                future = executor.submit(scrape_company, company)
+                running[future] = i
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                host_in_flight[hosts[i]] -= 1
+                if browsers[i]:
+                    browsers_in_flight -= 1
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    company = companies[i]
+                    results[i] = {
+                        'success': False,
+                        'company': company['name'],
+                        'slug': company['slug'],
+                        'job_count': 0,
+                        'csv_path': None,
+                        'error': str(e)
+                    }
+                if on_result:
+                    on_result(results[i])
+
+    return results
+
 
 def print_summary(results):
     """
@@ -176,10 +330,19 @@ def print_summary(results):
 
     successful = [r for r in results if r['success']]
     failed = [r for r in results if not r['success']]
+    partial = [r for r in successful if r.get('partial')]
+    skipped = [r for r in failed if r.get('skipped')]
+    resumed = [r for r in successful if r.get('from_checkpoint')]
 
     print(f"\nTotal companies: {len(results)}")
     print(f"Successful: {len(successful)}")
+    if partial:
+        print(f"  (partial: {len(partial)})")
+    if resumed:
+        print(f"  (from earlier today's checkpoint: {len(resumed)})")
     print(f"Failed: {len(failed)}")
+    if skipped:
+        print(f"  (skipped to meet the deadline: {len(skipped)})")
 
     if successful:
         total_jobs = sum(r['job_count'] for r in successful)
@@ -191,6 +354,15 @@ def print_summary(results):
         for i, result in enumerate(sorted_results[:10], 1):
             print(f"{i:2d}. {result['company']}: {result['job_count']} jobs")
 
+    if partial:
+        print("\nPartial results (some requests failed after retries):")
+        print("-" * 60)
+        for result in partial:
+            rejected = result.get('rejected_requests', 0)
+            print(f"  [~] {result['company']}: {result['job_count']} jobs, "
+                  f"{result['failed_requests']} failed requests"
+                  + (f", {rejected} rejected by open circuit breaker" if rejected else ""))
+
     if failed:
         print(f"\nFailed companies:")
         print("-" * 60)
@@ -219,7 +391,11 @@ def save_summary_report(results, fund=None):
         'total_companies': len(results),
         'successful': len([r for r in results if r['success']]),
         'failed': len([r for r in results if not r['success']]),
+        'partial': len([r for r in results if r.get('partial')]),
+        'skipped': len([r for r in results if r.get('skipped')]),
+        'resumed': len([r for r in results if r.get('from_checkpoint')]),
         'total_jobs': sum(r['job_count'] for r in results if r['success']),
+        'open_circuits': open_circuits(),
         'results': results
     }
 
@@ -236,9 +412,30 @@ def main():
                         help='Filter companies by fund (partners or scf)')
     parser.add_argument('--company', type=str,
                         help='Scrape a single company by slug')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of companies to scrape concurrently (default: 1, sequential)')
+    parser.add_argument('--per-host', type=int, default=2,
+                        help='Maximum concurrent companies per host, e.g. *.myworkdayjobs.com (default: 2)')
+    parser.add_argument('--max-browsers', type=int, default=2,
+                        help='Maximum concurrent headless browser scrapes (default: 2)')
+    parser.add_argument('--browser-max-uses', type=int, default=10,
+                        help='Companies served by a pooled browser before it is recycled (default: 10)')
+    parser.add_argument('--no-browser-pool', action='store_true',
+                        help='Start a fresh Chrome for every headless company')
+    parser.add_argument('--host-rate', type=float, default=DEFAULT_RATE,
+                        help=f'Starting requests/second for hosts with no learned rate (default: {DEFAULT_RATE})')
+    parser.add_argument('--max-host-rate', type=float, default=MAX_RATE,
+                        help=f'Highest requests/second a host can ramp up to (default: {MAX_RATE})')
+    parser.add_argument('--deadline', type=float,
+                        help='Seconds the run may take; companies not expected to finish in time are skipped')
+    parser.add_argument('--resume', action='store_true',
+                        help="Keep companies already scraped successfully today and scrape only the rest")
+    parser.add_argument('--discover-api', action='store_true',
+                        help='Record headless network traffic and write companies/<slug>/api_suggestion.json')
     args = parser.parse_args()
 
     start_time = datetime.now()
+    deadline = time.monotonic() + args.deadline if args.deadline else None
 
     fund_label = f" [{args.fund.upper()} Fund]" if args.fund else ""
     print("="*60)
@@ -266,15 +463,103 @@ def main():
             print(f"Error: Company '{args.company}' not found or not enabled")
             return
 
+    # API discovery mode (same as "discover_api": true in the config)
+    if args.discover_api:
+        enabled_companies = [{**c, 'discover_api': True} for c in enabled_companies]
+        print("API discovery enabled for headless scrapers")
+
     print(f"\nFound {len(enabled_companies)} enabled companies")
+
+    # Every finished company is checkpointed; --resume keeps today's successes
+    checkpoint = RunCheckpoint(start_time.strftime('%Y-%m-%d'), fund=args.fund)
+    resumed = []
+    if args.resume:
+        enabled_slugs = {c['slug'] for c in enabled_companies}
+        resumed = [r for r in checkpoint.completed_results() if r['slug'] in enabled_slugs]
+        done = {r['slug'] for r in resumed}
+        enabled_companies = [c for c in enabled_companies if c['slug'] not in done]
+        print(f"Resuming from {checkpoint.path}: {len(resumed)} companies already done, "
+              f"{len(enabled_companies)} to scrape")
+
     print("Starting scraping process...\n")
 
-    # Scrape each company
-    results = []
-    for i, company in enumerate(enabled_companies, 1):
-        print(f"\n[{i}/{len(enabled_companies)}]", end=" ")
-        result = scrape_company(company, delay=2)
-        results.append(result)
+    # Pooled browsers, connections and learned rates are released even if the
+    # run is interrupted (an exception or Ctrl-C would otherwise leak Chrome processes)
+    rate_limiter = None
+    use_browser_pool = False
+    try:
+        # Size the shared connection pools for the number of concurrent scrapes
+        configure_session(
+            pool_connections=max(50, len(enabled_companies)),
+            pool_maxsize=max(10, args.workers * 2)
+        )
+
+        # Pace requests per host, starting from the rates learned on previous runs
+        rates_file = rates_path(args.fund)
+        rate_limiter = configure_rate_limiter(default_rate=args.host_rate, max_rate=args.max_host_rate,
+                                              state_file=rates_file)
+
+        # Reuse headless Chrome instances across companies (Selenium is only
+        # imported when a headless company is actually being scraped)
+        use_browser_pool = not args.no_browser_pool and any(uses_browser(c) for c in enabled_companies)
+        if use_browser_pool:
+            from scrapers.browser_pool import configure_browser_pool
+            configure_browser_pool(size=args.max_browsers, max_uses=args.browser_max_uses)
+
+        # Schedule longest-first from previous runs' durations, so slow sites start early
+        history_file = history_path(args.fund)
+        history = load_run_history(history_file)
+        estimates = {c['slug']: estimate_duration(history, c['slug'], uses_browser(c))
+                     for c in enabled_companies}
+        scheduled = order_longest_first(enabled_companies, estimates)
+        makespan = predict_makespan(estimates.values(), args.workers)
+        print(f"Predicted duration: {makespan:.0f} seconds ({makespan/60:.1f} minutes)"
+              + (f", deadline {args.deadline:.0f} seconds" if deadline else ""))
+
+        # Scrape each company
+        if args.workers > 1:
+            print(f"Concurrent mode: {args.workers} workers, {args.per_host} per host, "
+                  f"{args.max_browsers} browsers")
+            results = scrape_companies_concurrently(
+                scheduled,
+                workers=args.workers,
+                per_host=args.per_host,
+                max_browsers=args.max_browsers,
+                estimates=estimates,
+                deadline=deadline,
+                on_result=checkpoint.record
+            )
+        else:
+            results = []
+            for i, company in enumerate(scheduled, 1):
+                print(f"\n[{i}/{len(scheduled)}]", end=" ")
+                if not fits_deadline(estimates[company['slug']], deadline):
+                    results.append(skipped_result(company, "would not finish before the deadline"))
+                    checkpoint.record(results[-1])
+                    continue
+                result = scrape_company(company)
+                checkpoint.record(result)
+                results.append(result)
+    finally:
+        close_session()
+        if rate_limiter is not None:
+            try:
+                save_learned_rates(rate_limiter, rates_file)
+            except OSError as e:
+                print(f"Warning: could not save learned host rates: {e}")
+        if use_browser_pool:
+            from scrapers.browser_pool import shutdown_browser_pool
+            shutdown_browser_pool()
+
+    try:
+        save_run_history(history, results, history_file)
+    except OSError as e:
+        print(f"Warning: could not save run history: {e}")
+
+    # Report in config order, including companies finished before resuming
+    results += resumed
+    config_order = {c['slug']: i for i, c in enumerate(companies)}
+    results.sort(key=lambda r: config_order[r['slug']])
 
     # Print summary
     print_summary(results)
@@ -1,30 +1,49 @@
-"""Scrapers package for multi-company job scraping."""
+"""Scrapers package for multi-company job scraping.
+
+Scraper classes are imported lazily on first attribute access, so importing
+the package does not pull in Selenium or BeautifulSoup. Use
+scrapers.registry.get_scraper_class() to look scrapers up by config name.
+"""
+
+import importlib
 
 from scrapers.base_scraper import BaseScraper
-from scrapers.veeva_scraper import VeevaScraper
-from scrapers.workday_scraper import WorkdayScraper
-from scrapers.greenhouse_scraper import GreenhouseScraper
-from scrapers.lever_scraper import LeverScraper
-from scrapers.headless_scraper import HeadlessScraper
-from scrapers.procore_scraper import ProcoreScraper
-from scrapers.appfolio_scraper import AppFolioScraper
-from scrapers.certara_scraper import CertaraScraper
-from scrapers.kinaxis_scraper import KinaxisScraper
-from scrapers.generic_scraper import GenericScraper
-from scrapers.toast_scraper import ToastScraper
-from scrapers.ashby_scraper import AshbyScraper
-from scrapers.gem_scraper import GemScraper
-from scrapers.successfactors_scraper import SuccessFactorsScraper
-from scrapers.tyler_scraper import TylerScraper
-from scrapers.simulationsplus_scraper import SimulationsPlusScraper
-from scrapers.dassault_scraper import DassaultScraper
-from scrapers.yardi_scraper import YardiScraper
-from scrapers.teamtailor_scraper import TeamtailorScraper
-from scrapers.ultipro_scraper import UltiProScraper
-from scrapers.workable_scraper import WorkableScraper
-from scrapers.oracle_hcm_scraper import OracleHCMScraper
-from scrapers.adp_scraper import ADPScraper
-from scrapers.static_html_scraper import StaticHTMLScraper
+
+# Class name -> module, for lazy attribute access
+_LAZY_CLASSES = {
+    'VeevaScraper': 'scrapers.veeva_scraper',
+    'WorkdayScraper': 'scrapers.workday_scraper',
+    'GreenhouseScraper': 'scrapers.greenhouse_scraper',
+    'LeverScraper': 'scrapers.lever_scraper',
+    'HeadlessScraper': 'scrapers.headless_scraper',
+    'ProcoreScraper': 'scrapers.procore_scraper',
+    'AppFolioScraper': 'scrapers.appfolio_scraper',
+    'CertaraScraper': 'scrapers.certara_scraper',
+    'KinaxisScraper': 'scrapers.kinaxis_scraper',
+    'GenericScraper': 'scrapers.generic_scraper',
+    'ToastScraper': 'scrapers.toast_scraper',
+    'AshbyScraper': 'scrapers.ashby_scraper',
+    'GemScraper': 'scrapers.gem_scraper',
+    'SuccessFactorsScraper': 'scrapers.successfactors_scraper',
+    'TylerScraper': 'scrapers.tyler_scraper',
+    'SimulationsPlusScraper': 'scrapers.simulationsplus_scraper',
+    'DassaultScraper': 'scrapers.dassault_scraper',
+    'YardiScraper': 'scrapers.yardi_scraper',
+    'TeamtailorScraper': 'scrapers.teamtailor_scraper',
+    'UltiProScraper': 'scrapers.ultipro_scraper',
+    'WorkableScraper': 'scrapers.workable_scraper',
+    'OracleHCMScraper': 'scrapers.oracle_hcm_scraper',
+    'ADPScraper': 'scrapers.adp_scraper',
+    'StaticHTMLScraper': 'scrapers.static_html_scraper',
+}
+
+
+def __getattr__(name):
+    """Import scraper classes on first access."""
+    if name in _LAZY_CLASSES:
+        return getattr(importlib.import_module(_LAZY_CLASSES[name]), name)
+    raise AttributeError(f"module 'scrapers' has no attribute '{name}'")
+
 
 __all__ = [
     'BaseScraper',
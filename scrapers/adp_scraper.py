@@ -7,12 +7,16 @@ ADP is a heavy JavaScript SPA that requires a headless browser.
 
 from selenium.webdriver.common.by import By
 from scrapers.headless_scraper import HeadlessScraper
-import time
+
+
+JOB_CARD_SELECTOR = '[class*="job"], [class*="posting"], [class*="requisition"], a[href*="job"]'
 
 
 class ADPScraper(HeadlessScraper):
     """Scraper for ADP Workforce Now career sites."""
 
+    readiness = {'condition': 'network_idle', 'quiet': 1.5, 'timeout': 20}
+
     def _scrape_jobs(self):
         """
         Scrape jobs from ADP Workforce Now using headless browser.
@@ -22,16 +26,14 @@ class ADPScraper(HeadlessScraper):
         """
         self.log("Starting ADP scrape...")
 
-        self.driver.get(self.url)
+        # ADP is a heavy SPA - wait for its API calls to settle
+        self.load_page(self.url)
         self.log(f"Loaded page: {self.url}")
 
-        # ADP is a heavy SPA - give it time to render
-        time.sleep(10)
-
         # Wait for job listings to appear
         job_cards = self.wait_for_elements(
             By.CSS_SELECTOR,
-            '[class*="job"], [class*="posting"], [class*="requisition"], a[href*="job"]',
+            JOB_CARD_SELECTOR,
             timeout=20
         )
 
@@ -39,10 +41,10 @@ class ADPScraper(HeadlessScraper):
             self.log("No job cards found on page", "WARNING")
             # Try scrolling to trigger lazy loading
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(5)
+            self.wait_until_ready(timeout=5)
             job_cards = self.wait_for_elements(
                 By.CSS_SELECTOR,
-                '[class*="job"], [class*="posting"], [class*="requisition"], a[href*="job"]',
+                JOB_CARD_SELECTOR,
                 timeout=10
             )
 
@@ -52,50 +54,35 @@ class ADPScraper(HeadlessScraper):
 
         self.log(f"Found {len(job_cards)} job card elements")
 
+        # Read every card in one round trip
+        cards = self.extract_rows(JOB_CARD_SELECTOR, {
+            'tag': {'attr': 'tag'},
+            'text': {},
+            'title': {'selector': ['h2', 'h3', 'h4', '[class*="title"]', '[class*="name"]']},
+            'location': {'selector': ['[class*="location"]', '[class*="city"]']},
+            'href': {'attr': 'href'},
+            'link_href': {'selector': 'a', 'attr': 'href'},
+        })
+
         jobs = []
         seen_titles = set()
 
-        for card in job_cards:
+        for card in cards:
             try:
                 # Extract title
-                title = ''
-                for selector in ['h2', 'h3', 'h4', '[class*="title"]', '[class*="name"]']:
-                    try:
-                        el = card.find_element(By.CSS_SELECTOR, selector)
-                        title = el.text.strip()
-                        if title:
-                            break
-                    except Exception:
-                        continue
-
+                title = card['title'] or ''
                 if not title:
-                    title = card.text.strip().split('\n')[0]
+                    title = (card['text'] or '').split('\n')[0]
 
                 if not title or title in seen_titles:
                     continue
                 seen_titles.add(title)
 
                 # Extract location
-                location = 'Not specified'
-                for selector in ['[class*="location"]', '[class*="city"]']:
-                    try:
-                        el = card.find_element(By.CSS_SELECTOR, selector)
-                        location = el.text.strip()
-                        if location:
-                            break
-                    except Exception:
-                        continue
+                location = card['location'] or 'Not specified'
 
                 # Extract URL
-                job_url = ''
-                try:
-                    if card.tag_name == 'a':
-                        job_url = card.get_attribute('href')
-                    else:
-                        link = card.find_element(By.TAG_NAME, 'a')
-                        job_url = link.get_attribute('href')
-                except Exception:
-                    pass
+                job_url = card['href'] if card['tag'] == 'a' else card['link_href']
 
                 remote = 'Yes' if 'remote' in location.lower() or 'remote' in title.lower() else 'No'
 
@@ -0,0 +1,305 @@
+"""
+API Discovery
+
+Diagnostic mode for headless scrapers. Captures Chrome's network log while a
+page is scraped, finds JSON responses that contain job-like arrays and writes
+a suggested direct-API config, so companies can be moved from Chrome to
+plain HTTP requests.
+"""
+
+import json
+from datetime import datetime
+from urllib.parse import urlparse, parse_qsl
+
+
+# Keys that suggest an object is a job posting
+TITLE_KEYS = {'title', 'jobtitle', 'job_title', 'name', 'position', 'positiontitle', 'postingtitle', 'text'}
+JOB_KEYS = {
+    'location', 'locations', 'city', 'department', 'departments', 'team', 'category',
+    'url', 'joburl', 'applyurl', 'absolute_url', 'hostedurl', 'externalpath',
+    'id', 'jobid', 'job_id', 'requisitionid', 'reqid', 'postedon', 'posteddate',
+    'posted_date', 'createdat', 'updated_at', 'remote', 'worktype', 'employmenttype',
+}
+
+# Request parameters and response fields used for pagination
+OFFSET_PARAMS = ['offset', 'start', 'from', 'skip', 'startindex', 'startrow']
+PAGE_PARAMS = ['page', 'pagenumber', 'page_number', 'pageno', 'pg', 'pageindex']
+LIMIT_PARAMS = ['limit', 'size', 'pagesize', 'page_size', 'per_page', 'perpage', 'rows', 'count', 'num']
+TOTAL_FIELDS = ['total', 'totalcount', 'total_count', 'totalhits', 'totalresults', 'totaljobs',
+                'totalsize', 'total_results', 'recordsfiltered', 'hits']
+CURSOR_FIELDS = ['next', 'nextpage', 'next_page', 'nextcursor', 'cursor', 'nextpagetoken', 'continuation']
+
+# Response bodies larger than this are skipped
+MAX_BODY_BYTES = 5 * 1024 * 1024
+
+
+def _lower_keys(item):
+    """Map lowercased keys to original keys for a dict."""
+    return {key.lower(): key for key in item if isinstance(key, str)}
+
+
+def score_job_array(items):
+    """
+    Score how much a list looks like a list of job postings.
+
+    Args:
+        items (list): Candidate list from a JSON response
+
+    Returns:
+        float: 0 if it does not look like jobs, higher for more job-like lists
+    """
+    dicts = [item for item in items[:20] if isinstance(item, dict)]
+    if len(dicts) < 2 or len(dicts) < len(items[:20]) / 2:
+        return 0
+
+    with_title = 0
+    job_key_hits = 0
+    for item in dicts:
+        keys = set(_lower_keys(item))
+        if keys & TITLE_KEYS:
+            with_title += 1
+        job_key_hits += len(keys & JOB_KEYS)
+
+    if with_title < len(dicts) / 2:
+        return 0
+
+    return len(items) * (1 + job_key_hits / len(dicts))
+
+
+def find_job_arrays(data, path=''):
+    """
+    Find job-like arrays anywhere inside a decoded JSON document.
+
+    Args:
+        data: Decoded JSON
+        path (str): Dotted path of data inside the document
+
+    Returns:
+        list: Candidates as dicts with path, count, score and sample keys
+    """
+    candidates = []
+
+    if isinstance(data, list):
+        score = score_job_array(data)
+        if score:
+            keys = sorted({key for item in data[:20] if isinstance(item, dict) for key in item})
+            candidates.append({'path': path, 'count': len(data), 'score': score, 'keys': keys})
+        for item in data[:3]:
+            candidates.extend(find_job_arrays(item, f"{path}[]" if path else '[]'))
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            if isinstance(value, (dict, list)):
+                candidates.extend(find_job_arrays(value, f"{path}.{key}" if path else key))
+
+    return candidates
+
+
+def guess_field_map(keys):
+    """
+    Guess which response fields map to our job columns.
+
+    Args:
+        keys (list): Keys of the job objects
+
+    Returns:
+        dict: Job column -> response key
+    """
+    lowered = {key.lower(): key for key in keys}
+    wanted = {
+        'title': ['title', 'jobtitle', 'job_title', 'postingtitle', 'positiontitle', 'name', 'text'],
+        'location': ['location', 'locationstext', 'locations', 'city', 'joblocation'],
+        'department': ['department', 'departments', 'team', 'category', 'jobfamily'],
+        'posting_date': ['postedon', 'posteddate', 'posted_date', 'createdat', 'created_at', 'publishedat'],
+        'url': ['url', 'absolute_url', 'hostedurl', 'applyurl', 'joburl', 'externalpath'],
+    }
+
+    field_map = {}
+    for column, options in wanted.items():
+        for option in options:
+            if option in lowered:
+                field_map[column] = lowered[option]
+                break
+    return field_map
+
+
+def find_field(data, names):
+    """Find the first top-level key in data matching one of names (case-insensitive)."""
+    if not isinstance(data, dict):
+        return None
+    lowered = _lower_keys(data)
+    for name in names:
+        if name in lowered:
+            return lowered[name]
+    return None
+
+
+def detect_pagination(url, payload, data):
+    """
+    Work out how a JSON endpoint is paginated.
+
+    Args:
+        url (str): Request URL
+        payload (dict or None): Decoded JSON request body
+        data: Decoded JSON response
+
+    Returns:
+        dict: Pagination settings (style, param names, where they are sent,
+            total/cursor fields) - style is 'none' if nothing was found
+    """
+    params = dict(parse_qsl(urlparse(url).query))
+    pagination = {'style': 'none'}
+
+    for location, source in (('query', params), ('body', payload if isinstance(payload, dict) else {})):
+        lowered = _lower_keys(source)
+        offset_param = next((lowered[p] for p in OFFSET_PARAMS if p in lowered), None)
+        page_param = next((lowered[p] for p in PAGE_PARAMS if p in lowered), None)
+        limit_param = next((lowered[p] for p in LIMIT_PARAMS if p in lowered), None)
+
+        if offset_param or page_param:
+            pagination = {
+                'style': 'offset' if offset_param else 'page',
+                'param': offset_param or page_param,
+                'in': location,
+            }
+            if limit_param:
+                pagination['limit_param'] = limit_param
+                pagination['page_size'] = source[limit_param]
+            break
+
+    total_field = find_field(data, TOTAL_FIELDS)
+    if total_field:
+        pagination['total_field'] = total_field
+
+    cursor_field = find_field(data, CURSOR_FIELDS)
+    if cursor_field and pagination['style'] == 'none':
+        pagination = {'style': 'cursor', 'cursor_field': cursor_field}
+
+    return pagination
+
+
+class NetworkRecorder:
+    """Collects JSON responses from Chrome's performance log."""
+
+    def __init__(self):
+        """Initialize an empty recorder."""
+        self.requests = {}   # request id -> request info
+        self.responses = []  # captured JSON responses
+
+    def capture(self, driver):
+        """
+        Read new performance log entries and fetch JSON response bodies.
+
+        Must be called before the page navigates away, while Chrome still
+        holds the bodies.
+
+        Args:
+            driver (WebDriver): Chrome driver started with performance logging
+        """
+        pending = []
+
+        for entry in driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+
+            method = message.get('method')
+            params = message.get('params', {})
+
+            if method == 'Network.requestWillBeSent':
+                request = params.get('request', {})
+                self.requests[params.get('requestId')] = {
+                    'url': request.get('url'),
+                    'method': request.get('method', 'GET'),
+                    'post_data': request.get('postData'),
+                    'headers': request.get('headers', {}),
+                    'type': params.get('type'),
+                }
+            elif method == 'Network.responseReceived':
+                response = params.get('response', {})
+                if 'json' in (response.get('mimeType') or '') and response.get('status') == 200:
+                    pending.append(params.get('requestId'))
+
+        for request_id in pending:
+            request = self.requests.get(request_id)
+            if not request:
+                continue
+            try:
+                body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            except Exception:
+                continue  # Body no longer available (page navigated away)
+
+            text = body.get('body') or ''
+            if body.get('base64Encoded') or len(text) > MAX_BODY_BYTES:
+                continue
+            try:
+                data = json.loads(text)
+            except ValueError:
+                continue
+
+            self.responses.append({**request, 'data': data})
+
+    def suggest(self, company_config):
+        """
+        Build a suggested direct-API config from the captured responses.
+
+        Args:
+            company_config (dict): Company configuration
+
+        Returns:
+            dict: Suggestion with the best endpoint and all ranked candidates
+        """
+        candidates = []
+
+        for response in self.responses:
+            payload = None
+            if response['post_data']:
+                try:
+                    payload = json.loads(response['post_data'])
+                except ValueError:
+                    payload = response['post_data']
+
+            for array in find_job_arrays(response['data']):
+                content_type = next((v for k, v in response['headers'].items()
+                                     if k.lower() == 'content-type'), None)
+                candidates.append({
+                    'api_url': response['url'],
+                    'method': response['method'],
+                    'payload': payload,
+                    'content_type': content_type,
+                    'jobs_path': array['path'],
+                    'jobs_on_page': array['count'],
+                    'field_map': guess_field_map(array['keys']),
+                    'sample_keys': array['keys'],
+                    'pagination': detect_pagination(response['url'], payload, response['data']),
+                    'score': round(array['score'], 1),
+                })
+
+        candidates.sort(key=lambda c: c['score'], reverse=True)
+
+        return {
+            'company': company_config['name'],
+            'slug': company_config['slug'],
+            'page_url': company_config['url'],
+            'generated_at': datetime.now().isoformat(),
+            'json_responses_captured': len(self.responses),
+            'suggestion': candidates[0] if candidates else None,
+            'candidates': candidates[:10],
+        }
+
+
+def write_suggestion(suggestion, output_dir):
+    """
+    Write an API suggestion next to the company's job files.
+
+    Args:
+        suggestion (dict): Result of NetworkRecorder.suggest()
+        output_dir (Path): Company output directory
+
+    Returns:
+        str: Path to the written file
+    """
+    filepath = output_dir / 'api_suggestion.json'
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(suggestion, f, indent=2, default=str)
+    return str(filepath)
@@ -7,7 +7,6 @@ Jobs are loaded via a Jobvite iframe embedded in the page.
 
 from selenium.webdriver.common.by import By
 from scrapers.headless_scraper import HeadlessScraper
-import time
 
 
 class AppFolioScraper(HeadlessScraper):
@@ -25,11 +24,10 @@ class AppFolioScraper(HeadlessScraper):
 
         # Use the jobs page URL
         url = "https://www.appfolio.com/open-roles?p=jobs"
-        self.driver.get(url)
-        self.log(f"Loaded page: {url}")
 
         # Wait for page and iframe to load
-        time.sleep(5)
+        self.load_page(url)
+        self.log(f"Loaded page: {url}")
 
         # Find and switch to the Jobvite iframe
         self.log("Looking for Jobvite iframe...")
@@ -50,21 +48,23 @@ class AppFolioScraper(HeadlessScraper):
         # Switch to the iframe
         self.driver.switch_to.frame(jobvite_iframe)
         self.log("Switched to Jobvite iframe")
-        time.sleep(3)
+        self.wait_until_ready(timeout=10)
 
         # Wait for job listings inside iframe
         self.log("Waiting for job listings to load...")
+        job_selector = '.jv-job-list-name'
         job_elements = self.wait_for_elements(
             By.CSS_SELECTOR,
-            '.jv-job-list-name',
+            job_selector,
             timeout=15
         )
 
         if not job_elements:
             # Try alternative Jobvite selectors
+            job_selector = 'a[href*="/job/"]'
             job_elements = self.wait_for_elements(
                 By.CSS_SELECTOR,
-                'a[href*="/job/"]',
+                job_selector,
                 timeout=10
             )
 
@@ -74,13 +74,27 @@ class AppFolioScraper(HeadlessScraper):
 
         self.log(f"Found {len(job_elements)} job elements")
 
+        # Read all job rows in one round trip; location and department live
+        # in the surrounding table row / jv-job container
+        row_container = 'tr, div[class*="jv-job"]'
+        rows = self.extract_rows(job_selector, {
+            'text': {},
+            'url': {'attr': 'href'},
+            'ancestor_url': {'closest': 'a', 'attr': 'href'},
+            'link_url': {'selector': 'a', 'attr': 'href'},
+            'location': {'closest': row_container,
+                         'selector': '.jv-job-list-location, [class*="location"]'},
+            'department': {'closest': row_container,
+                           'selector': '.jv-job-list-department, [class*="department"], [class*="category"]'},
+        })
+
         jobs = []
         seen_titles = set()
 
-        for element in job_elements:
+        for element in rows:
             try:
                 # Extract job information
-                title = element.text.strip()
+                title = (element['text'] or '').strip()
 
                 # Skip if just location info
                 if not title or 'Location' in title:
@@ -99,33 +113,20 @@ class AppFolioScraper(HeadlessScraper):
                 seen_titles.add(title)
 
                 # Try to get the URL
-                url = element.get_attribute('href') or ''
-                if not url:
-                    try:
-                        link = element.find_element(By.XPATH, './/ancestor::a | .//a')
-                        url = link.get_attribute('href') or ''
-                    except:
-                        pass
+                url = element['url'] or element['ancestor_url'] or element['link_url'] or ''
 
                 # Try to find location
                 location = 'Not specified'
-                try:
-                    parent = element.find_element(By.XPATH, './ancestor::tr | ./ancestor::div[contains(@class,"jv-job")]')
-                    loc_elem = parent.find_element(By.CSS_SELECTOR, '.jv-job-list-location, [class*="location"]')
-                    location = loc_elem.text.strip()
-                except:
+                if element['location'] is not None:
+                    location = element['location']
+                elif len(title_lines) > 1:
                     # Check if location is in the remaining lines
-                    if len(title_lines) > 1:
-                        location = title_lines[-1].strip()
+                    location = title_lines[-1].strip()
 
                 # Try to find department
                 department = 'Not specified'
-                try:
-                    parent = element.find_element(By.XPATH, './ancestor::tr | ./ancestor::div[contains(@class,"jv-job")]')
-                    dept_elem = parent.find_element(By.CSS_SELECTOR, '.jv-job-list-department, [class*="department"], [class*="category"]')
-                    department = dept_elem.text.strip()
-                except:
-                    pass
+                if element['department'] is not None:
+                    department = element['department']
 
                 job_info = {
                     'title': title,
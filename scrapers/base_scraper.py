@@ -7,9 +7,16 @@ Provides common functionality for all company scrapers.
 import requests
 import csv
 import json
+import time
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlparse
 from abc import ABC, abstractmethod
+from scrapers.http_session import get_session, DEFAULT_TIMEOUT
+from scrapers.rate_limiter import get_rate_limiter, THROTTLE_STATUSES
+from scrapers.retry import get_retry_policy, get_circuit_breaker
+from scrapers.pagination import paginate, DEFAULT_PAGE_CONCURRENCY
+from scrapers.strategy_cache import load_strategy_record, save_strategy_record, order_strategies, is_anomalous
 
 
 class BaseScraper(ABC):
@@ -28,6 +35,11 @@ class BaseScraper(ABC):
         self.platform = company_config.get('platform', 'custom')
         self.config = company_config
 
+        # Retry settings (platform defaults, overridable per company) and
+        # requests that still failed after retrying, for the run summary
+        self.retry_policy = get_retry_policy(company_config)
+        self.request_errors = []
+
         # Set up output directory
         self.output_dir = Path('companies') / self.slug
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -82,6 +94,14 @@ class BaseScraper(ABC):
         """
         Make HTTP request with error handling.
 
+        Requests go through the shared pooled session, so connections to the
+        same host are reused and default headers are always sent. Every
+        request waits for the host's rate limiter. Connection errors, timeouts
+        and retryable status codes are retried with jittered exponential
+        backoff (see scrapers/retry.py); 429 and 503 also slow the host down
+        and wait out Retry-After. A host that keeps failing trips its circuit
+        breaker and is not contacted again until the cooldown has passed.
+
         Args:
             url (str): URL to request
             method (str): HTTP method
@@ -90,25 +110,171 @@ class BaseScraper(ABC):
         Returns:
             requests.Response or None: Response object or None if failed
         """
-        try:
-            kwargs.setdefault('timeout', 30)
-            kwargs.setdefault('headers', {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-
-            if method.upper() == 'GET':
-                response = requests.get(url, **kwargs)
-            elif method.upper() == 'POST':
-                response = requests.post(url, **kwargs)
+        if method.upper() not in ('GET', 'POST'):
+            raise ValueError(f"Unsupported method: {method}")
+
+        limiter = get_rate_limiter()
+        host = urlparse(url).netloc
+        breaker = get_circuit_breaker(host)
+        policy = self.retry_policy
+
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        session = get_session()
+
+        error = None
+        retryable = False
+        sent = 0
+        cause = 'request_failed'
+        for attempt in range(policy.attempts):
+            if not breaker.allow():
+                error = f"circuit breaker open for {host}"
+                cause = 'circuit_open'
+                retryable = True
+                break
+
+            status = None
+            try:
+                limiter.acquire(host)
+                sent += 1
+                response = session.request(method.upper(), url, **kwargs)
+                status = response.status_code
+                limiter.record(host, status, response.headers.get('Retry-After'))
+                response.raise_for_status()
+                breaker.record_success()
+                return response
+            except requests.exceptions.RequestException as e:
+                error = e
+            except BaseException:
+                # Any attempt let through must report back, or a half-open
+                # breaker would wait for its trial forever and reject the host
+                breaker.record_failure()
+                raise
+
+            # Client errors such as 404 say nothing about the host's health
+            if status is not None and status < 500 and status not in THROTTLE_STATUSES:
+                breaker.record_success()
+            elif breaker.record_failure():
+                self.log(f"Circuit breaker opened for {host} after repeated failures", "WARNING")
+
+            retryable = policy.is_retryable(error if status is None else None, status)
+            if not retryable or attempt == policy.attempts - 1:
+                break
+
+            # Throttled responses already made the rate limiter wait out Retry-After
+            if status in THROTTLE_STATUSES:
+                self.log(f"Throttled by {host} (HTTP {status}), "
+                         f"slowing down to {limiter.get(host).rate:.2f} req/s", "WARNING")
             else:
-                raise ValueError(f"Unsupported method: {method}")
+                time.sleep(policy.backoff(attempt))
+            self.log(f"Retrying {url} (attempt {attempt + 2}/{policy.attempts}) after: {error}", "WARNING")
 
-            response.raise_for_status()
-            return response
+        print(f"  Error fetching {url}: {error}")
 
-        except requests.exceptions.RequestException as e:
-            print(f"  Error fetching {url}: {e}")
-            return None
+        # Transient failures that outlasted the retries mean data may be missing;
+        # client errors such as 404 are expected when probing fallback endpoints.
+        # 'attempts' counts requests actually sent (0 if the open breaker rejected it outright)
+        if retryable:
+            self.request_errors.append({'url': url, 'error': str(error), 'attempts': sent, 'cause': cause})
+        return None
+
+    def parse_html(self, html, only=None):
+        """
+        Parse HTML with the fastest installed BeautifulSoup backend.
+
+        lxml is used when installed, html.parser otherwise. A company can
+        force a backend with the "html_parser" config key.
+
+        Args:
+            html (str): Page HTML
+            only (str): CSS selector of the container holding the jobs; simple
+                selectors (tag, #id, .class, [attr]) limit parsing to that subtree
+
+        Returns:
+            BeautifulSoup: Parsed document
+        """
+        # Imported here so API-only runs never load BeautifulSoup
+        from scrapers.html_parser import parse_html
+
+        return parse_html(html, parser=self.config.get('html_parser'), only=only)
+
+    def run_strategies(self, strategies, *args):
+        """
+        Run fallback scraping strategies, trying last run's winner first.
+
+        Stops at the first strategy that returns jobs, unless the count is
+        anomalously low compared to the last run, in which case the others are
+        tried too and the largest result wins. The winner and per-strategy
+        timings are saved to companies/{slug}/scrape_strategy.json.
+
+        Args:
+            strategies (list): (name, callable) pairs in default order
+            *args: Arguments passed to every strategy
+
+        Returns:
+            list or None: Jobs from the winning strategy, or None if all failed
+        """
+        record = load_strategy_record(self.output_dir)
+        ordered = order_strategies(strategies, record)
+        if record['winner'] and ordered[0][0] == record['winner']:
+            self.log(f"Trying last successful strategy first: {record['winner']}")
+
+        best_name, best_jobs = None, None
+        for name, strategy in ordered:
+            start = time.monotonic()
+            try:
+                jobs = strategy(*args)
+            except Exception as e:
+                self.log(f"Strategy {name} failed: {e}", "WARNING")
+                jobs = None
+            record['timings'][name] = round(time.monotonic() - start, 3)
+
+            if not jobs:
+                self.log(f"Strategy {name} found no jobs")
+                continue
+            if best_jobs is None or len(jobs) > len(best_jobs):
+                best_name, best_jobs = name, jobs
+            if not is_anomalous(len(jobs), record):
+                break
+            self.log(f"Strategy {name} found only {len(jobs)} jobs "
+                     f"(last run: {record['job_count']}), trying other strategies...", "WARNING")
+
+        if best_jobs:
+            record['winner'] = best_name
+            record['job_count'] = len(best_jobs)
+
+        try:
+            save_strategy_record(self.output_dir, record)
+        except OSError as e:
+            self.log(f"Could not save strategy record: {e}", "WARNING")
+
+        return best_jobs
+
+    def paginate(self, fetch_page, style='offset', start=0, page_size=None, first=None,
+                 max_pages=None, concurrency=None):
+        """
+        Fetch every page of a paginated listing (see scrapers/pagination.py).
+
+        Pages after the first are fetched concurrently, up to the company's
+        "page_concurrency" setting, and returned in page order.
+
+        Args:
+            fetch_page (callable): Takes a position (offset, page number or
+                cursor) and returns a pagination.Page, or None on failure
+            style (str): 'offset', 'page' or 'cursor'
+            start: Position of the first page
+            page_size (int): Items requested per page
+            first (Page): Already-fetched first page
+            max_pages (int): Safety limit on the number of pages
+            concurrency (int): Pages in flight at once (defaults to the config)
+
+        Returns:
+            list: Items of all pages
+        """
+        if concurrency is None:
+            concurrency = self.config.get('page_concurrency', DEFAULT_PAGE_CONCURRENCY)
+
+        return paginate(fetch_page, style=style, start=start, page_size=page_size, first=first,
+                        concurrency=concurrency, max_pages=max_pages, log=self.log)
 
     def log(self, message, level='INFO'):
         """
@@ -126,5 +292,5 @@ class BaseScraper(ABC):
         return self.output_dir / 'job_count_history.csv'
 
     def get_tracking_file(self):
-        """Get path to jobs tracking database file."""
-        return self.output_dir / 'jobs_tracking.json'
+        """Get path to the job store (see job_store.py)."""
+        return self.output_dir / 'jobs.db'
@@ -0,0 +1,454 @@
+"""
+Headless Browser Pool
+
+Keeps long-lived headless Chrome instances and hands them out to
+HeadlessScraper subclasses, so a run pays Chrome's cold start once per pooled
+browser instead of once per company. Each lease runs in its own browser
+context (like a separate incognito profile), which is disposed when the
+browser is handed back, so no cookies, storage, cache or service workers
+carry over to the next company. Browsers are health-checked before reuse and
+recycled after a fixed number of uses.
+"""
+
+import json
+import threading
+import urllib.request
+
+import websocket
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import SessionNotCreatedException
+from scrapers.driver_cache import resolve_chromedriver
+
+
+# Chrome arguments shared by every profile
+BASE_ARGUMENTS = [
+    '--headless=new',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--window-size=1920,1080',
+    '--disable-blink-features=AutomationControlled',
+]
+
+# Per-profile settings. 'stealth' adds anti-detection measures for sites
+# that block obvious automation (Tyler, Yardi).
+PROFILES = {
+    'default': {
+        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'stealth': False,
+    },
+    'stealth': {
+        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'stealth': True,
+    },
+}
+
+# Scripts run in every page of a 'stealth' profile browser
+STEALTH_SCRIPT = '''
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    })
+'''
+
+# Seconds to wait for a browser-wide DevTools command
+BROWSER_COMMAND_TIMEOUT = 30
+
+# URL patterns for resource blocking (Network.setBlockedURLs), by resource type.
+# Scrapers only read text and links, so these requests are wasted work.
+_EXTENSIONS = {
+    'image': ['png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico'],
+    'font': ['woff', 'woff2', 'ttf', 'otf', 'eot'],
+    'media': ['mp4', 'webm', 'ogg', 'ogv', 'mp3', 'wav', 'm4a', 'mov'],
+}
+BLOCKABLE_RESOURCES = {
+    resource_type: [pattern for ext in extensions for pattern in (f'*.{ext}', f'*.{ext}?*')]
+    for resource_type, extensions in _EXTENSIONS.items()
+}
+BLOCKABLE_RESOURCES['analytics'] = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*connect.facebook.net*',
+    '*hotjar.com*',
+    '*bat.bing.com*',
+    '*snap.licdn.com*',
+    '*cdn.segment.com*',
+]
+DEFAULT_BLOCKED_RESOURCES = ['image', 'font', 'media']
+
+
+def get_blocked_url_patterns(block_resources):
+    """
+    Expand a company's "block_resources" setting into URL patterns.
+
+    Args:
+        block_resources: True for DEFAULT_BLOCKED_RESOURCES, or a dict with
+            optional "types" (keys of BLOCKABLE_RESOURCES) and "domains"
+            (extra URL patterns such as "*.vimeo.com*")
+
+    Returns:
+        list: URL patterns (empty if blocking is off)
+    """
+    if not block_resources:
+        return []
+    if block_resources is True:
+        block_resources = {}
+
+    patterns = []
+    for resource_type in block_resources.get('types', DEFAULT_BLOCKED_RESOURCES):
+        patterns.extend(BLOCKABLE_RESOURCES.get(resource_type, []))
+    patterns.extend(block_resources.get('domains', []))
+    return patterns
+
+
+def set_blocked_urls(driver, patterns):
+    """
+    Block (or, with an empty list, unblock) requests matching URL patterns.
+
+    Args:
+        driver (WebDriver): Chrome driver
+        patterns (list): URL patterns with * wildcards
+    """
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+
+
+def build_chrome_options(profile='default', capture_network=False):
+    """
+    Build Chrome options for a browser profile.
+
+    Args:
+        profile (str): Profile name from PROFILES
+        capture_network (bool): Enable the performance log (network events)
+
+    Returns:
+        Options: Chrome options
+    """
+    settings = PROFILES.get(profile, PROFILES['default'])
+
+    chrome_options = Options()
+    for argument in BASE_ARGUMENTS:
+        chrome_options.add_argument(argument)
+    chrome_options.add_argument(f"--user-agent={settings['user_agent']}")
+
+    if settings['stealth']:
+        chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    if capture_network:
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    return chrome_options
+
+
+def create_driver(profile='default', capture_network=False):
+    """
+    Start a new headless Chrome instance.
+
+    Args:
+        profile (str): Profile name from PROFILES
+        capture_network (bool): Enable the performance log (used by API discovery)
+
+    Returns:
+        WebDriver: Chrome driver
+    """
+    try:
+        service = Service(resolve_chromedriver())
+        driver = webdriver.Chrome(service=service, options=build_chrome_options(profile, capture_network))
+    except SessionNotCreatedException:
+        # The cached driver no longer matches the installed Chrome - resolve again
+        service = Service(resolve_chromedriver(refresh=True))
+        driver = webdriver.Chrome(service=service, options=build_chrome_options(profile, capture_network))
+
+    apply_profile_scripts(driver, profile)
+    return driver
+
+
+def apply_profile_scripts(driver, profile='default'):
+    """
+    Install a profile's page scripts in the driver's current tab.
+
+    Args:
+        driver (WebDriver): Chrome driver
+        profile (str): Profile name from PROFILES
+    """
+    if PROFILES.get(profile, PROFILES['default'])['stealth']:
+        # Override webdriver detection
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': STEALTH_SCRIPT})
+
+
+def send_browser_command(driver, method, params=None):
+    """
+    Send a DevTools command to the browser itself rather than to a tab.
+
+    chromedriver's execute_cdp_cmd talks to the current tab, where browser
+    context management (Target.createBrowserContext and friends) is not
+    allowed, so this connects to the browser's own DevTools endpoint.
+
+    Args:
+        driver (WebDriver): Chrome driver
+        method (str): DevTools method, e.g. 'Target.createBrowserContext'
+        params (dict): Method parameters
+
+    Returns:
+        dict: Command result
+
+    Raises:
+        RuntimeError: If the browser rejected the command
+    """
+    address = driver.capabilities['goog:chromeOptions']['debuggerAddress']
+    with urllib.request.urlopen(f"http://{address}/json/version", timeout=BROWSER_COMMAND_TIMEOUT) as response:
+        endpoint = json.load(response)['webSocketDebuggerUrl']
+
+    # Chrome refuses DevTools websockets that send an Origin header it does not allow
+    connection = websocket.create_connection(endpoint, timeout=BROWSER_COMMAND_TIMEOUT, suppress_origin=True)
+    try:
+        connection.send(json.dumps({'id': 1, 'method': method, 'params': params or {}}))
+        while True:
+            message = json.loads(connection.recv())
+            if message.get('id') == 1:
+                break
+    finally:
+        connection.close()
+
+    if 'error' in message:
+        raise RuntimeError(f"{method} failed: {message['error'].get('message')}")
+    return message.get('result', {})
+
+
+class BrowserPool:
+    """Pool of reusable headless Chrome instances."""
+
+    def __init__(self, size=2, max_uses=10):
+        """
+        Initialize the browser pool.
+
+        Args:
+            size (int): Maximum number of live browsers (across all profiles)
+            max_uses (int): Number of companies a browser serves before it is recycled
+        """
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self._condition = threading.Condition()
+        self._idle = {}     # profile -> list of idle drivers
+        self._uses = {}     # driver -> number of times handed out
+        self._profiles = {}  # driver -> profile
+        self._home = {}      # driver -> handle of its first tab (default context, kept open)
+        self._contexts = {}  # driver -> browser context of the current lease
+        self._live = 0
+        self._closed = False
+
+    def acquire(self, profile='default'):
+        """
+        Get a healthy browser for the given profile, waiting if the pool is full.
+
+        The browser is switched to a tab in a new, empty browser context.
+
+        Args:
+            profile (str): Profile name from PROFILES
+
+        Returns:
+            WebDriver: Chrome driver (must be handed back with release())
+        """
+        while True:
+            driver = self._checkout(profile)
+            if driver is None:
+                # Start Chrome outside the lock so other scrapers are not held up
+                try:
+                    driver = create_driver(profile)
+                except Exception:
+                    with self._condition:
+                        self._live -= 1
+                        self._condition.notify()
+                    raise
+
+                with self._condition:
+                    self._uses[driver] = 1
+                    self._profiles[driver] = profile
+                    self._home[driver] = driver.current_window_handle
+                fresh = True
+            else:
+                fresh = False
+
+            try:
+                self._open_context(driver, profile)
+                return driver
+            except Exception:
+                with self._condition:
+                    self._discard(driver)
+                    self._condition.notify()
+                if fresh:
+                    raise  # A new browser that cannot isolate sessions will not do better next time
+
+    def _checkout(self, profile):
+        """
+        Take a healthy idle browser, or reserve a slot for a new one.
+
+        Returns:
+            WebDriver or None: Idle driver, or None if a new browser should be started
+        """
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Browser pool is shut down")
+
+                idle = self._idle.setdefault(profile, [])
+                while idle:
+                    driver = idle.pop()
+                    if self._is_healthy(driver):
+                        self._uses[driver] += 1
+                        return driver
+                    self._discard(driver)
+
+                if self._live < self.size:
+                    self._live += 1
+                    return None
+
+                # Pool is full: evict an idle browser of another profile if there is one
+                other = next((d for p, ds in self._idle.items() if p != profile for d in ds), None)
+                if other is not None:
+                    self._idle[self._profiles[other]].remove(other)
+                    self._discard(other)
+                    continue
+
+                self._condition.wait()
+
+    def release(self, driver):
+        """
+        Return a browser to the pool, disposing of the lease's browser context.
+
+        Browsers that fail to reset or have reached max_uses are shut down.
+
+        Args:
+            driver (WebDriver): Driver obtained from acquire()
+        """
+        reusable = self._reset(driver)
+
+        with self._condition:
+            if self._closed or not reusable or self._uses.get(driver, 0) >= self.max_uses:
+                self._discard(driver)
+            else:
+                self._idle.setdefault(self._profiles[driver], []).append(driver)
+            self._condition.notify()
+
+    def shutdown(self):
+        """Shut down all idle browsers and refuse further acquisitions."""
+        with self._condition:
+            self._closed = True
+            for drivers in self._idle.values():
+                for driver in drivers:
+                    self._discard(driver)
+            self._idle = {}
+            self._condition.notify_all()
+
+    def _discard(self, driver):
+        """Quit a browser and free its slot. Caller must hold the lock."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        self._uses.pop(driver, None)
+        self._profiles.pop(driver, None)
+        self._home.pop(driver, None)
+        self._contexts.pop(driver, None)
+        self._live -= 1
+
+    def _is_healthy(self, driver):
+        """Check that a browser still responds to commands."""
+        try:
+            return driver.execute_script('return 1') == 1
+        except Exception:
+            return False
+
+    def _open_context(self, driver, profile):
+        """
+        Create a browser context for a lease and switch the driver to a tab in it.
+
+        Args:
+            driver (WebDriver): Pooled driver
+            profile (str): Profile name from PROFILES
+        """
+        context = send_browser_command(driver, 'Target.createBrowserContext',
+                                       {'disposeOnDetach': False})['browserContextId']
+        self._contexts[driver] = context
+
+        target = send_browser_command(driver, 'Target.createTarget',
+                                      {'url': 'about:blank', 'browserContextId': context})['targetId']
+
+        # chromedriver names windows after their DevTools target (older versions add a prefix)
+        handle = next((h for h in driver.window_handles if h.endswith(target)), None)
+        if handle is None:
+            raise RuntimeError(f"Tab {target} of the new browser context not found")
+        driver.switch_to.window(handle)
+
+        # Page scripts are per tab, so the profile's scripts are installed again
+        apply_profile_scripts(driver, profile)
+
+    def _reset(self, driver):
+        """
+        Close the lease's tabs and dispose of its browser context.
+
+        Returns:
+            bool: True if the browser was reset and can be reused
+        """
+        try:
+            home = self._home.get(driver)
+            context = self._contexts.pop(driver, None)
+            if home is None or context is None:
+                return False
+
+            # Close every tab/window opened during the lease
+            for handle in driver.window_handles:
+                if handle != home:
+                    driver.switch_to.window(handle)
+                    driver.close()
+            driver.switch_to.window(home)
+
+            # Drops the context's cookies, storage of every origin, cache and service workers
+            send_browser_command(driver, 'Target.disposeBrowserContext', {'browserContextId': context})
+            return True
+        except Exception:
+            return False
+
+
+_pool = None
+
+
+def configure_browser_pool(size=2, max_uses=10):
+    """
+    Create the process-wide browser pool used by HeadlessScraper.
+
+    Args:
+        size (int): Maximum number of live browsers
+        max_uses (int): Companies served per browser before it is recycled
+
+    Returns:
+        BrowserPool: The configured pool
+    """
+    global _pool
+
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = BrowserPool(size=size, max_uses=max_uses)
+    return _pool
+
+
+def get_browser_pool():
+    """
+    Get the process-wide browser pool.
+
+    Returns:
+        BrowserPool or None: The pool, or None if pooling is not configured
+    """
+    return _pool
+
+
+def shutdown_browser_pool():
+    """Shut down the process-wide browser pool, if any."""
+    global _pool
+
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = None
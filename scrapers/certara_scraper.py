@@ -7,13 +7,14 @@ Handles pagination and extracts location/department info.
 
 from selenium.webdriver.common.by import By
 from scrapers.headless_scraper import HeadlessScraper
-import time
 import re
 
 
 class CertaraScraper(HeadlessScraper):
     """Scraper for Certara careers site (Jibe/iCIMS platform)."""
 
+    readiness = {'condition': 'selector_stable', 'selector': 'a[href*="/jobs/"][href*="lang=en"]'}
+
     def _scrape_jobs(self):
         """
         Scrape jobs from Certara using headless browser.
@@ -23,13 +24,10 @@ class CertaraScraper(HeadlessScraper):
         """
         self.log("Starting Certara scrape...")
 
-        # Load the page
-        self.driver.get(self.url)
+        # Load the page and wait for the job list to render
+        self.load_page(self.url)
         self.log(f"Loaded page: {self.url}")
 
-        # Wait for page to load
-        time.sleep(5)
-
         all_jobs = []
         page = 1
         max_pages = 10  # Safety limit
@@ -37,9 +35,6 @@ class CertaraScraper(HeadlessScraper):
         while page <= max_pages:
             self.log(f"Scraping page {page}...")
 
-            # Wait for job listings
-            time.sleep(3)
-
             # Get jobs from current page
             page_jobs = self._extract_jobs_from_page()
 
@@ -55,7 +50,6 @@ class CertaraScraper(HeadlessScraper):
                 break
 
             page += 1
-            time.sleep(2)
 
         # Deduplicate by URL
         seen_urls = set()
@@ -76,15 +70,15 @@ class CertaraScraper(HeadlessScraper):
         body_text = self.driver.find_element(By.TAG_NAME, 'body').text
         lines = body_text.split('\n')
 
-        # Find all job links
-        job_links = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/jobs/"][href*="lang=en"]')
+        # Find all job links (text and href in one round trip)
+        job_links = self.extract_rows('a[href*="/jobs/"][href*="lang=en"]')
 
         seen_urls = set()
 
         for link in job_links:
             try:
-                url = link.get_attribute('href')
-                title = link.text.strip()
+                url = link['url']
+                title = (link['text'] or '').strip()
 
                 # Skip invalid entries
                 if not url or not title or len(title) < 3:
@@ -186,7 +180,8 @@ class CertaraScraper(HeadlessScraper):
 
                             if 'disabled' not in classes.lower() and 'disabled' not in parent_classes.lower():
                                 elem.click()
-                                time.sleep(3)
+                                # The job count stays the same between pages, so wait on DOM changes
+                                self.wait_until_ready(condition='dom_stable')
                                 return True
                 except:
                     continue
@@ -0,0 +1,116 @@
+"""
+Run Checkpoints
+
+Saves each company's result to state/checkpoint_<date>[_<fund>].json as soon
+as it finishes, so a crashed or timed-out run keeps its progress. A resumed
+run loads today's checkpoint and only scrapes the companies that are missing
+or did not succeed.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+
+CHECKPOINT_DIR = Path('state')
+
+
+def checkpoint_path(date, fund=None):
+    """
+    Get the checkpoint file for a day's run.
+
+    Args:
+        date (str): Run date (YYYY-MM-DD)
+        fund (str): Optional fund name (separate runs keep separate checkpoints)
+
+    Returns:
+        Path: Checkpoint file
+    """
+    suffix = f"_{fund}" if fund else ""
+    return CHECKPOINT_DIR / f"checkpoint_{date}{suffix}.json"
+
+
+class RunCheckpoint:
+    """Per-company results of one day's run, written atomically after every company."""
+
+    def __init__(self, date, fund=None):
+        """
+        Open the day's checkpoint, keeping results already recorded today.
+
+        Args:
+            date (str): Run date (YYYY-MM-DD)
+            fund (str): Optional fund name
+        """
+        self.path = checkpoint_path(date, fund)
+        self.date = date
+        self.fund = fund
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.results = dict(json.load(f).get('results', {}))
+        except (OSError, ValueError, AttributeError, TypeError):
+            self.results = {}
+
+        self._remove_stale()
+
+    def _remove_stale(self):
+        """Delete checkpoints of earlier days for the same fund."""
+        suffix = f"_{self.fund}" if self.fund else ""
+        for path in CHECKPOINT_DIR.glob(f"checkpoint_*{suffix}.json"):
+            stem = path.stem[len('checkpoint_'):]
+            if stem[:10] < self.date and stem[10:] == suffix:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def is_done(self, slug):
+        """
+        Check whether a company already has a complete result today.
+
+        Failed, skipped and partial results are scraped again on resume.
+
+        Args:
+            slug (str): Company slug
+
+        Returns:
+            bool: True if the company can be skipped
+        """
+        result = self.results.get(slug)
+        return bool(result and result.get('success') and not result.get('partial'))
+
+    def completed_results(self):
+        """
+        Get the results carried over from earlier in the day.
+
+        Returns:
+            list: Result dictionaries of companies that are done, marked from_checkpoint
+        """
+        return [{**result, 'from_checkpoint': True}
+                for slug, result in self.results.items() if self.is_done(slug)]
+
+    def record(self, result):
+        """
+        Add a finished company's result and write the checkpoint.
+
+        Args:
+            result (dict): Result dictionary from scrape_company()
+        """
+        self.results[result['slug']] = result
+
+        checkpoint = {
+            'date': self.date,
+            'fund': self.fund,
+            'updated_at': datetime.now().isoformat(),
+            'results': self.results,
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.path.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(checkpoint, f, indent=2)
+            os.replace(tmp_file, self.path)
+        except OSError as e:
+            print(f"Warning: could not write checkpoint {self.path}: {e}")
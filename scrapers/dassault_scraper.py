@@ -9,7 +9,6 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from scrapers.headless_scraper import HeadlessScraper
-import time
 import re
 import json
 
@@ -17,6 +16,19 @@ import json
 class DassaultScraper(HeadlessScraper):
     """Scraper for Dassault Systemes (3DS) careers site."""
 
+    # extract_rows() spec for generic job elements (see _parse_job_element)
+    JOB_ELEMENT_FIELDS = {
+        'tag': {'attr': 'tag'},
+        'text': {},
+        'href': {'attr': 'href'},
+        'link_href': {'selector': 'a', 'attr': 'href'},
+        'title': {'selector': ['h2', 'h3', 'h4', '.title', '.job-title', 'a']},
+        'location': {'selector': '[class*="location"], [class*="city"], [class*="place"]'},
+        'department': {'selector': '[class*="department"], [class*="category"], [class*="team"]'},
+    }
+
+    readiness = {'condition': 'selector_stable', 'selector': 'div.job-card-text'}
+
     def _scrape_jobs(self):
         """
         Scrape jobs from Dassault Systemes using headless browser.
@@ -26,14 +38,10 @@ class DassaultScraper(HeadlessScraper):
         """
         self.log("Starting Dassault Systemes scrape...")
 
-        all_jobs = []
-        seen_urls = set()
-
         # Load careers page
         base_url = "https://www.3ds.com/careers/jobs"
-        self.driver.get(base_url)
         self.log(f"Loading: {base_url}")
-        time.sleep(5)  # Wait for Vue.js to render
+        self.load_page(base_url)  # Wait for Vue.js to render
 
         # Wait for job cards to load
         try:
@@ -46,49 +54,66 @@ class DassaultScraper(HeadlessScraper):
         # Scroll to load more content (infinite scroll handling)
         self._load_all_jobs()
 
-        # Look for job-card-text elements (Dassault's specific structure)
-        job_card_texts = self.driver.find_elements(By.CSS_SELECTOR, 'div.job-card-text')
+        # Job-card-text elements, then generic job selectors, then the page
+        # source (last run's winner first)
+        all_jobs = self.run_strategies([
+            ('job_card_text', self._parse_job_card_texts),
+            ('job_selectors', self._parse_job_selectors),
+            ('page_source', self._parse_from_source),
+        ]) or []
+
+        self.log(f"Completed: {len(all_jobs)} total jobs scraped")
+        return all_jobs
+
+    def _parse_job_card_texts(self):
+        """Parse jobs from job-card-text elements (Dassault's specific structure)."""
+        jobs = []
+        seen_urls = set()
+
+        job_card_texts = self.extract_rows('div.job-card-text', {
+            'text': {},
+            'ancestor_url': {'closest': 'a', 'attr': 'href'},
+            'link_url': {'selector': 'a', 'attr': 'href'},
+        })
         self.log(f"Found {len(job_card_texts)} job-card-text elements")
 
-        if job_card_texts:
-            for elem in job_card_texts:
-                job = self._parse_job_card_text(elem, seen_urls)
-                if job:
-                    all_jobs.append(job)
-
-        # If job-card-text didn't work, try other selectors
-        if not all_jobs:
-            job_selectors = [
-                'a[href*="/careers/jobs/"]',
-                '.ds-card',
-                'article[class*="job"]',
-                '.job-listing',
-                'li[class*="job"]',
-            ]
+        for row in job_card_texts:
+            job = self._parse_job_card_text(row, seen_urls)
+            if job:
+                jobs.append(job)
 
-            for selector in job_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    self.log(f"Trying selector '{selector}': found {len(elements)} elements")
-
-                    if len(elements) > 5:  # Likely found job listings
-                        for elem in elements:
-                            job = self._parse_job_element(elem, seen_urls)
-                            if job:
-                                all_jobs.append(job)
-                        break
+        return jobs
 
-                except Exception as e:
-                    self.log(f"Selector {selector} failed: {e}", "WARNING")
-                    continue
+    def _parse_job_selectors(self):
+        """Parse jobs from the first generic job selector that matches enough elements."""
+        jobs = []
+        seen_urls = set()
 
-        # If selectors don't work, try parsing from page source
-        if len(all_jobs) == 0:
-            self.log("Trying alternative parsing methods...")
-            all_jobs = self._parse_from_source()
+        job_selectors = [
+            'a[href*="/careers/jobs/"]',
+            '.ds-card',
+            'article[class*="job"]',
+            '.job-listing',
+            'li[class*="job"]',
+        ]
 
-        self.log(f"Completed: {len(all_jobs)} total jobs scraped")
-        return all_jobs
+        for selector in job_selectors:
+            try:
+                elements = self.extract_rows(selector, self.JOB_ELEMENT_FIELDS)
+                self.log(f"Trying selector '{selector}': found {len(elements)} elements")
+
+                if len(elements) > 5:  # Likely found job listings
+                    for row in elements:
+                        job = self._parse_job_element(row, seen_urls)
+                        if job:
+                            jobs.append(job)
+                    break
+
+            except Exception as e:
+                self.log(f"Selector {selector} failed: {e}", "WARNING")
+                continue
+
+        return jobs
 
     def _load_all_jobs(self):
         """Load all jobs by scrolling or clicking 'load more'."""
@@ -109,7 +134,7 @@ class DassaultScraper(HeadlessScraper):
                         button = self.driver.find_element(By.CSS_SELECTOR, selector)
                         if button.is_displayed():
                             button.click()
-                            time.sleep(2)
+                            self.wait_until_ready(quiet=0.5, timeout=5)
                             clicked = True
                             break
                     except:
@@ -118,7 +143,7 @@ class DassaultScraper(HeadlessScraper):
                 if not clicked:
                     # Try scrolling instead
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(2)
+                    self.wait_until_ready(quiet=0.5, timeout=5)
 
                 # Check if we reached the end
                 try:
@@ -131,10 +156,10 @@ class DassaultScraper(HeadlessScraper):
         except Exception as e:
             self.log(f"Load more failed: {e}", "WARNING")
 
-    def _parse_job_card_text(self, elem, seen_urls):
-        """Parse a job-card-text element (Dassault's specific format)."""
+    def _parse_job_card_text(self, row, seen_urls):
+        """Parse a job-card-text row (Dassault's specific format)."""
         try:
-            text = elem.text.strip()
+            text = (row['text'] or '').strip()
             if not text:
                 return None
 
@@ -161,17 +186,8 @@ class DassaultScraper(HeadlessScraper):
                 return None
             seen_urls.add(title_key)
 
-            # Try to find URL from parent element
-            job_url = self.url
-            try:
-                parent = elem.find_element(By.XPATH, './ancestor::a')
-                job_url = parent.get_attribute('href') or self.url
-            except:
-                try:
-                    link = elem.find_element(By.CSS_SELECTOR, 'a')
-                    job_url = link.get_attribute('href') or self.url
-                except:
-                    pass
+            # Try to find URL from parent element, then from a child link
+            job_url = row['ancestor_url'] or row['link_url'] or self.url
 
             is_remote = 'remote' in title.lower() or 'remote' in location.lower()
 
@@ -188,19 +204,14 @@ class DassaultScraper(HeadlessScraper):
         except Exception as e:
             return None
 
-    def _parse_job_element(self, elem, seen_urls):
-        """Parse a single job element."""
+    def _parse_job_element(self, row, seen_urls):
+        """Parse a single job row extracted with JOB_ELEMENT_FIELDS."""
         try:
             # Get URL
-            href = ''
-            if elem.tag_name == 'a':
-                href = elem.get_attribute('href') or ''
+            if row['tag'] == 'a':
+                href = row['href'] or ''
             else:
-                try:
-                    link = elem.find_element(By.CSS_SELECTOR, 'a')
-                    href = link.get_attribute('href') or ''
-                except:
-                    pass
+                href = row['link_href'] or ''
 
             # Skip if already seen or not a job link
             if href in seen_urls:
@@ -211,18 +222,10 @@ class DassaultScraper(HeadlessScraper):
                 seen_urls.add(href)
 
             # Get title
-            title = ''
-            if elem.tag_name == 'a':
-                title = elem.text.strip()
+            if row['tag'] == 'a':
+                title = (row['text'] or '').strip()
             else:
-                for tag in ['h2', 'h3', 'h4', '.title', '.job-title', 'a']:
-                    try:
-                        title_elem = elem.find_element(By.CSS_SELECTOR, tag)
-                        title = title_elem.text.strip()
-                        if title:
-                            break
-                    except:
-                        continue
+                title = row['title'] or ''
 
             if not title or len(title) < 3:
                 return None
@@ -233,12 +236,11 @@ class DassaultScraper(HeadlessScraper):
 
             # Get location
             location = 'Not specified'
-            try:
-                loc_elem = elem.find_element(By.CSS_SELECTOR, '[class*="location"], [class*="city"], [class*="place"]')
-                location = loc_elem.text.strip()
-            except:
+            if row['location'] is not None:
+                location = row['location']
+            else:
                 # Try to extract from element text
-                text = elem.text
+                text = row['text']
                 if text:
                     lines = text.split('\n')
                     for line in lines[1:]:  # Skip first line (title)
@@ -249,11 +251,8 @@ class DassaultScraper(HeadlessScraper):
 
             # Get department
             department = 'Not specified'
-            try:
-                dept_elem = elem.find_element(By.CSS_SELECTOR, '[class*="department"], [class*="category"], [class*="team"]')
-                department = dept_elem.text.strip()
-            except:
-                pass
+            if row['department'] is not None:
+                department = row['department']
 
             is_remote = 'remote' in title.lower() or 'remote' in location.lower()
 
@@ -10,13 +10,14 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from .headless_scraper import HeadlessScraper
-import time
 import re
 
 
 class DayforceScraper(HeadlessScraper):
     """Scraper for Dayforce HCM career portals (uses Ant Design)."""
 
+    readiness = {'condition': 'selector_stable', 'selector': '.ant-card, a[href*="/jobs/"]', 'timeout': 20}
+
     def _scrape_jobs(self):
         """
         Scrape jobs from Dayforce HCM portal.
@@ -28,8 +29,7 @@ class DayforceScraper(HeadlessScraper):
         jobs = []
 
         # Load the careers page
-        self.driver.get(self.url)
-        time.sleep(8)  # Dayforce needs time to load React content
+        self.load_page(self.url)  # Dayforce needs time to load React content
         self.log(f"Loaded page: {self.url}")
 
         # Wait for job listings to load
@@ -52,7 +52,7 @@ class DayforceScraper(HeadlessScraper):
                 job_links = self.wait_for_elements(By.CSS_SELECTOR, 'a[href*="/jobs/"]', timeout=10)
                 if job_links:
                     self.log(f"Found {len(job_links)} job links")
-                    return self._extract_from_links(job_links)
+                    return self._extract_from_links(self.extract_rows('a[href*="/jobs/"]'))
             except:
                 pass
 
@@ -60,33 +60,32 @@ class DayforceScraper(HeadlessScraper):
             self.log("No job elements found", level="WARNING")
             return []
 
-        # Get page text for location extraction
-        body_text = self.driver.find_element(By.TAG_NAME, 'body').text
+        # Extract all cards in a single round trip
+        cards = self.extract_rows('.ant-card', {
+            'text': {},
+            'link_texts': {'selector': 'a[href*="/jobs/"]', 'all': True},
+            'link_urls': {'selector': 'a[href*="/jobs/"]', 'attr': 'href', 'all': True},
+        })
 
         # Extract job data from cards
         seen_urls = set()
-        for card in job_cards:
+        for card in cards:
             try:
                 # Get card text
-                card_text = card.text.strip()
+                card_text = card['text'] or ''
                 if not card_text or len(card_text) < 5:
                     continue
 
                 # Find job link in card
                 url = ''
                 title = ''
-                try:
-                    links = card.find_elements(By.CSS_SELECTOR, 'a[href*="/jobs/"]')
-                    for link in links:
-                        link_text = link.text.strip()
-                        link_url = link.get_attribute('href')
-                        # Skip "Read More" links
-                        if link_text and link_text.lower() != 'read more' and link_url:
-                            title = link_text
-                            url = link_url
-                            break
-                except:
-                    pass
+                for link_text, link_url in zip(card['link_texts'], card['link_urls']):
+                    link_text = (link_text or '').strip()
+                    # Skip "Read More" links
+                    if link_text and link_text.lower() != 'read more' and link_url:
+                        title = link_text
+                        url = link_url
+                        break
 
                 if not title or not url:
                     continue
@@ -122,7 +121,7 @@ class DayforceScraper(HeadlessScraper):
         return jobs
 
     def _extract_from_links(self, job_links):
-        """Extract jobs from link elements when cards aren't found."""
+        """Extract jobs from link rows (extract_rows() text/url) when cards aren't found."""
         jobs = []
         seen_urls = set()
 
@@ -131,8 +130,8 @@ class DayforceScraper(HeadlessScraper):
 
         for link in job_links:
             try:
-                url = link.get_attribute('href')
-                title = link.text.strip()
+                url = link['url']
+                title = (link['text'] or '').strip()
 
                 # Skip invalid links
                 if not url or not title:
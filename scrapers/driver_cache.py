@@ -0,0 +1,111 @@
+"""
+ChromeDriver Cache
+
+Resolves the chromedriver binary once and records it in a local manifest,
+so later browsers in the same run (and later runs) skip webdriver-manager's
+version probing and downloads. Works offline whenever a cached driver exists.
+"""
+
+import json
+import os
+import subprocess
+import threading
+from datetime import datetime
+from pathlib import Path
+
+
+MANIFEST_FILE = Path('.cache') / 'chromedriver.json'
+
+_lock = threading.Lock()
+_resolved_path = None
+
+
+def _load_manifest():
+    """Load the cached driver manifest, or None if missing/unreadable."""
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _save_manifest(path):
+    """Record a resolved driver path and its version in the manifest."""
+    manifest = {
+        'path': path,
+        'version': get_driver_version(path),
+        'resolved_at': datetime.now().isoformat()
+    }
+
+    MANIFEST_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = MANIFEST_FILE.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_file, MANIFEST_FILE)
+
+
+def get_driver_version(path):
+    """
+    Get the version reported by a chromedriver binary.
+
+    Args:
+        path (str): Path to chromedriver
+
+    Returns:
+        str: Version string (e.g. '120.0.6099.109') or 'unknown'
+    """
+    try:
+        output = subprocess.run([path, '--version'], capture_output=True, text=True, timeout=10).stdout
+        # Output format: "ChromeDriver 120.0.6099.109 (...)"
+        parts = output.split()
+        return parts[1] if len(parts) > 1 else 'unknown'
+    except (OSError, subprocess.SubprocessError):
+        return 'unknown'
+
+
+def resolve_chromedriver(refresh=False):
+    """
+    Get the chromedriver path, resolving it at most once per process.
+
+    Resolution order: CHROMEDRIVER_PATH environment variable, the cached
+    manifest, then webdriver-manager (which may hit the network). If a
+    refresh fails, the previously cached driver is used.
+
+    Args:
+        refresh (bool): Ignore the cache and ask webdriver-manager again
+            (e.g. after Chrome was upgraded and the cached driver no longer matches)
+
+    Returns:
+        str: Path to the chromedriver binary
+    """
+    global _resolved_path
+
+    with _lock:
+        env_path = os.environ.get('CHROMEDRIVER_PATH')
+        if env_path:
+            return env_path
+
+        if _resolved_path and not refresh:
+            return _resolved_path
+
+        manifest = _load_manifest()
+        cached_path = manifest.get('path') if manifest else None
+        if cached_path and not Path(cached_path).exists():
+            cached_path = None
+
+        if cached_path and not refresh:
+            _resolved_path = cached_path
+            return _resolved_path
+
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            path = ChromeDriverManager().install()
+        except Exception:
+            if cached_path:
+                _resolved_path = cached_path
+                return _resolved_path
+            raise
+
+        _save_manifest(path)
+        _resolved_path = path
+        return _resolved_path
@@ -5,9 +5,7 @@ Scrapes job postings from Gem-based career sites.
 Gem is a recruiting platform that requires JavaScript rendering.
 """
 
-from selenium.webdriver.common.by import By
 from scrapers.headless_scraper import HeadlessScraper
-import time
 
 
 class GemScraper(HeadlessScraper):
@@ -28,10 +26,9 @@ class GemScraper(HeadlessScraper):
             return []
 
         self.log(f"Loading page: {url}")
-        self.driver.get(url)
 
         # Wait for page to load and jobs to render
-        time.sleep(3)
+        self.load_page(url)
 
         jobs = []
 
@@ -50,10 +47,21 @@ class GemScraper(HeadlessScraper):
                 '[class*="posting"]',
             ]
 
+            # Read each candidate element's link, text and department header in one round trip
+            fields = {
+                'url': {'attr': 'href'},
+                'text': {},
+                'class': {'attr': 'class'},
+                'department': {
+                    'closest': 'div[class*="department"], div[class*="team"], div[class*="category"]',
+                    'selector': 'h2, h3, h4, [class*="header"]',
+                },
+            }
+
             job_elements = []
             for selector in job_selectors:
                 try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                    elements = self.extract_rows(selector, fields)
                     if elements:
                         self.log(f"Found {len(elements)} elements with selector: {selector}")
                         job_elements = elements
@@ -64,16 +72,16 @@ class GemScraper(HeadlessScraper):
             if not job_elements:
                 # Try finding all links and filter for job-related ones
                 self.log("Trying to find job links...")
-                all_links = self.driver.find_elements(By.TAG_NAME, 'a')
+                all_links = self.extract_rows('a', fields)
 
                 # Get company slug from URL (e.g., 'bilt' from 'jobs.gem.com/bilt')
                 company_slug = url.rstrip('/').split('/')[-1]
 
                 job_elements = [
                     link for link in all_links
-                    if '/jobs/' in (link.get_attribute('href') or '')
-                    or f'/{company_slug}/' in (link.get_attribute('href') or '')
-                    or 'job' in (link.get_attribute('class') or '').lower()
+                    if '/jobs/' in (link['url'] or '')
+                    or f'/{company_slug}/' in (link['url'] or '')
+                    or 'job' in (link['class'] or '').lower()
                 ]
                 self.log(f"Found {len(job_elements)} potential job links")
 
@@ -84,7 +92,7 @@ class GemScraper(HeadlessScraper):
             for element in job_elements:
                 try:
                     # Get job URL
-                    job_url = element.get_attribute('href')
+                    job_url = element['url']
                     if not job_url or job_url in seen_urls:
                         continue
 
@@ -99,7 +107,7 @@ class GemScraper(HeadlessScraper):
                     seen_urls.add(job_url)
 
                     # Get the full text from the link element
-                    full_text = element.text.strip()
+                    full_text = (element['text'] or '').strip()
 
                     # Gem format: "Title\nLocation\n·\nWork Type" or similar
                     lines = [l.strip() for l in full_text.split('\n') if l.strip() and l.strip() != '·']
@@ -122,14 +130,8 @@ class GemScraper(HeadlessScraper):
                         title = job_url.split('/')[-1].replace('-', ' ').title()
 
                     # Try to get department from parent/sibling elements
-                    department = 'Not specified'
-                    try:
-                        # Look for department header above job listings
-                        parent = element.find_element(By.XPATH, './ancestor::div[contains(@class, "department") or contains(@class, "team") or contains(@class, "category")]')
-                        dept_header = parent.find_element(By.CSS_SELECTOR, 'h2, h3, h4, [class*="header"]')
-                        department = dept_header.text.strip()
-                    except Exception:
-                        pass
+                    # (department header above job listings)
+                    department = element['department'] if element['department'] is not None else 'Not specified'
 
                     # Check if remote
                     remote = 'No'
@@ -5,9 +5,9 @@ Attempts to scrape job postings from various career sites using common patterns.
 This is a fallback scraper for sites without custom implementations.
 """
 
-import re
-import json
 from scrapers.base_scraper import BaseScraper
+from scrapers.html_scan import scan_page
+from scrapers.hydration import extract_jobs as extract_hydration_jobs
 
 
 class GenericScraper(BaseScraper):
@@ -29,16 +29,17 @@ class GenericScraper(BaseScraper):
             self.log("Failed to fetch page", "ERROR")
             return []
 
-        jobs = []
+        # Walk the page once; every strategy works from the scan
+        page = scan_page(response.text)
 
-        # Try different patterns
-        jobs = (
-            self._try_json_ld(response.text) or
-            self._try_greenhouse(response.text) or
-            self._try_lever(response.text) or
-            self._try_json_data(response.text) or
-            []
-        )
+        # Try different patterns (last run's winner first)
+        jobs = self.run_strategies([
+            ('json_ld', self._try_json_ld),
+            ('greenhouse', self._try_greenhouse),
+            ('lever', self._try_lever),
+            ('hydration', self._try_hydration),
+            ('json_data', self._try_json_data),
+        ], page) or []
 
         if jobs:
             self.log(f"Completed: {len(jobs)} jobs scraped")
@@ -51,34 +52,25 @@ class GenericScraper(BaseScraper):
 
         return jobs
 
-    def _try_json_ld(self, html):
+    def _try_json_ld(self, page):
         """Try to extract jobs from JSON-LD structured data."""
         self.log("Trying JSON-LD extraction...")
 
-        pattern = r'<script type="application/ld\+json">(.*?)</script>'
-        matches = re.findall(pattern, html, re.DOTALL)
-
         jobs = []
-        for match in matches:
-            try:
-                data = json.loads(match)
-
-                # Check if it's a JobPosting
-                if isinstance(data, dict) and data.get('@type') == 'JobPosting':
-                    job = self._parse_json_ld_job(data)
-                    if job:
-                        jobs.append(job)
-
-                # Check if it's a list containing JobPostings
-                elif isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict) and item.get('@type') == 'JobPosting':
-                            job = self._parse_json_ld_job(item)
-                            if job:
-                                jobs.append(job)
-
-            except json.JSONDecodeError:
-                continue
+        for data in page.json_ld:
+            # Check if it's a JobPosting
+            if isinstance(data, dict) and data.get('@type') == 'JobPosting':
+                job = self._parse_json_ld_job(data)
+                if job:
+                    jobs.append(job)
+
+            # Check if it's a list containing JobPostings
+            elif isinstance(data, list):
+                for item in data:
+                    if isinstance(item, dict) and item.get('@type') == 'JobPosting':
+                        job = self._parse_json_ld_job(item)
+                        if job:
+                            jobs.append(job)
 
         if jobs:
             self.log(f"Found {len(jobs)} jobs via JSON-LD")
@@ -111,14 +103,13 @@ class GenericScraper(BaseScraper):
         except Exception:
             return None
 
-    def _try_greenhouse(self, html):
+    def _try_greenhouse(self, page):
         """Try to extract jobs from Greenhouse ATS."""
         self.log("Trying Greenhouse extraction...")
 
         # Greenhouse often embeds data in a specific div or script tag
         # Pattern varies, but commonly has class "job" or data-department
-        pattern = r'data-department="([^"]*)".*?data-title="([^"]*)".*?data-location="([^"]*)"'
-        matches = re.findall(pattern, html, re.DOTALL)
+        matches = page.attribute_groups('data-department', 'data-title', 'data-location')
 
         if matches:
             jobs = []
@@ -137,65 +128,58 @@ class GenericScraper(BaseScraper):
 
         return None
 
-    def _try_lever(self, html):
+    def _try_lever(self, page):
         """Try to extract jobs from Lever ATS."""
         self.log("Trying Lever extraction...")
 
-        # Lever often uses a specific JSON structure
-        pattern = r'window\.LEVER_JOBS\s*=\s*(\[.*?\]);'
-        match = re.search(pattern, html, re.DOTALL)
-
-        if match:
-            try:
-                jobs_data = json.loads(match.group(1))
-                jobs = []
+        # Lever often uses a specific JSON structure (window.LEVER_JOBS = [...])
+        jobs_data = page.assignment('LEVER_JOBS')
 
-                for job in jobs_data:
-                    jobs.append({
-                        'title': job.get('text', 'Not specified'),
-                        'department': job.get('categories', {}).get('team', 'Not specified'),
-                        'location': job.get('categories', {}).get('location', 'Not specified'),
-                        'posting_date': job.get('createdAt', 'Not specified'),
-                        'remote': 'Yes' if job.get('categories', {}).get('commitment') == 'Remote' else 'No',
-                        'region': 'Not specified',
-                        'url': job.get('hostedUrl', '')
-                    })
+        if isinstance(jobs_data, list):
+            jobs = []
 
-                self.log(f"Found {len(jobs)} jobs via Lever")
-                return jobs
+            for job in jobs_data:
+                jobs.append({
+                    'title': job.get('text', 'Not specified'),
+                    'department': job.get('categories', {}).get('team', 'Not specified'),
+                    'location': job.get('categories', {}).get('location', 'Not specified'),
+                    'posting_date': job.get('createdAt', 'Not specified'),
+                    'remote': 'Yes' if job.get('categories', {}).get('commitment') == 'Remote' else 'No',
+                    'region': 'Not specified',
+                    'url': job.get('hostedUrl', '')
+                })
 
-            except json.JSONDecodeError:
-                pass
+            self.log(f"Found {len(jobs)} jobs via Lever")
+            return jobs
 
         return None
 
-    def _try_json_data(self, html):
+    def _try_hydration(self, page):
+        """Try to extract jobs from framework hydration state (__NEXT_DATA__, __NUXT__, etc.)."""
+        self.log("Trying hydration state extraction...")
+
+        jobs = extract_hydration_jobs(page.html, self.config.get('hydration'), base_url=self.url,
+                                      blobs=page.blobs)
+        if jobs:
+            self.log(f"Found {len(jobs)} jobs via hydration state")
+        return jobs
+
+    def _try_json_data(self, page):
         """Try to find any JSON data containing job listings."""
         self.log("Trying generic JSON extraction...")
 
-        # Look for common variable names
-        patterns = [
-            r'var jobs\s*=\s*(\[.*?\]);',
-            r'let jobs\s*=\s*(\[.*?\]);',
-            r'const jobs\s*=\s*(\[.*?\]);',
-            r'window\.jobs\s*=\s*(\[.*?\]);',
-            r'"jobs"\s*:\s*(\[.*?\])',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, html, re.DOTALL | re.IGNORECASE)
-            if match:
-                try:
-                    jobs_data = json.loads(match.group(1))
-                    if isinstance(jobs_data, list) and len(jobs_data) > 0:
-                        # Try to parse if it looks like job data
-                        if isinstance(jobs_data[0], dict):
-                            jobs = self._parse_generic_json(jobs_data)
-                            if jobs:
-                                self.log(f"Found {len(jobs)} jobs via generic JSON")
-                                return jobs
-                except (json.JSONDecodeError, IndexError):
-                    continue
+        # Look for common variable names (var/let/const/window.jobs = [...]),
+        # then any "jobs": [...] key inside the page's decoded JSON
+        candidates = [page.assignment('jobs')] + page.keyed_arrays('jobs')
+
+        for jobs_data in candidates:
+            if isinstance(jobs_data, list) and len(jobs_data) > 0:
+                # Try to parse if it looks like job data
+                if isinstance(jobs_data[0], dict):
+                    jobs = self._parse_generic_json(jobs_data)
+                    if jobs:
+                        self.log(f"Found {len(jobs)} jobs via generic JSON")
+                        return jobs
 
         return None
 
@@ -5,21 +5,128 @@ Base class for scrapers that require JavaScript rendering.
 Uses Selenium with Chrome in headless mode.
 """
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 from scrapers.base_scraper import BaseScraper
+from scrapers.api_discovery import NetworkRecorder, write_suggestion
+from scrapers.hydration import extract_jobs as extract_hydration_jobs
+from scrapers.browser_pool import create_driver, get_browser_pool, get_blocked_url_patterns, set_blocked_urls
 import time
 
 
+# How often readiness probes are evaluated (seconds)
+READINESS_POLL_INTERVAL = 0.25
+
+# Defaults for wait_until_ready(). Subclasses override via the `readiness`
+# class attribute, companies via a "readiness" key in companies_config.json.
+DEFAULT_READINESS = {
+    'condition': 'dom_stable',  # dom_stable, network_idle or selector_stable
+    'selector': None,           # CSS selector for selector_stable
+    'quiet': 1.0,               # Seconds the probe must stay unchanged
+    'timeout': 15,              # Hard limit in seconds
+}
+
+# Each probe returns [document.readyState, value]. The page is ready once
+# readyState is 'complete' and value has not changed for `quiet` seconds.
+READINESS_PROBES = {
+    # Count DOM mutations in the current document (or frame)
+    'dom_stable': """
+        if (!window.__jobsMutationObserver) {
+            window.__jobsMutations = 0;
+            window.__jobsMutationObserver = new MutationObserver(function(records) {
+                window.__jobsMutations += records.length;
+            });
+            window.__jobsMutationObserver.observe(document.documentElement, {
+                childList: true, subtree: true, attributes: true, characterData: true
+            });
+        }
+        return [document.readyState, window.__jobsMutations];
+    """,
+    # Count finished resource requests (XHR/fetch/scripts/images)
+    'network_idle': """
+        if (!window.__jobsResourceBuffer) {
+            performance.setResourceTimingBufferSize(10000);
+            window.__jobsResourceBuffer = true;
+        }
+        return [document.readyState, performance.getEntriesByType('resource').length];
+    """,
+    # Count elements matching a selector (e.g. job cards)
+    'selector_stable': """
+        return [document.readyState, document.querySelectorAll(arguments[0]).length];
+    """,
+}
+
+# Runs an extract_rows() spec in the page. Mirrors Selenium semantics: text is
+# the rendered innerText, href/src are resolved to absolute URLs.
+EXTRACT_ROWS_SCRIPT = """
+    var containerSelector = arguments[0], fields = arguments[1];
+
+    function read(el, attr) {
+        if (!el) return null;
+        if (attr === 'text') return (el.innerText || el.textContent || '').trim();
+        if (attr === 'html') return el.innerHTML;
+        if (attr === 'tag') return el.tagName.toLowerCase();
+        if ((attr === 'href' || attr === 'src') && el[attr]) return el[attr];
+        return el.getAttribute(attr);
+    }
+
+    function resolveRoot(row, spec) {
+        var root = row;
+        if (spec.closest) root = root.closest(spec.closest);
+        if (root && spec.up) {
+            var until = spec.up_until || null;
+            for (var i = 0; i < spec.up && root; i++) {
+                root = root.parentElement;
+                if (until && root) {
+                    var text = root.innerText || '';
+                    if (until.some(function(s) { return text.indexOf(s) !== -1; })) return root;
+                }
+            }
+            if (until) return null;
+        }
+        return root;
+    }
+
+    function extract(row, spec) {
+        var attr = spec.attr || 'text';
+        var root = resolveRoot(row, spec);
+        if (!root) return spec.all ? [] : null;
+
+        if (spec.all) {
+            var els = spec.selector ? root.querySelectorAll(spec.selector) : [root];
+            return Array.prototype.map.call(els, function(el) { return read(el, attr); });
+        }
+        if (!spec.selector) return read(root, attr);
+
+        // A list of selectors is tried in order; the first non-empty value wins
+        var selectors = Array.isArray(spec.selector) ? spec.selector : [spec.selector];
+        for (var j = 0; j < selectors.length; j++) {
+            var value = read(root.querySelector(selectors[j]), attr);
+            if (value) return value;
+        }
+        return null;
+    }
+
+    var rows = document.querySelectorAll(containerSelector);
+    return Array.prototype.map.call(rows, function(row) {
+        var result = {};
+        Object.keys(fields).forEach(function(name) { result[name] = extract(row, fields[name]); });
+        return result;
+    });
+"""
+
+
 class HeadlessScraper(BaseScraper):
     """Base class for scrapers requiring headless browser."""
 
+    # Browser profile from scrapers.browser_pool.PROFILES
+    browser_profile = 'default'
+
+    # Readiness condition for load_page()/wait_until_ready(), merged over DEFAULT_READINESS
+    readiness = {}
+
     def __init__(self, company_config):
         """
         Initialize headless scraper.
@@ -29,40 +136,241 @@ class HeadlessScraper(BaseScraper):
         """
         super().__init__(company_config)
         self.driver = None
+        self._browser_pool = None
+        self.blocked_url_patterns = get_blocked_url_patterns(company_config.get('block_resources'))
+        self.page_load_times = []  # Seconds per load_page() call
+
+        # API discovery mode: record JSON network traffic and suggest a direct API config
+        self.network_recorder = NetworkRecorder() if company_config.get('discover_api') else None
 
     def _setup_driver(self):
-        """Set up Chrome driver in headless mode."""
+        """Set up Chrome driver in headless mode, reusing a pooled browser if available."""
         if self.driver:
             return
 
-        self.log("Setting up headless Chrome browser...")
-
-        chrome_options = Options()
-        chrome_options.add_argument('--headless=new')  # New headless mode
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        pool = get_browser_pool()
 
         try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            if self.network_recorder:
+                # Network capture needs its own browser with performance logging
+                self.log("Setting up headless Chrome browser with network capture (API discovery)...")
+                self.driver = create_driver(self.browser_profile, capture_network=True)
+            elif pool:
+                self.log(f"Acquiring headless Chrome browser from pool ({self.browser_profile})...")
+                self.driver = pool.acquire(self.browser_profile)
+                self._browser_pool = pool
+            else:
+                self.log("Setting up headless Chrome browser...")
+                self.driver = create_driver(self.browser_profile)
+
+            if self.blocked_url_patterns:
+                set_blocked_urls(self.driver, self.blocked_url_patterns)
+                self.log(f"Blocking {len(self.blocked_url_patterns)} resource URL patterns")
+
             self.log("Browser ready")
         except Exception as e:
             self.log(f"Failed to setup browser: {e}", "ERROR")
             raise
 
     def _close_driver(self):
-        """Close the browser."""
+        """Close the browser, or hand it back to the pool."""
         if self.driver:
             try:
-                self.driver.quit()
-                self.driver = None
-                self.log("Browser closed")
+                if self._browser_pool:
+                    self._browser_pool.release(self.driver)
+                    self.log("Browser returned to pool")
+                else:
+                    self.driver.quit()
+                    self.log("Browser closed")
             except Exception as e:
                 self.log(f"Error closing browser: {e}", "WARNING")
+            finally:
+                self.driver = None
+                self._browser_pool = None
+
+    def get_readiness(self, **overrides):
+        """
+        Resolve the readiness settings for this scraper.
+
+        Precedence: DEFAULT_READINESS, the class `readiness` attribute, the
+        company's "readiness" config (a condition name or a dict), then overrides.
+
+        Args:
+            **overrides: condition, selector, quiet or timeout for a single wait
+
+        Returns:
+            dict: Readiness settings
+        """
+        settings = dict(DEFAULT_READINESS)
+        settings.update(self.readiness)
+
+        configured = self.config.get('readiness')
+        if isinstance(configured, str):
+            settings['condition'] = configured
+        elif isinstance(configured, dict):
+            settings.update(configured)
+
+        settings.update({k: v for k, v in overrides.items() if v is not None})
+        return settings
+
+    def wait_until_ready(self, condition=None, selector=None, quiet=None, timeout=None):
+        """
+        Wait until the current page (or frame) is ready, instead of sleeping a fixed time.
+
+        Returns as soon as document.readyState is 'complete' and the chosen
+        condition has held for `quiet` seconds:
+            dom_stable      - no DOM mutations
+            network_idle    - no new resource requests finished
+            selector_stable - the number of elements matching `selector` is
+                              non-zero and unchanged
+
+        Args:
+            condition (str): Readiness condition (default from get_readiness())
+            selector (str): CSS selector for selector_stable
+            quiet (float): Seconds the condition must hold
+            timeout (float): Hard limit in seconds
+
+        Returns:
+            bool: True if the page became ready, False on timeout
+        """
+        settings = self.get_readiness(condition=condition, selector=selector, quiet=quiet, timeout=timeout)
+        condition = settings['condition']
+        selector = settings['selector']
+
+        if condition == 'selector_stable' and not selector:
+            self.log("selector_stable readiness needs a selector, using dom_stable", "WARNING")
+            condition = 'dom_stable'
+        if condition not in READINESS_PROBES:
+            self.log(f"Unknown readiness condition '{condition}', using dom_stable", "WARNING")
+            condition = 'dom_stable'
+
+        probe = READINESS_PROBES[condition]
+        start = time.monotonic()
+        deadline = start + settings['timeout']
+        last_value = None
+        stable_since = None
+
+        while True:
+            now = time.monotonic()
+            try:
+                ready_state, value = self.driver.execute_script(probe, selector)
+            except Exception:
+                # Page is navigating or the frame was replaced - probe again
+                ready_state, value = None, None
+
+            if ready_state != 'complete' or value != last_value:
+                last_value = value
+                stable_since = now
+            elif now - stable_since >= settings['quiet']:
+                if condition != 'selector_stable' or value:
+                    return True
+
+            if now >= deadline:
+                self.log(f"Page not ready after {settings['timeout']}s ({condition}), continuing", "WARNING")
+                return False
+
+            time.sleep(READINESS_POLL_INTERVAL)
+
+    def load_page(self, url, **readiness):
+        """
+        Navigate to a URL and wait until it is ready.
+
+        Args:
+            url (str): URL to load
+            **readiness: Overrides for wait_until_ready()
+
+        Returns:
+            bool: True if the page became ready, False on timeout
+        """
+        start = time.monotonic()
+        self.driver.get(url)
+        ready = self.wait_until_ready(**readiness)
+
+        if self.network_recorder:
+            self._capture_network()
+
+        elapsed = time.monotonic() - start
+        self.page_load_times.append(elapsed)
+        self.log(f"Page ready in {elapsed:.1f}s")
+        return ready
+
+    def _capture_network(self):
+        """Collect JSON responses seen so far (API discovery mode)."""
+        try:
+            self.network_recorder.capture(self.driver)
+        except Exception as e:
+            self.log(f"Network capture failed: {e}", "WARNING")
+
+    def _write_api_suggestion(self):
+        """Write the suggested direct-API config for this company (API discovery mode)."""
+        self._capture_network()
+        suggestion = self.network_recorder.suggest(self.config)
+
+        filepath = write_suggestion(suggestion, self.output_dir)
+        best = suggestion['suggestion']
+        if best:
+            self.log(f"API discovery: {best['method']} {best['api_url']} "
+                     f"({best['jobs_on_page']} jobs at '{best['jobs_path']}') -> {filepath}")
+        else:
+            self.log(f"API discovery: no job-like JSON in {suggestion['json_responses_captured']} "
+                     f"responses -> {filepath}", "WARNING")
+
+    def get_page_load_stats(self):
+        """
+        Summarize load_page() timings for this scrape.
+
+        Returns:
+            dict: Page count, total/average seconds and whether resources were blocked
+        """
+        total = sum(self.page_load_times)
+        count = len(self.page_load_times)
+        return {
+            'pages': count,
+            'total_seconds': round(total, 2),
+            'average_seconds': round(total / count, 2) if count else 0,
+            'resources_blocked': bool(self.blocked_url_patterns)
+        }
+
+    def extract_rows(self, container, fields=None):
+        """
+        Extract data for every element matching a selector in one browser round trip.
+
+        Looping over WebElements costs a WebDriver request per .text,
+        get_attribute() and find_element() call. This runs a single script
+        in the current page (or frame) and returns plain dicts instead.
+
+        Each field spec is a dict with optional keys:
+            selector - CSS selector inside the row (or a list tried in order,
+                       first non-empty value wins); omitted = the row itself
+            attr     - 'text' (default), 'html', 'tag' or an attribute name
+                       (href/src are returned as absolute URLs)
+            closest  - start from the closest ancestor matching this selector
+            up       - start from the ancestor this many levels up
+            up_until - with up: stop at the first ancestor whose text contains
+                       any of these strings (None if no ancestor matches)
+            all      - return a list with a value for every match
+
+        Example:
+            self.extract_rows('div.job-card', {
+                'title': {'selector': 'h3'},
+                'url': {'selector': 'a', 'attr': 'href'},
+            })
+
+        Args:
+            container (str): CSS selector for the row elements
+            fields (dict): Field name -> spec (default: row text and href)
+
+        Returns:
+            list: One dict per row, in document order
+        """
+        if fields is None:
+            fields = {'text': {}, 'url': {'attr': 'href'}}
+
+        try:
+            return self.driver.execute_script(EXTRACT_ROWS_SCRIPT, container, fields) or []
+        except Exception as e:
+            self.log(f"Row extraction failed for '{container}': {e}", "WARNING")
+            return []
 
     def wait_for_element(self, by, value, timeout=10):
         """
@@ -113,6 +421,12 @@ class HeadlessScraper(BaseScraper):
         Returns:
             list: List of job dictionaries
         """
+        # Sites that embed their data in the initial HTML need no browser
+        if self.config.get('hydration') and not self.network_recorder:
+            jobs = self._scrape_hydration()
+            if jobs:
+                return jobs
+
         try:
             self._setup_driver()
             jobs = self._scrape_jobs()
@@ -121,7 +435,36 @@ class HeadlessScraper(BaseScraper):
             self.log(f"Error during scraping: {e}", "ERROR")
             return []
         finally:
+            if self.network_recorder and self.driver:
+                self._write_api_suggestion()
             self._close_driver()
+            if self.page_load_times:
+                stats = self.get_page_load_stats()
+                blocking = 'on' if stats['resources_blocked'] else 'off'
+                self.log(f"Loaded {stats['pages']} pages in {stats['total_seconds']}s "
+                         f"(avg {stats['average_seconds']}s, resource blocking {blocking})")
+
+    def _scrape_hydration(self):
+        """
+        Try to get jobs from the page's hydration state with a single GET.
+
+        Uses the company's "hydration" config (true to auto-detect the job
+        list, or a dict with source/jobs_path/fields/url_template).
+
+        Returns:
+            list or None: Job dictionaries, or None to fall back to Chrome
+        """
+        self.log("Trying hydration state before starting Chrome...")
+        response = self.make_request(self.url)
+        if not response:
+            return None
+
+        jobs = extract_hydration_jobs(response.text, self.config['hydration'], base_url=self.url)
+        if jobs:
+            self.log(f"Completed (hydration state): {len(jobs)} jobs scraped without a browser")
+        else:
+            self.log("No hydration state found, falling back to Chrome")
+        return jobs
 
     def _scrape_jobs(self):
         """
@@ -0,0 +1,117 @@
+"""
+HTML Parser Backends
+
+Picks the fastest BeautifulSoup tree builder that is installed (lxml's C
+parser, falling back to the pure-Python html.parser) and can restrict parsing
+to a single container so large boards do not build a full document tree.
+"""
+
+import re
+from importlib.util import find_spec
+from bs4 import BeautifulSoup, SoupStrainer
+
+
+# Tree builders in order of preference (fastest first)
+PARSER_PREFERENCE = ['lxml', 'html.parser']
+
+# Modules each tree builder needs
+PARSER_MODULES = {
+    'lxml': 'lxml',
+    'html5lib': 'html5lib',
+    'html.parser': None,
+}
+
+# Selectors that can be turned into a SoupStrainer:
+# tag, #id, .class, tag.class, tag#id, [attr] and [attr="value"]
+SIMPLE_SELECTOR_PATTERN = re.compile(
+    r'^(?P<tag>[a-zA-Z][\w-]*)?'
+    r'(?:#(?P<id>[\w-]+))?'
+    r'(?:\.(?P<cls>[\w-]+))?'
+    r'(?:\[(?P<attr>[\w-]+)(?:=["\']?(?P<value>[^"\'\]]+)["\']?)?\])?$'
+)
+
+_available = None
+
+
+def available_parsers():
+    """
+    List the installed tree builders, fastest first.
+
+    Returns:
+        list: Parser names usable with BeautifulSoup
+    """
+    global _available
+
+    if _available is None:
+        _available = [
+            name for name, module in PARSER_MODULES.items()
+            if module is None or find_spec(module) is not None
+        ]
+        _available.sort(key=lambda name: PARSER_PREFERENCE.index(name)
+                        if name in PARSER_PREFERENCE else len(PARSER_PREFERENCE))
+    return _available
+
+
+def get_parser(preferred=None):
+    """
+    Choose the tree builder to use.
+
+    Args:
+        preferred (str): Parser requested in the company config, used if installed
+
+    Returns:
+        str: Parser name
+    """
+    parsers = available_parsers()
+    if preferred in parsers:
+        return preferred
+    return next(name for name in PARSER_PREFERENCE if name in parsers)
+
+
+def selector_strainer(selector):
+    """
+    Build a SoupStrainer matching a simple CSS selector.
+
+    Args:
+        selector (str): CSS selector, e.g. 'div#jobs', '.job-list', '[data-jobs]'
+
+    Returns:
+        SoupStrainer or None: None if the selector is too complex to strain on
+    """
+    match = SIMPLE_SELECTOR_PATTERN.match(selector.strip())
+    if not match or not any(match.groupdict().values()):
+        return None
+
+    attrs = {}
+    if match.group('id'):
+        attrs['id'] = match.group('id')
+    if match.group('cls'):
+        attrs['class'] = match.group('cls')
+    if match.group('attr'):
+        attrs[match.group('attr')] = match.group('value') or True
+
+    return SoupStrainer(match.group('tag'), attrs=attrs)
+
+
+def parse_html(html, parser=None, only=None):
+    """
+    Parse HTML into a BeautifulSoup tree with the fastest available backend.
+
+    Args:
+        html (str): Page HTML
+        parser (str): Preferred parser name (falls back if not installed)
+        only (str): CSS selector of the container to keep; if it can be
+            strained on, everything outside it is skipped while parsing
+
+    Returns:
+        BeautifulSoup: Parsed document (only the container if strained and found)
+    """
+    parser = get_parser(parser)
+
+    strainer = selector_strainer(only) if only else None
+    if strainer is not None:
+        soup = BeautifulSoup(html, parser, parse_only=strainer)
+        if soup.select_one(only):
+            return soup
+
+    return BeautifulSoup(html, parser)
@@ -0,0 +1,174 @@
+"""
+Single-Pass HTML Scanner
+
+Walks a page once with the standard library's HTMLParser and collects what
+GenericScraper's extraction strategies need: script blocks, JSON-LD, decoded
+JSON scripts and JavaScript assignments, and data-* attributes in document
+order. JSON is decoded with the bracket-matching scanner from
+scrapers.hydration, so the total work is linear in page size - unlike
+"data-a=.*?data-b=" or "\\[.*?\\]" regexes, which backtrack on large pages
+and stop at the first "]" inside the data.
+"""
+
+from html.parser import HTMLParser
+from scrapers.hydration import ASSIGNMENT_PATTERN, decode_json_at, revive_nuxt_payload
+
+
+JSON_SCRIPT_TYPES = {'application/json', 'application/ld+json'}
+
+
+class PageScan(HTMLParser):
+    """Collects scripts, JSON blobs and data attributes from one pass over a page."""
+
+    def __init__(self, html):
+        """
+        Scan a page.
+
+        Args:
+            html (str): Page HTML
+        """
+        super().__init__(convert_charrefs=True)
+        self.html = html
+        self.scripts = []          # (attrs dict, script text)
+        self.json_ld = []          # decoded application/ld+json payloads
+        self.blobs = []            # (source, data) - JSON scripts and JS assignments
+        self.data_attributes = []  # (name, value) for every data-* attribute, in order
+
+        self._script_attrs = None
+        self._script_chunks = []
+
+        self.feed(html)
+        self.close()
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name.startswith('data-'):
+                self.data_attributes.append((name, value or ''))
+
+        if tag == 'script':
+            self._script_attrs = {name: value or '' for name, value in attrs}
+            self._script_chunks = []
+
+    def handle_data(self, data):
+        if self._script_attrs is not None:
+            self._script_chunks.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'script' and self._script_attrs is not None:
+            attrs, text = self._script_attrs, ''.join(self._script_chunks)
+            self._script_attrs = None
+            self._script_chunks = []
+            self.scripts.append((attrs, text))
+            self._scan_script(attrs, text)
+
+    def _scan_script(self, attrs, text):
+        """Decode JSON script bodies and JavaScript assignments in one script."""
+        script_type = attrs.get('type', '').strip().lower()
+
+        if script_type in JSON_SCRIPT_TYPES:
+            start = len(text) - len(text.lstrip())
+            if start >= len(text) or text[start] not in '{[':
+                return
+            data, _ = decode_json_at(text, start)
+            if data is None:
+                return
+            if script_type == 'application/ld+json':
+                self.json_ld.append(data)
+
+            source = attrs.get('id') or 'application/json'
+            if source == '__NUXT_DATA__' and isinstance(data, list):
+                data = revive_nuxt_payload(data)
+            self.blobs.append((source, data))
+            return
+
+        # Inline JavaScript: decode each top-level assignment, skipping matches
+        # inside a literal that was already decoded so no text is scanned twice
+        decoded_until = 0
+        for match in ASSIGNMENT_PATTERN.finditer(text):
+            if match.start() < decoded_until:
+                continue
+            data, end = decode_json_at(text, match.end())
+            if data is not None:
+                self.blobs.append((match.group(1), data))
+                decoded_until = end
+
+    def assignment(self, name):
+        """
+        Get the value assigned to a JavaScript variable (case-insensitive).
+
+        Args:
+            name (str): Variable name, e.g. 'LEVER_JOBS'
+
+        Returns:
+            Decoded value of the first matching assignment, or None
+        """
+        name = name.lower()
+        for source, data in self.blobs:
+            if source.lower() == name:
+                return data
+        return None
+
+    def keyed_arrays(self, key):
+        """
+        Find lists stored under a key anywhere in the decoded blobs.
+
+        Args:
+            key (str): Object key (case-insensitive), e.g. 'jobs'
+
+        Returns:
+            list: Matching lists in document order
+        """
+        key = key.lower()
+        found = []
+        stack = [data for _, data in reversed(self.blobs)]
+
+        while stack:
+            data = stack.pop()
+            if isinstance(data, dict):
+                for item_key, value in data.items():
+                    if isinstance(value, list) and str(item_key).lower() == key:
+                        found.append(value)
+                stack.extend(reversed([v for v in data.values() if isinstance(v, (dict, list))]))
+            elif isinstance(data, list):
+                stack.extend(reversed([v for v in data if isinstance(v, (dict, list))]))
+
+        return found
+
+    def attribute_groups(self, *names):
+        """
+        Group data attributes that appear in a fixed order.
+
+        Walks the data attributes once and emits a tuple each time all names
+        have been seen in sequence, like the regex 'a=.*?b=.*?c=' without
+        the backtracking.
+
+        Args:
+            *names (str): Attribute names, e.g. 'data-department', 'data-title'
+
+        Returns:
+            list: Tuples of attribute values
+        """
+        groups = []
+        values = []
+
+        for name, value in self.data_attributes:
+            if name == names[len(values)]:
+                values.append(value)
+                if len(values) == len(names):
+                    groups.append(tuple(values))
+                    values = []
+
+        return groups
+
+
+def scan_page(html):
+    """
+    Scan a page once.
+
+    Args:
+        html (str): Page HTML
+
+    Returns:
+        PageScan: Collected scripts, JSON blobs and data attributes
+    """
+    return PageScan(html)
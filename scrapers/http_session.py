@@ -0,0 +1,95 @@
+"""
+Shared HTTP Session
+
+Process-wide connection pooling for all scrapers.
+Connections are kept alive per host, so paginated APIs (Workday, Oracle HCM)
+reuse one TCP+TLS connection instead of opening a new one for every request.
+"""
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+DEFAULT_TIMEOUT = 30
+
+_lock = threading.Lock()
+_local = threading.local()
+_adapter = None
+_generation = 0
+_pool_settings = {
+    'pool_connections': 50,  # Number of hosts to keep pools for
+    'pool_maxsize': 10,      # Connections kept alive per host
+}
+
+
+def configure_session(pool_connections=None, pool_maxsize=None):
+    """
+    Configure connection pool sizes for the shared session.
+
+    Sessions created before the call are remounted on their next use.
+
+    Args:
+        pool_connections (int): Number of per-host pools to cache
+        pool_maxsize (int): Maximum connections kept alive per host
+    """
+    global _adapter, _generation
+
+    with _lock:
+        if pool_connections:
+            _pool_settings['pool_connections'] = pool_connections
+        if pool_maxsize:
+            _pool_settings['pool_maxsize'] = pool_maxsize
+        if _adapter is not None:
+            _adapter.close()
+        _adapter = None
+        _generation += 1
+
+
+def _get_adapter():
+    """Get the process-wide HTTP adapter, creating it on first use."""
+    global _adapter
+
+    with _lock:
+        if _adapter is None:
+            _adapter = HTTPAdapter(**_pool_settings)
+        return _adapter, _generation
+
+
+def get_session():
+    """
+    Get the HTTP session for the current thread.
+
+    Each thread has its own Session (cookies are not shared between threads),
+    but every session is mounted on the same adapter, so the underlying
+    connection pools are shared across the whole process.
+
+    Returns:
+        requests.Session: Session with default headers and pooled connections
+    """
+    adapter, generation = _get_adapter()
+    session = getattr(_local, 'session', None)
+
+    if session is None or getattr(_local, 'generation', None) != generation:
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _local.session = session
+        _local.generation = generation
+
+    return session
+
+
+def close_session():
+    """Close all pooled connections."""
+    global _adapter, _generation
+
+    with _lock:
+        if _adapter is not None:
+            _adapter.close()
+        _adapter = None
+        _generation += 1
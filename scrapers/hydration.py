@@ -0,0 +1,458 @@
+"""
+Hydration State Extractor
+
+Many JavaScript career sites ship their full job data in the initial HTML so
+the client app can hydrate without another request: Next.js (__NEXT_DATA__),
+Nuxt (__NUXT__ / __NUXT_DATA__), Redux-style window.__INITIAL_STATE__ and
+Apollo caches. This module finds those blobs, decodes them with a
+balanced-brace scanner (regexes with .*? stop at the first "]" or "};" inside
+the data) and maps the job records to the standard job schema.
+"""
+
+import json
+import re
+from scrapers.api_discovery import find_job_arrays, score_job_array
+
+
+# Assignments like: window.__INITIAL_STATE__ = {...}  /  var jobPostings = [...]
+ASSIGNMENT_PATTERN = re.compile(
+    r'(?:window\.|self\.|var\s+|let\s+|const\s+)([A-Za-z_$][\w$]*)\s*=\s*(?=[\[{])'
+)
+# JSON script tags: <script id="__NEXT_DATA__" type="application/json">{...}</script>
+JSON_SCRIPT_PATTERN = re.compile(
+    r'<script\b([^>]*)type=["\']application/(?:ld\+)?json["\']([^>]*)>',
+    re.IGNORECASE
+)
+SCRIPT_ID_PATTERN = re.compile(r'\bid=["\']([^"\']+)["\']', re.IGNORECASE)
+
+# Fields we map to, with the source keys tried when no field paths are configured
+FIELD_CANDIDATES = {
+    'title': ['title', 'jobTitle', 'job_title', 'postingTitle', 'positionTitle', 'name', 'text'],
+    'department': ['department', 'departments', 'team', 'category', 'jobFamily', 'function'],
+    'location': ['location', 'locations', 'locationsText', 'city', 'jobLocation', 'office'],
+    'posting_date': ['postedOn', 'postedDate', 'posted_date', 'datePosted', 'publishedAt',
+                     'createdAt', 'created_at', 'updatedAt'],
+    'url': ['url', 'absolute_url', 'hostedUrl', 'applyUrl', 'jobUrl', 'externalPath', 'link'],
+}
+
+# Keys used to turn nested objects (e.g. {"name": "Paris"}) into text
+NAME_KEYS = ['name', 'label', 'title', 'text', 'value', 'LocalizedName', 'city']
+
+_JS_LITERALS = {'undefined': 'null', 'NaN': 'null', 'Infinity': 'null'}
+_decoder = json.JSONDecoder()
+
+
+def scan_balanced(text, start):
+    """
+    Find the end of the JSON/JS object or array starting at text[start].
+
+    Brackets inside single-, double- and back-quoted strings are ignored.
+
+    Args:
+        text (str): Source text
+        start (int): Index of the opening '{' or '['
+
+    Returns:
+        int or None: Index just past the matching close bracket, or None if unbalanced
+    """
+    depth = 0
+    quote = None
+    i = start
+    length = len(text)
+
+    while i < length:
+        char = text[i]
+        if quote:
+            if char == '\\':
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in '"\'`':
+            quote = char
+        elif char in '{[':
+            depth += 1
+        elif char in '}]':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+
+    return None
+
+
+def _string_end(text, start):
+    """Index just past the quoted string starting at text[start]."""
+    quote = text[start]
+    i = start + 1
+    while i < len(text):
+        if text[i] == '\\':
+            i += 2
+            continue
+        if text[i] == quote:
+            return i + 1
+        i += 1
+    return len(text)
+
+
+def _js_to_json(segment):
+    """
+    Convert a JavaScript object literal into JSON.
+
+    Handles unquoted keys, single-quoted strings, undefined/NaN/!0/!1 and
+    trailing commas, which bundlers commonly emit in state blobs.
+    """
+    out = []
+    last = ''  # Last significant character outside strings
+    i = 0
+    length = len(segment)
+
+    while i < length:
+        char = segment[i]
+
+        if char == '"':
+            end = _string_end(segment, i)
+            out.append(segment[i:end])
+            last, i = '"', end
+        elif char == "'":
+            end = _string_end(segment, i)
+            body = segment[i + 1:end - 1].replace("\\'", "'").replace('"', '\\"')
+            out.append(f'"{body}"')
+            last, i = '"', end
+        elif char.isalpha() or char in '_$':
+            j = i
+            while j < length and (segment[j].isalnum() or segment[j] in '_$'):
+                j += 1
+            word = segment[i:j]
+            k = j
+            while k < length and segment[k].isspace():
+                k += 1
+            if last in '{,' and k < length and segment[k] == ':':
+                out.append(json.dumps(word))  # Unquoted key
+            else:
+                out.append(_JS_LITERALS.get(word, word))
+            last, i = word[-1], j
+        elif char == '!' and segment[i + 1:i + 2] in ('0', '1'):
+            out.append('true' if segment[i + 1] == '0' else 'false')
+            last, i = 'e', i + 2
+        else:
+            if char in '}]' and last == ',':
+                # Drop trailing comma: {"a": 1,} / [1, 2,]
+                comma = len(out) - 1 - out[::-1].index(',')
+                del out[comma]
+            out.append(char)
+            if not char.isspace():
+                last = char
+            i += 1
+
+    return ''.join(out)
+
+
+def decode_json_at(text, start):
+    """
+    Decode the JSON object or array starting at text[start].
+
+    Args:
+        text (str): Source text
+        start (int): Index of the opening '{' or '['
+
+    Returns:
+        tuple: (data, end) on success, (None, start) if it cannot be decoded
+    """
+    # Valid JSON: let the C decoder find the end
+    try:
+        return _decoder.raw_decode(text, start)
+    except ValueError:
+        pass
+
+    # JavaScript object literal: find its extent, then patch JS-only tokens
+    end = scan_balanced(text, start)
+    if end is None:
+        return None, start
+
+    try:
+        return json.loads(_js_to_json(text[start:end])), end
+    except ValueError:
+        return None, start
+
+
+def revive_nuxt_payload(payload):
+    """
+    Rebuild the object tree from a Nuxt 3 __NUXT_DATA__ payload.
+
+    The payload is a flat array where containers refer to other entries by
+    index and wrappers look like ["Reactive", index].
+
+    Args:
+        payload (list): Decoded __NUXT_DATA__ array
+
+    Returns:
+        Revived root object
+    """
+    cache = {}
+
+    def revive(index):
+        if not isinstance(index, int) or index < 0 or index >= len(payload):
+            return None
+        if index in cache:
+            return cache[index]
+
+        value = payload[index]
+        if isinstance(value, list):
+            if len(value) == 2 and isinstance(value[0], str):
+                # Wrapper such as ["Reactive", 3], ["Ref", 5], ["Date", "..."]
+                result = revive(value[1]) if isinstance(value[1], int) else value[1]
+                cache[index] = result
+                return result
+            result = []
+            cache[index] = result
+            result.extend(revive(item) for item in value)
+            return result
+        if isinstance(value, dict):
+            result = {}
+            cache[index] = result
+            for key, item in value.items():
+                result[key] = revive(item)
+            return result
+
+        cache[index] = value
+        return value
+
+    return revive(0)
+
+
+def extract_hydration_blobs(html):
+    """
+    Find and decode every hydration blob in a page.
+
+    Args:
+        html (str): Page HTML
+
+    Returns:
+        list: (source, data) tuples, where source is the variable name or
+            script id (e.g. '__NEXT_DATA__', '__INITIAL_STATE__')
+    """
+    blobs = []
+
+    for match in JSON_SCRIPT_PATTERN.finditer(html):
+        id_match = SCRIPT_ID_PATTERN.search(match.group(1) + match.group(2))
+        source = id_match.group(1) if id_match else 'application/json'
+        start = match.end()
+        while start < len(html) and html[start].isspace():
+            start += 1
+        if start >= len(html) or html[start] not in '{[':
+            continue
+
+        data, _ = decode_json_at(html, start)
+        if data is None:
+            continue
+        if source == '__NUXT_DATA__' and isinstance(data, list):
+            data = revive_nuxt_payload(data)
+        blobs.append((source, data))
+
+    for match in ASSIGNMENT_PATTERN.finditer(html):
+        data, _ = decode_json_at(html, match.end())
+        if data is not None:
+            blobs.append((match.group(1), data))
+
+    return blobs
+
+
+def resolve_path(data, path):
+    """
+    Follow a dotted path such as 'props.pageProps.jobs' or 'data.items.0'.
+
+    Args:
+        data: Decoded JSON
+        path (str): Dotted path (empty for data itself)
+
+    Returns:
+        Value at the path, or None if it does not exist
+    """
+    if not path:
+        return data
+
+    for part in path.split('.'):
+        if isinstance(data, dict):
+            data = data.get(part)
+        elif isinstance(data, list) and part.lstrip('-').isdigit():
+            index = int(part)
+            data = data[index] if -len(data) <= index < len(data) else None
+        else:
+            return None
+        if data is None:
+            return None
+
+    return data
+
+
+def _apollo_records(data):
+    """Collect job-like records from a normalized Apollo cache ({"Job:1": {...}})."""
+    if not isinstance(data, dict):
+        return []
+    return [
+        value for value in data.values()
+        if isinstance(value, dict)
+        and re.search(r'job|posting|opportunit|requisition', str(value.get('__typename', '')), re.IGNORECASE)
+    ]
+
+
+def find_job_records(blobs, source=None, jobs_path=None):
+    """
+    Locate the list of job records inside decoded hydration blobs.
+
+    Args:
+        blobs (list): Result of extract_hydration_blobs()
+        source (str): Only consider blobs from this source
+        jobs_path (str): Dotted path to the job list; if omitted, the most
+            job-like array anywhere in the blobs is used
+
+    Returns:
+        list: Job records (dicts), empty if none were found
+    """
+    best, best_score = [], 0
+
+    for blob_source, data in blobs:
+        if source and blob_source != source:
+            continue
+
+        if jobs_path:
+            records = resolve_path(data, jobs_path)
+            if isinstance(records, dict):
+                records = list(records.values())
+            if isinstance(records, list) and records:
+                return [r for r in records if isinstance(r, dict)]
+            continue
+
+        for candidate in find_job_arrays(data):
+            if candidate['score'] > best_score:
+                best, best_score = resolve_array(data, candidate['path']), candidate['score']
+
+        apollo = _apollo_records(data)
+        if apollo and score_job_array(apollo) > best_score:
+            best, best_score = apollo, score_job_array(apollo)
+
+    return best
+
+
+def resolve_array(data, path):
+    """Resolve a find_job_arrays() path (which may contain '[]' steps) to the list."""
+    for part in path.split('.') if path else []:
+        steps = part.split('[]')
+        if steps[0]:
+            data = data.get(steps[0]) if isinstance(data, dict) else None
+        for _ in steps[1:]:
+            data = data[0] if isinstance(data, list) and data else None
+        if data is None:
+            return []
+    return data if isinstance(data, list) else []
+
+
+def to_text(value):
+    """
+    Turn a field value into display text.
+
+    Nested objects use their name/label, lists are joined with '; '.
+
+    Args:
+        value: Field value from a job record
+
+    Returns:
+        str: Text ('' if empty)
+    """
+    if value is None:
+        return ''
+    if isinstance(value, dict):
+        for key in NAME_KEYS:
+            if value.get(key):
+                return to_text(value[key])
+        return ''
+    if isinstance(value, list):
+        return '; '.join(text for text in (to_text(item) for item in value) if text)
+    return str(value).strip()
+
+
+def map_job(record, fields=None, url_template=None, base_url=None):
+    """
+    Map one job record to the standard job schema.
+
+    Args:
+        record (dict): Job record from a hydration blob
+        fields (dict): Job column -> dotted path in the record (optional;
+            common key names are tried for any column not listed)
+        url_template (str): Format string for the job URL using record keys,
+            e.g. 'https://example.com/jobs/{id}'
+        base_url (str): Base for relative URLs
+
+    Returns:
+        dict or None: Job dictionary, or None if the record has no title
+    """
+    fields = fields or {}
+    values = {}
+
+    for column, candidates in FIELD_CANDIDATES.items():
+        if column in fields:
+            values[column] = to_text(resolve_path(record, fields[column]))
+            continue
+        values[column] = ''
+        for key in candidates:
+            if record.get(key):
+                values[column] = to_text(record[key])
+                break
+
+    if not values['title']:
+        return None
+
+    url = values['url']
+    if url_template:
+        try:
+            url = url_template.format(**record)
+        except (KeyError, IndexError, ValueError):
+            pass
+    if url and base_url and not url.startswith('http'):
+        from urllib.parse import urljoin
+        url = urljoin(base_url, url)
+
+    location = values['location'] or 'Not specified'
+    return {
+        'title': values['title'],
+        'department': values['department'] or 'Not specified',
+        'location': location,
+        'posting_date': values['posting_date'] or 'Not specified',
+        'remote': 'Yes' if 'remote' in location.lower() or 'remote' in values['title'].lower() else 'No',
+        'region': 'Not specified',
+        'url': url
+    }
+
+
+def extract_jobs(html, settings=None, base_url=None, blobs=None):
+    """
+    Extract jobs from a page's hydration state.
+
+    Args:
+        html (str): Page HTML
+        settings (dict): Company "hydration" config, all keys optional:
+            source (blob name), jobs_path (dotted path to the job list),
+            fields (column -> dotted path), url_template
+        base_url (str): Base for relative job URLs
+        blobs (list): Already decoded (source, data) blobs, e.g. from
+            scrapers.html_scan - html is not scanned again if given
+
+    Returns:
+        list or None: Job dictionaries, or None if nothing was found
+    """
+    settings = settings if isinstance(settings, dict) else {}
+
+    if blobs is None:
+        blobs = extract_hydration_blobs(html)
+    if not blobs:
+        return None
+
+    records = find_job_records(blobs, source=settings.get('source'), jobs_path=settings.get('jobs_path'))
+
+    jobs = []
+    for record in records:
+        job = map_job(record, settings.get('fields'), settings.get('url_template'), base_url)
+        if job:
+            jobs.append(job)
+
+    return jobs or None
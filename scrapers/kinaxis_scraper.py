@@ -6,12 +6,13 @@ Scrapes job postings from Kinaxis's iCIMS careers page using headless browser.
 
 from selenium.webdriver.common.by import By
 from scrapers.headless_scraper import HeadlessScraper
-import time
 
 
 class KinaxisScraper(HeadlessScraper):
     """Scraper for Kinaxis careers site (iCIMS platform)."""
 
+    readiness = {'condition': 'network_idle'}
+
     def _scrape_jobs(self):
         """
         Scrape jobs from Kinaxis using headless browser.
@@ -23,19 +24,18 @@ class KinaxisScraper(HeadlessScraper):
 
         # iCIMS loads job content in an iframe - load the page
         iframe_url = self.url.rstrip('/') + '/jobs/search?in_iframe=1'
-        self.driver.get(iframe_url)
+        # iCIMS can be slow to load
+        self.load_page(iframe_url, timeout=20)
         self.log(f"Loaded page: {iframe_url}")
 
-        # Wait for page to load
-        time.sleep(8)  # iCIMS can be slow to load
-
         # Switch to the iCIMS content iframe
         self.log("Looking for iCIMS content iframe...")
         try:
             iframe = self.driver.find_element(By.ID, 'icims_content_iframe')
             self.driver.switch_to.frame(iframe)
             self.log("Switched to icims_content_iframe")
-            time.sleep(5)  # Wait for iframe content to load
+            # Wait for iframe content to load
+            self.wait_until_ready(condition='selector_stable', selector='a[href*="/jobs/"]')
         except Exception as e:
             self.log(f"Could not find/switch to iframe: {e}", "WARNING")
 
@@ -63,16 +63,24 @@ class KinaxisScraper(HeadlessScraper):
                            'Customer Service', 'Sales', 'Information Technology', 
                            'Product Management', 'Business Development', 'Strategy/Planning']
 
-        for link in job_links:
+        # Read every link and its job container in one round trip. The container is
+        # the closest ancestor (up to 6 levels) whose text has the job metadata.
+        rows = self.extract_rows('a[href*="/jobs/"]', {
+            'url': {'attr': 'href'},
+            'text': {},
+            'container_text': {'up': 6, 'up_until': ['Category', 'Location']},
+        })
+
+        for link in rows:
             try:
-                url = link.get_attribute('href')
+                url = link['url']
                 
                 # Skip search URLs and already seen URLs
                 if not url or 'search' in url or url in seen_urls:
                     continue
                 
                 # Get the raw title text and clean it
-                raw_title = link.text.strip()
+                raw_title = (link['text'] or '').strip()
                 if not raw_title:
                     continue
                 
@@ -84,67 +92,53 @@ class KinaxisScraper(HeadlessScraper):
                     
                 seen_urls.add(url)
 
-                # Try to find location and department by traversing the DOM
                 location = 'Not specified'
                 department = 'Not specified'
                 remote = 'No'
                 posting_date = 'Not specified'
 
-                try:
-                    # Navigate up to find the job container
-                    parent = link
-                    for _ in range(6):  # Try up to 6 levels up
-                        try:
-                            parent = parent.find_element(By.XPATH, './..')
-                            parent_text = parent.text
-                            
-                            # Check if this parent contains job metadata
-                            if 'Category' in parent_text or 'Location' in parent_text:
-                                lines = parent_text.split('\n')
-                                
-                                for i, line in enumerate(lines):
-                                    line_stripped = line.strip()
-                                    line_lower = line_stripped.lower()
-                                    
-                                    # Extract location from Location field or location patterns
-                                    if line_lower == 'location' and i + 1 < len(lines):
-                                        next_line = lines[i + 1].strip()
-                                        if next_line and location == 'Not specified':
-                                            location = next_line
-                                    
-                                    # Extract category/department
-                                    if line_lower == 'category' and i + 1 < len(lines):
-                                        next_line = lines[i + 1].strip()
-                                        if next_line in valid_departments and department == 'Not specified':
-                                            department = next_line
-                                    elif line_stripped in valid_departments and department == 'Not specified':
-                                        department = line_stripped
-                                    
-                                    # Check for remote status
-                                    if line_lower == 'remote yes':
-                                        remote = 'Yes'
-                                    elif line_lower == 'remote no':
-                                        remote = 'No'
-                                    elif line_lower.startswith('remote') and i + 1 < len(lines):
-                                        next_line = lines[i + 1].strip().lower()
-                                        if next_line == 'yes':
-                                            remote = 'Yes'
-                                        elif next_line == 'no':
-                                            remote = 'No'
-                                        
-                                    # Extract posting date
-                                    if 'days ago' in line_lower or 'posted today' in line_lower:
-                                        posting_date = line_stripped
-                                    elif 'posted date' in line_lower and i + 1 < len(lines):
-                                        next_line = lines[i + 1].strip()
-                                        if 'ago' in next_line.lower() or '/' in next_line:
-                                            posting_date = next_line
-                                
-                                break  # Found the container with job info
-                        except:
-                            continue
-                except Exception as e:
-                    pass
+                # Extract metadata from the job container, if one was found
+                parent_text = link['container_text']
+                if parent_text:
+                    lines = parent_text.split('\n')
+
+                    for i, line in enumerate(lines):
+                        line_stripped = line.strip()
+                        line_lower = line_stripped.lower()
+
+                        # Extract location from Location field or location patterns
+                        if line_lower == 'location' and i + 1 < len(lines):
+                            next_line = lines[i + 1].strip()
+                            if next_line and location == 'Not specified':
+                                location = next_line
+
+                        # Extract category/department
+                        if line_lower == 'category' and i + 1 < len(lines):
+                            next_line = lines[i + 1].strip()
+                            if next_line in valid_departments and department == 'Not specified':
+                                department = next_line
+                        elif line_stripped in valid_departments and department == 'Not specified':
+                            department = line_stripped
+
+                        # Check for remote status
+                        if line_lower == 'remote yes':
+                            remote = 'Yes'
+                        elif line_lower == 'remote no':
+                            remote = 'No'
+                        elif line_lower.startswith('remote') and i + 1 < len(lines):
+                            next_line = lines[i + 1].strip().lower()
+                            if next_line == 'yes':
+                                remote = 'Yes'
+                            elif next_line == 'no':
+                                remote = 'No'
+
+                        # Extract posting date
+                        if 'days ago' in line_lower or 'posted today' in line_lower:
+                            posting_date = line_stripped
+                        elif 'posted date' in line_lower and i + 1 < len(lines):
+                            next_line = lines[i + 1].strip()
+                            if 'ago' in next_line.lower() or '/' in next_line:
+                                posting_date = next_line
 
                 # Check if remote is in title or location
                 if remote == 'No' and ('remote' in title.lower() or 'remote' in location.lower()):
@@ -7,6 +7,11 @@ Lever is another popular ATS used by many companies.
 
 import json
 from scrapers.base_scraper import BaseScraper
+from scrapers.pagination import Page
+
+
+PAGE_SIZE = 100
+MAX_PAGES = 50  # Safety limit (5,000 postings)
 
 
 class LeverScraper(BaseScraper):
@@ -34,29 +39,37 @@ class LeverScraper(BaseScraper):
 
         self.log(f"Fetching from Lever API: {api_url}")
 
-        # Add query parameters
-        params = {
-            'mode': 'json',
-            'skip': 0,
-            'limit': 100
-        }
+        # Lever reports no total, so pages are fetched until one comes back short
+        def fetch(skip):
+            params = {
+                'mode': 'json',
+                'skip': skip,
+                'limit': PAGE_SIZE
+            }
 
-        response = self.make_request(api_url, params=params)
+            response = self.make_request(api_url, params=params)
+            if not response:
+                return None
 
-        if not response:
-            self.log("Failed to fetch from Lever API", "ERROR")
-            return []
+            try:
+                page = response.json()
+            except json.JSONDecodeError as e:
+                self.log(f"Failed to parse JSON response (skip: {skip}): {e}", "ERROR")
+                return None
 
-        try:
-            job_list = response.json()
-        except json.JSONDecodeError as e:
-            self.log(f"Failed to parse JSON response: {e}", "ERROR")
-            return []
+            if not isinstance(page, list):
+                self.log(f"Unexpected response format: {type(page)}", "ERROR")
+                return None
+
+            return Page(page)
 
-        if not isinstance(job_list, list):
-            self.log(f"Unexpected response format: {type(job_list)}", "ERROR")
+        first = fetch(0)
+        if first is None:
+            self.log("Failed to fetch from Lever API", "ERROR")
             return []
 
+        job_list = self.paginate(fetch, page_size=PAGE_SIZE, first=first, max_pages=MAX_PAGES)
+
         jobs = []
         for job in job_list:
             try:
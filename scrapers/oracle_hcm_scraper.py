@@ -8,8 +8,12 @@ Uses the REST API endpoint for recruiting job requisitions.
 import json
 import re
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
 from scrapers.base_scraper import BaseScraper
+from scrapers.pagination import Page
+
+
+PAGE_SIZE = 25
+MAX_PAGES = 100  # Safety limit (2,500 postings)
 
 
 class OracleHCMScraper(BaseScraper):
@@ -27,14 +31,11 @@ class OracleHCMScraper(BaseScraper):
         parsed = urlparse(self.url)
         host = f"{parsed.scheme}://{parsed.netloc}"
 
-        # Try REST API first
-        jobs = self._try_rest_api(host)
-        if jobs:
-            return jobs
-
-        # Fallback to HTML parsing
-        self.log("REST API failed, trying HTML parsing...")
-        return self._parse_html(host)
+        # REST API, falling back to HTML parsing (last run's winner first)
+        return self.run_strategies([
+            ('rest_api', self._try_rest_api),
+            ('html', self._parse_html),
+        ], host) or []
 
     def _extract_site_code(self):
         """Extract the site code from the career page URL path."""
@@ -52,12 +53,7 @@ class OracleHCMScraper(BaseScraper):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
         }
 
-        all_jobs = []
-        offset = 0
-        page_size = 25
-        total_jobs = None
-
-        while True:
+        def fetch(offset):
             # Oracle HCM uses finder params with semicolons and commas
             # Pagination offset goes inside the finder param
             finder = f"findReqs;siteNumber={site_code}"
@@ -68,47 +64,41 @@ class OracleHCMScraper(BaseScraper):
                 'onlyData': 'true',
                 'expand': 'requisitionList',
                 'finder': finder,
-                'limit': page_size,
+                'limit': PAGE_SIZE,
                 'offset': 0
             }
 
             response = self.make_request(api_url, headers=headers, params=params)
             if not response:
-                break
+                return None
 
             try:
                 data = response.json()
             except (json.JSONDecodeError, ValueError):
-                break
-
-            items = data.get('items', [])
-            if not items:
-                break
+                return None
 
             # Jobs are nested: items[0].requisitionList
-            for item in items:
-                if total_jobs is None:
-                    total_jobs = item.get('TotalJobsCount', 0)
-                    self.log(f"Total jobs reported by API: {total_jobs}")
-
+            requisitions, total = [], None
+            for item in data.get('items', []):
+                if total is None:
+                    total = item.get('TotalJobsCount') or None
                 req_list = item.get('requisitionList', [])
-                if not isinstance(req_list, list):
-                    continue
-
-                for r in req_list:
-                    job = self._parse_api_job(r, host, site_code)
-                    if job:
-                        all_jobs.append(job)
+                if isinstance(req_list, list):
+                    requisitions.extend(req_list)
 
-            # Check if we have all jobs
-            if total_jobs and len(all_jobs) >= total_jobs:
-                break
+            return Page(requisitions, total)
 
-            offset += page_size
+        first = fetch(0)
+        if first is None:
+            return None
+        if first.total is not None:
+            self.log(f"Total jobs reported by API: {first.total}")
 
-            # Safety limit
-            if offset > 500:
-                break
+        all_jobs = []
+        for r in self.paginate(fetch, page_size=PAGE_SIZE, first=first, max_pages=MAX_PAGES):
+            job = self._parse_api_job(r, host, site_code)
+            if job:
+                all_jobs.append(job)
 
         if all_jobs:
             self.log(f"Completed (API): {len(all_jobs)} jobs scraped")
@@ -153,7 +143,7 @@ class OracleHCMScraper(BaseScraper):
         if not response:
             return []
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = self.parse_html(response.text)
         jobs = []
 
         # Oracle HCM renders job cards with various structures
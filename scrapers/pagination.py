@@ -0,0 +1,209 @@
+"""
+Pagination Engine
+
+Shared pagination for scrapers that page through job listings. Supports
+offset/limit, page-number and cursor schemes. The first page is fetched on
+its own; when it reports a total, the remaining pages are known up front and
+are fetched concurrently in a bounded window. Without a total, windows of
+pages are fetched speculatively until an empty or short page shows the end.
+Results always come back in page order.
+"""
+
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+
+
+DEFAULT_PAGE_CONCURRENCY = 4
+
+PAGINATION_STYLES = ('offset', 'page', 'cursor')
+
+# What a fetch callback returns for one page. total is the number of items
+# (not pages) and is only read from the first page; cursor is the position of
+# the next page for cursor pagination; size is the number of results the site
+# returned, before the scraper dropped duplicates or filtered any out (defaults
+# to the number of items). Page sizes and short last pages are judged by size.
+Page = namedtuple('Page', ['items', 'total', 'cursor', 'size'], defaults=[None, None, None])
+
+
+def _page_size(page):
+    """Number of results the site returned for a page."""
+    return page.size if page.size is not None else len(page.items)
+
+
+def _page_positions(style, start, page_size, total, max_pages):
+    """
+    Positions of the pages after the first one.
+
+    Args:
+        style (str): 'offset' or 'page'
+        start (int): Position of the first page
+        page_size (int): Items per page
+        total (int or None): Total items, if known
+        max_pages (int or None): Safety limit on the number of pages
+
+    Returns:
+        iterator: Positions (offsets or page numbers), endless if total is unknown
+    """
+    step = page_size if style == 'offset' else 1
+
+    if total is not None:
+        pages = -(-total // page_size)  # ceiling division
+        positions = iter(range(start + step, start + pages * step, step))
+    else:
+        positions = count(start + step, step)
+
+    if max_pages is not None:
+        positions = (p for _, p in zip(range(max_pages - 1), positions))
+    return positions
+
+
+def paginate(fetch_page, style='offset', start=0, page_size=None, first=None,
+             concurrency=DEFAULT_PAGE_CONCURRENCY, max_pages=None, log=None):
+    """
+    Fetch every page of a listing.
+
+    Args:
+        fetch_page (callable): Takes a position (offset, page number or cursor)
+            and returns a Page, or None if the request failed
+        style (str): 'offset', 'page' or 'cursor'
+        start: Position of the first page (offset, page number or initial cursor)
+        page_size (int): Items requested per page. If omitted, or if the first
+            page returns fewer results than requested while more remain, the
+            first page's size is used
+        first (Page): Already-fetched first page, to avoid fetching it again
+        concurrency (int): Pages in flight at once (1 fetches sequentially)
+        max_pages (int): Safety limit on the number of pages
+        log (callable): Logger taking (message, level)
+
+    Returns:
+        list: Items of all pages in page order (empty if the first page failed)
+    """
+    if style not in PAGINATION_STYLES:
+        raise ValueError(f"Unsupported pagination style: {style}")
+
+    log = log or (lambda message, level='INFO': None)
+
+    if first is None:
+        first = fetch_page(start)
+        if first is None:
+            log("Failed to fetch first page", "ERROR")
+            return []
+
+    items = list(first.items)
+    if not items:
+        return items
+
+    if style == 'cursor':
+        return items + _follow_cursor(fetch_page, first.cursor, max_pages, log)
+
+    total = first.total
+    if total is not None and total <= len(items):
+        return items
+
+    # Servers may cap the page size below what was asked for
+    first_size = _page_size(first)
+    if not page_size or (first_size < page_size and total is not None):
+        page_size = first_size
+    elif first_size < page_size:
+        return items  # Short first page and no total: nothing more to fetch
+
+    positions = _page_positions(style, start, page_size, total, max_pages)
+    concurrency = max(1, concurrency or 1)
+
+    if total is not None:
+        remaining = -(-total // page_size) - 1
+        if max_pages is not None:
+            remaining = min(remaining, max_pages - 1)
+        log(f"Fetching {remaining} more pages ({concurrency} at a time)...")
+
+    return items + _fetch_window(fetch_page, positions, page_size, total is None, concurrency, log)
+
+
+def _fetch_window(fetch_page, positions, page_size, open_ended, concurrency, log):
+    """
+    Fetch pages with at most `concurrency` requests in flight, stopping at the end.
+
+    Args:
+        fetch_page (callable): Page fetch callback
+        positions (iterator): Positions of the pages to fetch, in order
+        page_size (int): Items per page
+        open_ended (bool): True if the total is unknown (a short page ends the listing)
+        concurrency (int): Maximum pages in flight
+        log (callable): Logger taking (message, level)
+
+    Returns:
+        list: Items in page order
+    """
+    items = []
+    pending = deque()
+
+    def submit_next(executor):
+        position = next(positions, None)
+        if position is not None:
+            pending.append((position, executor.submit(fetch_page, position)))
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            submit_next(executor)
+
+        while pending:
+            position, future = pending.popleft()
+            try:
+                page = future.result()
+            except Exception as e:
+                log(f"Error fetching page {position}: {e}", "WARNING")
+                page = None
+
+            if page is None:
+                log(f"Failed to fetch page {position}", "WARNING")
+                if open_ended:
+                    break  # Without a total we cannot tell a gap from the end
+                submit_next(executor)
+                continue
+
+            if not page.items:
+                break
+
+            items.extend(page.items)
+            if open_ended and _page_size(page) < page_size:
+                break
+
+            submit_next(executor)
+
+        # Pages past the end may still be in flight; their results are dropped
+        for _, future in pending:
+            future.cancel()
+
+    return items
+
+
+def _follow_cursor(fetch_page, cursor, max_pages, log):
+    """
+    Follow next-page cursors one request at a time.
+
+    Args:
+        fetch_page (callable): Page fetch callback
+        cursor: Cursor for the second page (None if there is none)
+        max_pages (int): Safety limit on the number of pages
+        log (callable): Logger taking (message, level)
+
+    Returns:
+        list: Items of the pages after the first one
+    """
+    items = []
+    pages = 1
+
+    while cursor is not None and (max_pages is None or pages < max_pages):
+        page = fetch_page(cursor)
+        if page is None:
+            log(f"Failed to fetch page at cursor {cursor}", "WARNING")
+            break
+        if not page.items:
+            break
+
+        items.extend(page.items)
+        cursor = page.cursor
+        pages += 1
+
+    return items
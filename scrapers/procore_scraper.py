@@ -7,13 +7,19 @@ Uses pagination to get all jobs across multiple pages.
 
 from selenium.webdriver.common.by import By
 from scrapers.headless_scraper import HeadlessScraper
-import time
+from scrapers.pagination import Page
 import re
 
 
+MAX_PAGES = 10  # Safety limit
+
+
 class ProcoreScraper(HeadlessScraper):
     """Scraper for Procore careers site."""
 
+    # Past the last page there are no cards, so keep the timeout short
+    readiness = {'condition': 'selector_stable', 'selector': 'a[href*="/jobs/"]', 'timeout': 10}
+
     def _scrape_jobs(self):
         """
         Scrape jobs from Procore using headless browser with pagination.
@@ -24,36 +30,20 @@ class ProcoreScraper(HeadlessScraper):
         self.log("Starting Procore scrape...")
 
         base_url = "https://careers.procore.com/jobs/search"
-        all_jobs = []
         seen_urls = set()
-        page = 1
-        max_pages = 10  # Safety limit
-        total_jobs = None
 
-        while page <= max_pages:
+        def fetch(page):
             # Load page
             url = f"{base_url}?page={page}" if page > 1 else base_url
-            self.driver.get(url)
             self.log(f"Loading page {page}: {url}")
-            time.sleep(4)
-
-            # Check for total count on first page
-            if page == 1:
-                try:
-                    page_text = self.driver.find_element(By.TAG_NAME, 'body').text
-                    match = re.search(r'of (\d+) in total', page_text)
-                    if match:
-                        total_jobs = int(match.group(1))
-                        self.log(f"Total jobs available: {total_jobs}")
-                except:
-                    pass
+            self.load_page(url)
 
-            # Find job links - Procore uses direct links to job pages
-            job_links = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/jobs/"]')
+            # Find job links - Procore uses direct links to job pages (one round trip)
+            job_links = self.extract_rows('a[href*="/jobs/"]')
 
             if not job_links:
                 self.log(f"No job links found on page {page}")
-                break
+                return Page([])
 
             self.log(f"Found {len(job_links)} job link elements on page {page}")
 
@@ -61,11 +51,11 @@ class ProcoreScraper(HeadlessScraper):
             body_text = self.driver.find_element(By.TAG_NAME, 'body').text
             lines = body_text.split('\n')
 
-            jobs_on_page = 0
+            jobs = []
             for link in job_links:
                 try:
-                    job_url = link.get_attribute('href')
-                    title = link.text.strip()
+                    job_url = link['url']
+                    title = (link['text'] or '').strip()
 
                     # Skip invalid links
                     if not job_url or not title:
@@ -108,38 +98,28 @@ class ProcoreScraper(HeadlessScraper):
                         'region': 'Not specified',
                         'url': job_url
                     }
-                    all_jobs.append(job_info)
-                    jobs_on_page += 1
+                    jobs.append(job_info)
 
                 except Exception as e:
                     self.log(f"Error parsing job link: {e}", "WARNING")
                     continue
 
-            self.log(f"Extracted {jobs_on_page} jobs from page {page}")
-
-            # Check if we've got all jobs
-            if total_jobs and len(all_jobs) >= total_jobs:
-                self.log("Got all jobs")
-                break
-
-            # Check if there's a next page
-            if jobs_on_page == 0:
-                break
+            self.log(f"Extracted {len(jobs)} jobs from page {page}")
 
-            # Check pagination
-            try:
-                page_text = self.driver.find_element(By.TAG_NAME, 'body').text
-                match = re.search(r'Displaying \d+ - (\d+) of (\d+)', page_text)
+            # The first page carries the total, which tells the engine how many pages there are
+            total = None
+            if page == 1:
+                match = re.search(r'of (\d+) in total', body_text) or \
+                    re.search(r'Displaying \d+ - \d+ of (\d+)', body_text)
                 if match:
-                    current_end = int(match.group(1))
-                    total = int(match.group(2))
-                    if current_end >= total:
-                        self.log("Reached last page")
-                        break
-            except:
-                pass
+                    total = int(match.group(1))
+                    self.log(f"Total jobs available: {total}")
+
+            # Links dropped as duplicates must not make the page look like the last one
+            return Page(jobs, total, size=len(job_links))
 
-            page += 1
+        # Pages share the one browser, so they are loaded one at a time
+        all_jobs = self.paginate(fetch, style='page', start=1, max_pages=MAX_PAGES, concurrency=1)
 
-        self.log(f"Completed: {len(all_jobs)} total jobs scraped across {page} pages")
+        self.log(f"Completed: {len(all_jobs)} total jobs scraped")
         return all_jobs
@@ -0,0 +1,282 @@
+"""
+Adaptive Per-Host Rate Limiter
+
+Token bucket per host (netloc) shared by every scraper thread. A host's rate
+is cut in half when it answers 429 or 503 (after waiting out Retry-After),
+and grows back a little with every successful response, so tolerant hosts
+are driven harder and strict ones more gently. Learned rates are saved to
+state/host_rates[_<fund>].json and used as the starting rates on the next run.
+Each fund keeps its own file, so the fund workflows never commit conflicting
+changes to the same file.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+
+STATE_FILE = Path('state') / 'host_rates.json'
+
+DEFAULT_RATE = 5.0    # Requests per second for a host with no history
+MIN_RATE = 0.2
+MAX_RATE = 20.0
+BURST = 5             # Requests a host can take back to back after being idle
+
+THROTTLE_STATUSES = {429, 503}
+BACKOFF_FACTOR = 0.5  # Rate multiplier on a throttling response
+RAMP_UP_STEP = 0.1    # Requests per second added per successful response
+MAX_RETRY_AFTER = 120  # Longest Retry-After we are willing to wait (seconds)
+
+
+def rates_path(fund=None):
+    """
+    Get the learned rates file for a fund's runs.
+
+    Args:
+        fund (str): Optional fund name (separate runs keep separate rates)
+
+    Returns:
+        Path: Rates file
+    """
+    suffix = f"_{fund}" if fund else ""
+    return STATE_FILE.with_name(f"host_rates{suffix}.json")
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value (str): Header value, either seconds or an HTTP date
+
+    Returns:
+        float or None: Seconds to wait (capped at MAX_RETRY_AFTER), or None
+    """
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class HostRateLimit:
+    """Token bucket for one host with additive-increase/multiplicative-decrease rate."""
+
+    def __init__(self, rate=DEFAULT_RATE, min_rate=MIN_RATE, max_rate=MAX_RATE, burst=BURST):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate (float): Starting rate in requests per second
+            min_rate (float): Lowest rate backoff can reach
+            max_rate (float): Highest rate ramp-up can reach
+            burst (int): Bucket capacity
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Wait until a request to the host is allowed.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self.blocked_until:
+                    self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return waited
+                    wait = (1 - self.tokens) / self.rate
+                else:
+                    wait = self.blocked_until - now
+
+            time.sleep(wait)
+            waited += wait
+
+    def record(self, status, retry_after=None):
+        """
+        Adapt the rate to a response.
+
+        Args:
+            status (int): HTTP status code
+            retry_after (str): Retry-After header value, if any
+        """
+        with self._lock:
+            if status in THROTTLE_STATUSES:
+                self.rate = max(self.min_rate, self.rate * BACKOFF_FACTOR)
+                self.tokens = 0.0
+                self.throttled += 1
+
+                pause = parse_retry_after(retry_after)
+                if pause is None:
+                    pause = 1 / self.rate
+                self.blocked_until = max(self.blocked_until, time.monotonic() + pause)
+            elif status < 500:
+                self.rate = min(self.max_rate, self.rate + RAMP_UP_STEP)
+
+
+class RateLimiter:
+    """Process-wide collection of per-host token buckets."""
+
+    def __init__(self, default_rate=DEFAULT_RATE, max_rate=MAX_RATE, learned_rates=None):
+        """
+        Initialize the limiter.
+
+        Args:
+            default_rate (float): Starting rate for hosts with no history
+            max_rate (float): Highest rate any host can ramp up to
+            learned_rates (dict): Host -> rate saved by a previous run
+        """
+        self.default_rate = default_rate
+        self.max_rate = max_rate
+        self.learned_rates = learned_rates or {}
+        self._hosts = {}
+        self._lock = threading.Lock()
+
+    def get(self, host):
+        """
+        Get the bucket for a host, creating it on first use.
+
+        Args:
+            host (str): Host (netloc) of the request URL
+
+        Returns:
+            HostRateLimit: The host's bucket
+        """
+        with self._lock:
+            if host not in self._hosts:
+                rate = self.learned_rates.get(host, self.default_rate)
+                self._hosts[host] = HostRateLimit(rate=rate, max_rate=self.max_rate)
+            return self._hosts[host]
+
+    def acquire(self, host):
+        """Wait until a request to host is allowed (see HostRateLimit.acquire)."""
+        return self.get(host).acquire()
+
+    def record(self, host, status, retry_after=None):
+        """Adapt a host's rate to a response (see HostRateLimit.record)."""
+        self.get(host).record(status, retry_after)
+
+    def snapshot(self):
+        """
+        Get the current state of every host used in this run.
+
+        Returns:
+            dict: Host -> {'rate', 'throttled'}
+        """
+        with self._lock:
+            return {
+                host: {'rate': round(bucket.rate, 3), 'throttled': bucket.throttled}
+                for host, bucket in self._hosts.items()
+            }
+
+
+def load_learned_rates(state_file=STATE_FILE):
+    """
+    Load per-host rates saved by previous runs.
+
+    Args:
+        state_file (Path): Rates file
+
+    Returns:
+        dict: Host -> rate (empty if the file is missing or unreadable)
+    """
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            hosts = json.load(f).get('hosts', {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+    return {host: entry['rate'] for host, entry in hosts.items()
+            if isinstance(entry, dict) and isinstance(entry.get('rate'), (int, float))}
+
+
+def save_learned_rates(limiter, state_file=STATE_FILE):
+    """
+    Merge this run's host rates into the rates file.
+
+    Args:
+        limiter (RateLimiter): Limiter used for the run
+        state_file (Path): Rates file
+    """
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            hosts = json.load(f).get('hosts', {})
+    except (OSError, ValueError, AttributeError):
+        hosts = {}
+
+    now = datetime.now().isoformat()
+    for host, entry in limiter.snapshot().items():
+        hosts[host] = {**entry, 'updated_at': now}
+
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = state_file.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'hosts': dict(sorted(hosts.items()))}, f, indent=2)
+    os.replace(tmp_file, state_file)
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def configure_rate_limiter(default_rate=DEFAULT_RATE, max_rate=MAX_RATE, state_file=STATE_FILE):
+    """
+    Create the process-wide rate limiter, starting from previously learned rates.
+
+    Args:
+        default_rate (float): Starting rate for hosts with no history
+        max_rate (float): Highest rate any host can ramp up to
+        state_file (Path): Rates file to start from
+
+    Returns:
+        RateLimiter: The configured limiter
+    """
+    global _limiter
+
+    with _limiter_lock:
+        _limiter = RateLimiter(default_rate, max_rate, load_learned_rates(state_file))
+        return _limiter
+
+
+def get_rate_limiter():
+    """
+    Get the process-wide rate limiter (created with defaults on first use).
+
+    Returns:
+        RateLimiter: The limiter
+    """
+    global _limiter
+
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RateLimiter()
+        return _limiter
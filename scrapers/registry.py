@@ -0,0 +1,102 @@
+"""
+Scraper Registry
+
+Maps scraper names from companies_config.json to scraper classes, importing
+each scraper module only when a configured company needs it. API-only runs
+therefore never import Selenium, webdriver-manager or BeautifulSoup.
+
+Third-party scrapers can be registered through the 'job_postings.scrapers'
+entry point group, or referenced directly in the config as 'module:ClassName'.
+"""
+
+import importlib
+import threading
+from importlib.metadata import entry_points
+
+
+ENTRY_POINT_GROUP = 'job_postings.scrapers'
+DEFAULT_SCRAPER = 'generic_scraper'
+
+# Scraper name -> (module, class name)
+SCRAPER_MODULES = {
+    'veeva_scraper': ('scrapers.veeva_scraper', 'VeevaScraper'),
+    'workday_scraper': ('scrapers.workday_scraper', 'WorkdayScraper'),
+    'greenhouse_scraper': ('scrapers.greenhouse_scraper', 'GreenhouseScraper'),
+    'lever_scraper': ('scrapers.lever_scraper', 'LeverScraper'),
+    'procore_scraper': ('scrapers.procore_scraper', 'ProcoreScraper'),
+    'appfolio_scraper': ('scrapers.appfolio_scraper', 'AppFolioScraper'),
+    'certara_scraper': ('scrapers.certara_scraper', 'CertaraScraper'),
+    'kinaxis_scraper': ('scrapers.kinaxis_scraper', 'KinaxisScraper'),
+    'servicetitan_scraper': ('scrapers.servicetitan_scraper', 'ServiceTitanScraper'),
+    'dayforce_scraper': ('scrapers.dayforce_scraper', 'DayforceScraper'),
+    'toast_scraper': ('scrapers.toast_scraper', 'ToastScraper'),
+    'generic_scraper': ('scrapers.generic_scraper', 'GenericScraper'),
+    'ashby_scraper': ('scrapers.ashby_scraper', 'AshbyScraper'),
+    'gem_scraper': ('scrapers.gem_scraper', 'GemScraper'),
+    'successfactors_scraper': ('scrapers.successfactors_scraper', 'SuccessFactorsScraper'),
+    'tyler_scraper': ('scrapers.tyler_scraper', 'TylerScraper'),
+    'simulationsplus_scraper': ('scrapers.simulationsplus_scraper', 'SimulationsPlusScraper'),
+    'dassault_scraper': ('scrapers.dassault_scraper', 'DassaultScraper'),
+    'yardi_scraper': ('scrapers.yardi_scraper', 'YardiScraper'),
+    'teamtailor_scraper': ('scrapers.teamtailor_scraper', 'TeamtailorScraper'),
+    'ultipro_scraper': ('scrapers.ultipro_scraper', 'UltiProScraper'),
+    'workable_scraper': ('scrapers.workable_scraper', 'WorkableScraper'),
+    'oracle_hcm_scraper': ('scrapers.oracle_hcm_scraper', 'OracleHCMScraper'),
+    'adp_scraper': ('scrapers.adp_scraper', 'ADPScraper'),
+    'static_html_scraper': ('scrapers.static_html_scraper', 'StaticHTMLScraper'),
+}
+
+_lock = threading.Lock()
+_classes = {}
+_plugins = None
+
+
+def _load_plugins():
+    """Discover scrapers registered through entry points (loaded lazily)."""
+    global _plugins
+
+    if _plugins is None:
+        _plugins = {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+    return _plugins
+
+
+def available_scrapers():
+    """
+    List every scraper name that can be used in companies_config.json.
+
+    Returns:
+        list: Sorted scraper names (built-in and plugins)
+    """
+    with _lock:
+        return sorted(set(SCRAPER_MODULES) | set(_load_plugins()))
+
+
+def get_scraper_class(scraper_name):
+    """
+    Get the scraper class for a name, importing its module on first use.
+
+    Args:
+        scraper_name (str): Registered scraper name, entry point name,
+            or 'module:ClassName'
+
+    Returns:
+        class: Scraper class (GenericScraper if the name is unknown)
+    """
+    with _lock:
+        if scraper_name in _classes:
+            return _classes[scraper_name]
+
+        if scraper_name in SCRAPER_MODULES:
+            module_name, class_name = SCRAPER_MODULES[scraper_name]
+            scraper_class = getattr(importlib.import_module(module_name), class_name)
+        elif scraper_name in _load_plugins():
+            scraper_class = _load_plugins()[scraper_name].load()
+        elif ':' in scraper_name:
+            module_name, class_name = scraper_name.split(':', 1)
+            scraper_class = getattr(importlib.import_module(module_name), class_name)
+        else:
+            module_name, class_name = SCRAPER_MODULES[DEFAULT_SCRAPER]
+            scraper_class = getattr(importlib.import_module(module_name), class_name)
+
+        _classes[scraper_name] = scraper_class
+        return scraper_class
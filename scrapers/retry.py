@@ -0,0 +1,219 @@
+"""
+Retry Policies and Circuit Breakers
+
+Retry policies decide how often and how long to wait before a failed HTTP
+request is tried again: exponential backoff with full jitter, on connection
+errors, timeouts and retryable status codes. Defaults can be overridden per
+platform (PLATFORM_RETRY_POLICIES) and per company ("retry" config key).
+
+Circuit breakers are kept per host for the whole run. After repeated
+failures a host's breaker opens and requests to it fail fast for a cooldown
+period instead of piling more load onto a struggling server.
+"""
+
+import random
+import threading
+import time
+import requests
+
+
+DEFAULT_RETRY_POLICY = {
+    'attempts': 4,          # Total tries, including the first
+    'base_delay': 1.0,      # Seconds; doubled after each failed try
+    'max_delay': 30.0,      # Upper bound of a single backoff
+    'retry_statuses': [429, 500, 502, 503, 504],
+}
+
+# Platform overrides, keyed by the "platform" value in companies_config.json
+PLATFORM_RETRY_POLICIES = {
+    # Deep Workday paginations should survive the odd timeout mid-crawl
+    'workday': {'attempts': 5},
+    # Oracle's REST API answers slowly under load
+    'oracle_hcm': {'attempts': 5, 'base_delay': 2.0},
+}
+
+# Errors that are worth retrying (the server may answer next time)
+RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+FAILURE_THRESHOLD = 5  # Consecutive failures that open a host's breaker
+COOLDOWN = 60.0        # Seconds an open breaker rejects requests
+
+
+class RetryPolicy:
+    """How often and how long to wait before retrying a failed request."""
+
+    def __init__(self, attempts=4, base_delay=1.0, max_delay=30.0, retry_statuses=None):
+        """
+        Initialize the policy.
+
+        Args:
+            attempts (int): Total tries, including the first
+            base_delay (float): Backoff before the first retry (seconds)
+            max_delay (float): Upper bound of a single backoff (seconds)
+            retry_statuses (list): HTTP status codes that are retried
+        """
+        self.attempts = max(1, int(attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = set(retry_statuses if retry_statuses is not None
+                                  else DEFAULT_RETRY_POLICY['retry_statuses'])
+
+    def backoff(self, attempt):
+        """
+        Get the wait before the next try ("full jitter" exponential backoff).
+
+        Args:
+            attempt (int): Number of the try that just failed (0-based)
+
+        Returns:
+            float: Seconds to wait
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def is_retryable(self, error=None, status=None):
+        """
+        Check whether a failure is worth another try.
+
+        Args:
+            error (Exception): Exception raised by the request, if any
+            status (int): HTTP status code, if a response arrived
+
+        Returns:
+            bool: True if the request should be retried
+        """
+        if error is not None:
+            return isinstance(error, RETRYABLE_EXCEPTIONS)
+        return status in self.retry_statuses
+
+
+def get_retry_policy(company_config):
+    """
+    Build the retry policy for a company.
+
+    Settings are merged in order: DEFAULT_RETRY_POLICY, the platform's
+    PLATFORM_RETRY_POLICIES entry, then the company's "retry" config.
+
+    Args:
+        company_config (dict): Company configuration
+
+    Returns:
+        RetryPolicy: The merged policy
+    """
+    settings = dict(DEFAULT_RETRY_POLICY)
+    settings.update(PLATFORM_RETRY_POLICIES.get(company_config.get('platform'), {}))
+    if isinstance(company_config.get('retry'), dict):
+        settings.update(company_config['retry'])
+
+    return RetryPolicy(
+        attempts=settings['attempts'],
+        base_delay=settings['base_delay'],
+        max_delay=settings['max_delay'],
+        retry_statuses=settings['retry_statuses'],
+    )
+
+
+class CircuitBreaker:
+    """Per-host breaker: closed -> open after repeated failures -> half-open trial."""
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN):
+        """
+        Initialize a closed breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the breaker
+            cooldown (float): Seconds to reject requests before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        """Current state: 'closed', 'open' or 'half_open'."""
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return 'open'
+        return 'half_open'
+
+    def allow(self):
+        """
+        Check whether a request may be sent.
+
+        While half-open, only a single trial request is let through.
+
+        Returns:
+            bool: True if the request may go ahead
+        """
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half_open' and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        """Close the breaker after a successful request."""
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """
+        Count a failed request, opening the breaker at the threshold.
+
+        Returns:
+            bool: True if this failure opened the breaker
+        """
+        with self._lock:
+            self.failures += 1
+            trial_failed = self._trial_in_flight
+            self._trial_in_flight = False
+
+            if trial_failed or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                self.times_opened += 1
+                return True
+            return False
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host):
+    """
+    Get the run-wide circuit breaker for a host.
+
+    Args:
+        host (str): Host (netloc) of the request URL
+
+    Returns:
+        CircuitBreaker: The host's breaker
+    """
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker()
+        return _breakers[host]
+
+
+def open_circuits():
+    """
+    List hosts whose breaker opened during the run.
+
+    Returns:
+        dict: Host -> number of times its breaker opened
+    """
+    with _breakers_lock:
+        return {host: breaker.times_opened for host, breaker in _breakers.items() if breaker.times_opened}
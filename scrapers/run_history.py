@@ -0,0 +1,139 @@
+"""
+Run History and Scheduling
+
+Records how long each company took to scrape (state/run_history[_<fund>].json) and
+uses those durations to plan the next run: companies are dispatched
+longest-first so slow headless sites start early instead of holding up the
+end of the run, and the predicted makespan for the worker count is known
+before scraping starts. Each fund keeps its own file, so the fund workflows
+never commit conflicting changes to the same file.
+"""
+
+import heapq
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+
+
+STATE_FILE = Path('state') / 'run_history.json'
+
+# Durations kept per company (the estimate is their median)
+HISTORY_LENGTH = 10
+
+# Estimates for companies that have never been timed (seconds)
+DEFAULT_HTTP_DURATION = 15.0
+DEFAULT_BROWSER_DURATION = 60.0
+
+
+def history_path(fund=None):
+    """
+    Get the run history file for a fund's runs.
+
+    Args:
+        fund (str): Optional fund name (separate runs keep separate histories)
+
+    Returns:
+        Path: History file
+    """
+    suffix = f"_{fund}" if fund else ""
+    return STATE_FILE.with_name(f"run_history{suffix}.json")
+
+
+def load_run_history(state_file=STATE_FILE):
+    """
+    Load per-company durations from previous runs.
+
+    Args:
+        state_file (Path): History file
+
+    Returns:
+        dict: Slug -> list of recent durations in seconds (oldest first)
+    """
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            companies = json.load(f).get('companies', {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+    return {slug: entry['durations'] for slug, entry in companies.items()
+            if isinstance(entry, dict) and isinstance(entry.get('durations'), list)}
+
+
+def save_run_history(history, results, state_file=STATE_FILE):
+    """
+    Add this run's durations to the history and save it.
+
+    Companies that were skipped are not recorded.
+
+    Args:
+        history (dict): History loaded at the start of the run
+        results (list): Result dictionaries with 'slug' and 'duration'
+        state_file (Path): History file
+    """
+    now = datetime.now().isoformat()
+    companies = {slug: {'durations': durations} for slug, durations in history.items()}
+
+    for result in results:
+        if result.get('skipped') or result.get('duration') is None:
+            continue
+        durations = companies.get(result['slug'], {}).get('durations', []) + [result['duration']]
+        companies[result['slug']] = {'durations': durations[-HISTORY_LENGTH:], 'updated_at': now}
+
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = state_file.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'companies': dict(sorted(companies.items()))}, f, indent=2)
+    os.replace(tmp_file, state_file)
+
+
+def estimate_duration(history, slug, uses_browser=False):
+    """
+    Estimate how long a company will take to scrape.
+
+    Args:
+        history (dict): Slug -> recent durations
+        slug (str): Company slug
+        uses_browser (bool): True for headless companies (used without history)
+
+    Returns:
+        float: Estimated seconds (median of recent runs)
+    """
+    durations = history.get(slug)
+    if durations:
+        return float(median(durations))
+    return DEFAULT_BROWSER_DURATION if uses_browser else DEFAULT_HTTP_DURATION
+
+
+def order_longest_first(companies, estimates):
+    """
+    Sort companies by estimated duration, longest first.
+
+    Args:
+        companies (list): Company configurations
+        estimates (dict): Slug -> estimated seconds
+
+    Returns:
+        list: Company configurations in dispatch order (ties keep config order)
+    """
+    return sorted(companies, key=lambda c: -estimates[c['slug']])
+
+
+def predict_makespan(durations, workers):
+    """
+    Predict the wall-clock time of a run with greedy longest-first dispatch.
+
+    Ignores per-host and browser limits, so it is a lower bound when those bind.
+
+    Args:
+        durations (list): Estimated seconds per company
+        workers (int): Companies scraped at once
+
+    Returns:
+        float: Predicted seconds until the last company finishes
+    """
+    finish_times = [0.0] * max(1, workers)
+    for duration in sorted(durations, reverse=True):
+        heapq.heapreplace(finish_times, finish_times[0] + duration)
+    return max(finish_times)
@@ -9,12 +9,25 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from .headless_scraper import HeadlessScraper
-import time
 
 
 class ServiceTitanScraper(HeadlessScraper):
     """Scraper for ServiceTitan careers page."""
 
+    # extract_rows() spec for a Workday job list item; selector lists are tried in order
+    JOB_FIELDS = {
+        'title': {'selector': ['a[data-automation-id="jobTitle"]', 'a[href*="/job/"]', 'h3 a', 'a']},
+        'url': {'selector': ['a[data-automation-id="jobTitle"]', 'a[href*="/job/"]', 'h3 a', 'a'], 'attr': 'href'},
+        'location': {'selector': [
+            'dd[data-automation-id="jobPostingLocation"]',
+            'span[data-automation-id="location"]',
+            'div[class*="location"]',
+        ]},
+        'posting_date': {'selector': 'dd[data-automation-id="postedOn"]'},
+    }
+
+    readiness = {'condition': 'network_idle'}
+
     def _scrape_jobs(self):
         """
         Scrape jobs from ServiceTitan's Workday page.
@@ -26,8 +39,7 @@ class ServiceTitanScraper(HeadlessScraper):
         jobs = []
 
         # Load the careers page
-        self.driver.get(self.url)
-        time.sleep(5)  # Wait for initial page load and JS to execute
+        self.load_page(self.url)  # Wait for initial page load and JS to execute
         self.log(f"Loaded page: {self.url}")
 
         # Wait for job listings to load
@@ -47,11 +59,10 @@ class ServiceTitanScraper(HeadlessScraper):
             try:
                 elements = self.wait_for_elements(By.CSS_SELECTOR, selector, timeout=15)
                 if elements and len(elements) > 0:
-                    # If we found title links directly, get parent elements
+                    # If we found title links directly, use their parent list items
                     if selector == 'a[data-automation-id="jobTitle"]':
-                        job_elements = [elem.find_element(By.XPATH, './ancestor::li') for elem in elements]
-                    else:
-                        job_elements = elements
+                        selector = f'li:has({selector})'
+                    job_elements = self.extract_rows(selector, self.JOB_FIELDS)
                     self.log(f"Found {len(job_elements)} job elements using selector: {selector}")
                     break
             except:
@@ -67,51 +78,13 @@ class ServiceTitanScraper(HeadlessScraper):
         seen_jobs = set()
         for element in job_elements:
             try:
-                # Extract title and URL - try multiple selectors
-                title = ""
-                url = ""
-                title_selectors = [
-                    'a[data-automation-id="jobTitle"]',
-                    'a[href*="/job/"]',
-                    'h3 a',
-                    'a'
-                ]
-                for sel in title_selectors:
-                    try:
-                        title_elem = element.find_element(By.CSS_SELECTOR, sel)
-                        title = title_elem.text.strip()
-                        url = title_elem.get_attribute('href')
-                        if title and url:
-                            break
-                    except:
-                        continue
-
+                title = element['title'] or ''
+                url = element['url'] or ''
                 if not title:
                     continue
 
-                # Extract location - try multiple selectors
-                location = ""
-                location_selectors = [
-                    'dd[data-automation-id="jobPostingLocation"]',
-                    'span[data-automation-id="location"]',
-                    'div[class*="location"]'
-                ]
-                for sel in location_selectors:
-                    try:
-                        location_elem = element.find_element(By.CSS_SELECTOR, sel)
-                        location = location_elem.text.strip()
-                        if location:
-                            break
-                    except:
-                        continue
-
-                # Extract posting date
-                posting_date = ""
-                try:
-                    date_elem = element.find_element(By.CSS_SELECTOR, 'dd[data-automation-id="postedOn"]')
-                    posting_date = date_elem.text.strip()
-                except:
-                    pass
+                location = element['location'] or ''
+                posting_date = element['posting_date'] or ''
 
                 # Create unique identifier
                 job_id = (title, location)
@@ -9,7 +9,6 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from scrapers.headless_scraper import HeadlessScraper
-import time
 import re
 import json
 
@@ -31,9 +30,8 @@ class SimulationsPlusScraper(HeadlessScraper):
 
         # Load careers page
         url = self.config.get('url', 'https://www.simulations-plus.com/career-center/')
-        self.driver.get(url)
         self.log(f"Loading: {url}")
-        time.sleep(5)  # Wait for dynamic content
+        self.load_page(url)  # Wait for dynamic content
 
         # Scroll down to trigger lazy loading
         self._scroll_page()
@@ -71,14 +69,13 @@ class SimulationsPlusScraper(HeadlessScraper):
             last_height = self.driver.execute_script("return document.body.scrollHeight")
             for _ in range(3):
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
+                self.wait_until_ready(quiet=0.5, timeout=3)
                 new_height = self.driver.execute_script("return document.body.scrollHeight")
                 if new_height == last_height:
                     break
                 last_height = new_height
             # Scroll back up
             self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
         except:
             pass
 
@@ -100,10 +97,10 @@ class SimulationsPlusScraper(HeadlessScraper):
 
         for selector in selectors:
             try:
-                links = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                links = self.extract_rows(selector)
                 for link in links:
-                    text = link.text.strip()
-                    href = link.get_attribute('href') or ''
+                    text = (link['text'] or '').strip()
+                    href = link['url'] or ''
 
                     if not text or len(text) < 5:
                         continue
@@ -137,29 +134,18 @@ class SimulationsPlusScraper(HeadlessScraper):
 
         for selector in selectors:
             try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                elements = self.extract_rows(selector, {
+                    'title': {'selector': ['h2', 'h3', 'h4', '.title', 'a']},
+                    'url': {'selector': 'a', 'attr': 'href'},
+                })
                 for elem in elements:
-                    # Try to find title
-                    title = None
-                    for tag in ['h2', 'h3', 'h4', '.title', 'a']:
-                        try:
-                            title_elem = elem.find_element(By.CSS_SELECTOR, tag)
-                            title = title_elem.text.strip()
-                            if title and len(title) > 3:
-                                break
-                        except:
-                            continue
-
+                    # First non-empty title element
+                    title = elem['title']
                     if not title:
                         continue
 
-                    # Try to find link
-                    href = ''
-                    try:
-                        link = elem.find_element(By.CSS_SELECTOR, 'a')
-                        href = link.get_attribute('href') or ''
-                    except:
-                        pass
+                    # Link inside the element, if any
+                    href = elem['url'] or ''
 
                     job_info = self._create_job_entry(title, href)
                     if job_info:
@@ -184,9 +170,12 @@ class SimulationsPlusScraper(HeadlessScraper):
 
         for selector in selectors:
             try:
-                items = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                items = self.extract_rows(selector, {
+                    'text': {},
+                    'url': {'selector': 'a', 'attr': 'href'},
+                })
                 for item in items:
-                    text = item.text.strip()
+                    text = (item['text'] or '').strip()
                     if not text or len(text) < 5:
                         continue
 
@@ -194,12 +183,7 @@ class SimulationsPlusScraper(HeadlessScraper):
                     lines = text.split('\n')
                     title = lines[0].strip()
 
-                    href = ''
-                    try:
-                        link = item.find_element(By.CSS_SELECTOR, 'a')
-                        href = link.get_attribute('href') or ''
-                    except:
-                        pass
+                    href = item['url'] or ''
 
                     job_info = self._create_job_entry(title, href)
                     if job_info:
@@ -223,13 +207,13 @@ class SimulationsPlusScraper(HeadlessScraper):
                 if any(platform in src.lower() for platform in ['bamboohr', 'greenhouse', 'lever', 'workday', 'jobvite']):
                     self.log(f"Found job platform iframe: {src}")
                     self.driver.switch_to.frame(iframe)
-                    time.sleep(2)
+                    self.wait_until_ready(timeout=10)
 
                     # Try to find jobs in iframe
-                    links = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="job"]')
+                    links = self.extract_rows('a[href*="job"]')
                     for link in links:
-                        text = link.text.strip()
-                        href = link.get_attribute('href') or ''
+                        text = (link['text'] or '').strip()
+                        href = link['url'] or ''
                         job_info = self._create_job_entry(text, href)
                         if job_info:
                             jobs.append(job_info)
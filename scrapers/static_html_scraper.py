@@ -5,7 +5,6 @@ Generic BeautifulSoup scraper for simple HTML career pages.
 Looks for job headings and links within a configurable container.
 """
 
-from bs4 import BeautifulSoup
 from scrapers.base_scraper import BaseScraper
 
 
@@ -26,10 +25,10 @@ class StaticHTMLScraper(BaseScraper):
             self.log("Failed to fetch page", "ERROR")
             return []
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Optionally scope to a specific container
+        # Optionally scope to a specific container (parsing only that subtree when possible)
         container_selector = self.config.get('jobs_container_selector')
+        soup = self.parse_html(response.text, only=container_selector)
+
         if container_selector:
             container = soup.select_one(container_selector)
             if not container:
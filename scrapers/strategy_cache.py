@@ -0,0 +1,84 @@
+"""
+Strategy Cache
+
+Remembers, per company, which scraping strategy worked on the last run and
+how long each strategy took. Scrapers with several fallback strategies
+(GenericScraper, UltiPro, Oracle HCM, Teamtailor, Dassault) try the last
+winner first instead of repeating fruitless regex passes and HTTP calls.
+"""
+
+import json
+import os
+from datetime import datetime
+
+
+STRATEGY_FILE = 'scrape_strategy.json'
+
+# A winner returning fewer than this fraction of last run's jobs is treated as
+# suspect and the remaining strategies are tried as well
+ANOMALY_RATIO = 0.5
+
+
+def load_strategy_record(output_dir):
+    """
+    Load a company's strategy record.
+
+    Args:
+        output_dir (Path): Company output directory
+
+    Returns:
+        dict: Record with winner, job_count and timings (empty defaults if missing)
+    """
+    record = {'winner': None, 'job_count': 0, 'timings': {}}
+    try:
+        with open(output_dir / STRATEGY_FILE, 'r', encoding='utf-8') as f:
+            record.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+    return record
+
+
+def save_strategy_record(output_dir, record):
+    """
+    Save a company's strategy record atomically.
+
+    Args:
+        output_dir (Path): Company output directory
+        record (dict): Strategy record
+    """
+    record['updated_at'] = datetime.now().isoformat()
+    filepath = output_dir / STRATEGY_FILE
+    tmp_file = filepath.with_suffix('.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(record, f, indent=2)
+    os.replace(tmp_file, filepath)
+
+
+def order_strategies(strategies, record):
+    """
+    Put last run's winning strategy first, keeping the others in default order.
+
+    Args:
+        strategies (list): (name, callable) pairs in default order
+        record (dict): Strategy record
+
+    Returns:
+        list: Reordered (name, callable) pairs
+    """
+    winner = record.get('winner')
+    return sorted(strategies, key=lambda strategy: strategy[0] != winner)
+
+
+def is_anomalous(job_count, record):
+    """
+    Check whether a job count looks wrong compared to the last run.
+
+    Args:
+        job_count (int): Jobs found by a strategy
+        record (dict): Strategy record
+
+    Returns:
+        bool: True if the count is suspiciously low
+    """
+    previous = record.get('job_count') or 0
+    return previous > 0 and job_count < previous * ANOMALY_RATIO
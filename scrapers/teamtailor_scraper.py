@@ -6,7 +6,6 @@ Tries the JSON endpoint first, falls back to HTML parsing.
 """
 
 import json
-from bs4 import BeautifulSoup
 from scrapers.base_scraper import BaseScraper
 
 
@@ -29,14 +28,11 @@ class TeamtailorScraper(BaseScraper):
 
         base_url = f"https://{teamtailor_base}"
 
-        # Try JSON endpoint first
-        jobs = self._try_json_endpoint(base_url)
-        if jobs:
-            return jobs
-
-        # Fallback to HTML parsing
-        self.log("JSON endpoint failed, trying HTML parsing...")
-        return self._parse_html(base_url)
+        # JSON endpoint, falling back to HTML parsing (last run's winner first)
+        return self.run_strategies([
+            ('json_endpoint', self._try_json_endpoint),
+            ('html', self._parse_html),
+        ], base_url) or []
 
     def _try_json_endpoint(self, base_url):
         """Try fetching jobs from the Teamtailor JSON API."""
@@ -111,7 +107,7 @@ class TeamtailorScraper(BaseScraper):
         if not response:
             return []
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = self.parse_html(response.text)
         jobs = []
 
         # Teamtailor typically uses <a> tags with /jobs/ in href for job cards
@@ -9,13 +9,19 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from scrapers.headless_scraper import HeadlessScraper
-import time
+from scrapers.pagination import Page
 import re
 
 
+MAX_PAGES = 15  # Safety limit
+
+
 class ToastScraper(HeadlessScraper):
     """Scraper for Toast careers site (Clinch Talent)."""
 
+    # Past the last page there are no cards, so keep the timeout short
+    readiness = {'condition': 'selector_stable', 'selector': 'div.card.job-search-results-card', 'timeout': 10}
+
     def _scrape_jobs(self):
         """
         Scrape jobs from Toast using headless browser with pagination.
@@ -26,61 +32,37 @@ class ToastScraper(HeadlessScraper):
         self.log("Starting Toast scrape...")
 
         base_url = "https://careers.toasttab.com/jobs/search"
-        all_jobs = []
         seen_urls = set()
-        page = 1
-        max_pages = 15  # Safety limit
 
-        while page <= max_pages:
+        def fetch(page):
             # Load page
             url = f"{base_url}?page={page}" if page > 1 else base_url
-            self.driver.get(url)
             self.log(f"Loading page {page}: {url}")
-            time.sleep(3)
+            self.load_page(url)
 
-            # Check for total count on first page
-            if page == 1:
-                try:
-                    page_text = self.driver.find_element(By.TAG_NAME, 'body').text
-                    match = re.search(r'of (\d+) in total', page_text)
-                    if match:
-                        total_jobs = int(match.group(1))
-                        self.log(f"Total jobs available: {total_jobs}")
-                except:
-                    pass
-
-            # Find job cards - use the specific card class
-            job_cards = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                'div.card.job-search-results-card'
-            )
+            # Find job cards - use the specific card class (one round trip per page)
+            job_cards = self.extract_rows('div.card.job-search-results-card', {
+                'title': {'selector': 'h3.card-title'},
+                'url': {'selector': 'a[href*="/jobs/"]', 'attr': 'href'},
+                'location': {'selector': '.job-component-location, .job-component-list-location'},
+                'department': {'selector': '.job-component-department, .job-component-list-department'},
+            })
 
             if not job_cards:
                 self.log(f"No job cards found on page {page}")
-                break
+                return Page([])
 
             self.log(f"Found {len(job_cards)} job cards on page {page}")
 
-            jobs_on_page = 0
+            jobs = []
             for card in job_cards:
                 try:
-                    # Find title element
-                    try:
-                        title_elem = card.find_element(By.CSS_SELECTOR, 'h3.card-title')
-                        title = title_elem.text.strip()
-                    except:
-                        continue
-
+                    title = card['title']
                     if not title:
                         continue
 
                     # Find URL from the title link or card link
-                    job_url = None
-                    try:
-                        link = card.find_element(By.CSS_SELECTOR, 'a[href*="/jobs/"]')
-                        job_url = link.get_attribute('href')
-                    except:
-                        continue
+                    job_url = card['url']
 
                     if not job_url or job_url in seen_urls:
                         continue
@@ -89,21 +71,9 @@ class ToastScraper(HeadlessScraper):
 
                     seen_urls.add(job_url)
 
-                    # Find location
-                    location = 'Not specified'
-                    try:
-                        loc_elem = card.find_element(By.CSS_SELECTOR, '.job-component-location, .job-component-list-location')
-                        location = loc_elem.text.strip()
-                    except:
-                        pass
-
-                    # Find department
-                    department = 'Not specified'
-                    try:
-                        dept_elem = card.find_element(By.CSS_SELECTOR, '.job-component-department, .job-component-list-department')
-                        department = dept_elem.text.strip()
-                    except:
-                        pass
+                    # Find location and department
+                    location = card['location'] if card['location'] is not None else 'Not specified'
+                    department = card['department'] if card['department'] is not None else 'Not specified'
 
                     job_info = {
                         'title': title,
@@ -114,34 +84,32 @@ class ToastScraper(HeadlessScraper):
                         'region': 'Not specified',
                         'url': job_url
                     }
-                    all_jobs.append(job_info)
-                    jobs_on_page += 1
+                    jobs.append(job_info)
 
                 except Exception as e:
                     self.log(f"Error parsing job card: {e}", "WARNING")
                     continue
 
-            self.log(f"Extracted {jobs_on_page} jobs from page {page}")
-
-            # Check if there's a next page
-            if jobs_on_page == 0:
-                break
-
-            # Check pagination - look for next page button
-            try:
-                # Look for pagination info
-                page_text = self.driver.find_element(By.TAG_NAME, 'body').text
-                match = re.search(r'Displaying \d+ - (\d+) of (\d+)', page_text)
-                if match:
-                    current_end = int(match.group(1))
-                    total = int(match.group(2))
-                    if current_end >= total:
-                        self.log("Reached last page")
-                        break
-            except:
-                pass
-
-            page += 1
-
-        self.log(f"Completed: {len(all_jobs)} total jobs scraped across {page} pages")
+            self.log(f"Extracted {len(jobs)} jobs from page {page}")
+
+            # The first page carries the total, which tells the engine how many pages there are
+            total = None
+            if page == 1:
+                try:
+                    page_text = self.driver.find_element(By.TAG_NAME, 'body').text
+                    match = re.search(r'of (\d+) in total', page_text) or \
+                        re.search(r'Displaying \d+ - \d+ of (\d+)', page_text)
+                    if match:
+                        total = int(match.group(1))
+                        self.log(f"Total jobs available: {total}")
+                except Exception:
+                    pass
+
+            # Cards dropped as duplicates must not make the page look like the last one
+            return Page(jobs, total, size=len(job_cards))
+
+        # Pages share the one browser, so they are loaded one at a time
+        all_jobs = self.paginate(fetch, style='page', start=1, max_pages=MAX_PAGES, concurrency=1)
+
+        self.log(f"Completed: {len(all_jobs)} total jobs scraped")
         return all_jobs
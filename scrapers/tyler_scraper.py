@@ -8,54 +8,30 @@ Uses Jobvite integration embedded in their custom careers site.
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from scrapers.headless_scraper import HeadlessScraper
-import time
 import re
 
 
 class TylerScraper(HeadlessScraper):
     """Scraper for Tyler Technologies careers site (Jobvite)."""
 
-    def _setup_driver(self):
-        """Set up Chrome driver with anti-detection measures."""
-        if self.driver:
-            return
+    # Anti-detection Chrome profile (see scrapers.browser_pool.PROFILES)
+    browser_profile = 'stealth'
 
-        self.log("Setting up headless Chrome browser with anti-detection...")
+    # extract_rows() spec for job links: text, href, the parent's text and
+    # a location element inside the surrounding job/listing container
+    LINK_FIELDS = {
+        'url': {'attr': 'href'},
+        'text': {},
+        'parent_text': {'up': 1},
+        'location': {
+            'closest': 'div[class*="job"], div[class*="listing"]',
+            'selector': '[class*="location"], [class*="city"]',
+        },
+    }
 
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
-
-        chrome_options = Options()
-        chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-
-        try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-
-            # Override webdriver detection
-            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    })
-                '''
-            })
-
-            self.log("Browser ready")
-        except Exception as e:
-            self.log(f"Failed to setup browser: {e}", "ERROR")
-            raise
+    # Wait for the job board's requests to finish rather than a fixed delay
+    readiness = {'condition': 'network_idle', 'timeout': 20}
 
     def _scrape_jobs(self):
         """
@@ -72,9 +48,8 @@ class TylerScraper(HeadlessScraper):
         # Tyler uses their own careers page with Jobvite
         base_url = "https://www.tylertech.com/careers/job-listings"
 
-        self.driver.get(base_url)
         self.log(f"Loading: {base_url}")
-        time.sleep(5)  # Wait for page to fully load including Jobvite iframe
+        self.load_page(base_url)  # Wait for page to fully load including Jobvite iframe
 
         # Try to find job listings in various formats
         jobs_found = False
@@ -88,7 +63,7 @@ class TylerScraper(HeadlessScraper):
                 if 'jobvite' in name.lower() or 'jobvite' in src.lower() or 'jv-' in name.lower():
                     self.log(f"Found Jobvite iframe: {name or src}")
                     self.driver.switch_to.frame(iframe)
-                    time.sleep(2)
+                    self.wait_until_ready(timeout=10)
                     jobs_found = True
                     break
         except Exception as e:
@@ -119,26 +94,23 @@ class TylerScraper(HeadlessScraper):
 
         # Parse jobs from page content
         try:
-            # Get page source and find job data
-            page_source = self.driver.page_source
-
             # Look for job links with titles
             # Tyler format: job title as link text with href to job details
-            job_links = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/careers/job-openings/"]')
+            job_links = self.extract_rows('a[href*="/careers/job-openings/"]', self.LINK_FIELDS)
 
             if not job_links:
-                job_links = self.driver.find_elements(By.CSS_SELECTOR, 'a[href*="/job-listings/"]')
+                job_links = self.extract_rows('a[href*="/job-listings/"]', self.LINK_FIELDS)
 
             if not job_links:
                 # Try broader selector
-                job_links = self.driver.find_elements(By.CSS_SELECTOR, 'a')
+                job_links = self.extract_rows('a', self.LINK_FIELDS)
 
             self.log(f"Found {len(job_links)} potential job links")
 
             for link in job_links:
                 try:
-                    href = link.get_attribute('href') or ''
-                    text = link.text.strip()
+                    href = link['url'] or ''
+                    text = (link['text'] or '').strip()
 
                     # Skip non-job links
                     if not text or len(text) < 5:
@@ -160,24 +132,15 @@ class TylerScraper(HeadlessScraper):
 
                     # Try to get location from parent element
                     location = 'Not specified'
-                    try:
-                        parent = link.find_element(By.XPATH, './..')
-                        parent_text = parent.text
-                        # Look for location pattern (City, State or City, Country)
-                        loc_match = re.search(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2}(?:\s+\d{5})?)', parent_text)
-                        if loc_match:
-                            location = loc_match.group(1)
-                    except:
-                        pass
+                    parent_text = link['parent_text'] or ''
+                    # Look for location pattern (City, State or City, Country)
+                    loc_match = re.search(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*,\s*[A-Z]{2}(?:\s+\d{5})?)', parent_text)
+                    if loc_match:
+                        location = loc_match.group(1)
 
                     # Try alternate location extraction
-                    if location == 'Not specified':
-                        try:
-                            parent = link.find_element(By.XPATH, './ancestor::div[contains(@class,"job") or contains(@class,"listing")]')
-                            loc_elem = parent.find_element(By.CSS_SELECTOR, '[class*="location"], [class*="city"]')
-                            location = loc_elem.text.strip()
-                        except:
-                            pass
+                    if location == 'Not specified' and link['location'] is not None:
+                        location = link['location']
 
                     is_remote = 'remote' in text.lower() or 'remote' in location.lower()
 
@@ -7,8 +7,13 @@ UltiPro embeds job data as JSON in the page or renders it via JavaScript.
 
 import json
 import re
-from bs4 import BeautifulSoup
 from scrapers.base_scraper import BaseScraper
+from scrapers.hydration import decode_json_at
+from scrapers.pagination import Page
+
+
+API_PAGE_SIZE = 100
+API_MAX_PAGES = 50  # Safety limit (5,000 postings)
 
 
 class UltiProScraper(BaseScraper):
@@ -30,43 +35,35 @@ class UltiProScraper(BaseScraper):
 
         html = response.text
 
-        # Try extracting embedded JSON data first
-        jobs = self._extract_json_data(html)
-        if jobs:
-            return jobs
-
-        # Try the UltiPro API endpoint
-        jobs = self._try_api(html)
-        if jobs:
-            return jobs
-
-        # Fallback to HTML parsing
-        self.log("Trying HTML parsing fallback...")
-        return self._parse_html(html)
+        # Embedded JSON data, then the UltiPro API endpoint, then HTML parsing
+        # (last run's winner first)
+        return self.run_strategies([
+            ('embedded_json', self._extract_json_data),
+            ('api', self._try_api),
+            ('html', self._parse_html),
+        ], html) or []
 
     def _extract_json_data(self, html):
         """Try to extract job data from embedded JSON in script tags."""
-        # UltiPro often embeds job data in script tags
+        # UltiPro often embeds job data in script tags. The patterns only find
+        # where the data starts; decode_json_at() reads it by bracket matching.
         patterns = [
-            r'var\s+opportunities\s*=\s*(\[.*?\]);',
-            r'var\s+jobPostings\s*=\s*(\[.*?\]);',
-            r'"opportunities"\s*:\s*(\[.*?\])',
-            r'"jobPostings"\s*:\s*(\[.*?\])',
-            r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
+            r'var\s+opportunities\s*=\s*(?=\[)',
+            r'var\s+jobPostings\s*=\s*(?=\[)',
+            r'"opportunities"\s*:\s*(?=\[)',
+            r'"jobPostings"\s*:\s*(?=\[)',
+            r'window\.__INITIAL_STATE__\s*=\s*(?=\{)',
         ]
 
         for pattern in patterns:
-            match = re.search(pattern, html, re.DOTALL)
+            match = re.search(pattern, html)
             if match:
-                try:
-                    data = json.loads(match.group(1))
-                    if isinstance(data, dict):
-                        # Extract jobs from nested structure
-                        data = data.get('opportunities', data.get('jobPostings', []))
-                    if isinstance(data, list) and data:
-                        return self._parse_json_jobs(data)
-                except (json.JSONDecodeError, ValueError):
-                    continue
+                data, _ = decode_json_at(html, match.end())
+                if isinstance(data, dict):
+                    # Extract jobs from nested structure
+                    data = data.get('opportunities', data.get('jobPostings', []))
+                if isinstance(data, list) and data:
+                    return self._parse_json_jobs(data)
         return None
 
     def _try_api(self, html):
@@ -102,25 +99,29 @@ class UltiProScraper(BaseScraper):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
         }
 
-        payload = {
-            'opportunitySearch': {
-                'Top': 200,
-                'Skip': 0,
-                'QueryString': '',
-                'OrderBy': [{'Value': 'postedDateDesc', 'PropertyName': 'PostedDate', 'Ascending': False}]
+        def fetch(skip):
+            payload = {
+                'opportunitySearch': {
+                    'Top': API_PAGE_SIZE,
+                    'Skip': skip,
+                    'QueryString': '',
+                    'OrderBy': [{'Value': 'postedDateDesc', 'PropertyName': 'PostedDate', 'Ascending': False}]
+                }
             }
-        }
 
-        response = self.make_request(api_url, method='POST', json=payload, headers=headers)
-        if not response:
-            return None
+            response = self.make_request(api_url, method='POST', json=payload, headers=headers)
+            if not response:
+                return None
 
-        try:
-            data = response.json()
-        except (json.JSONDecodeError, ValueError):
-            return None
+            try:
+                data = response.json()
+            except (json.JSONDecodeError, ValueError):
+                return None
+
+            total = data.get('totalCount', data.get('TotalCount'))
+            return Page(data.get('opportunities') or [], total if isinstance(total, int) and total else None)
 
-        opportunities = data.get('opportunities', [])
+        opportunities = self.paginate(fetch, page_size=API_PAGE_SIZE, max_pages=API_MAX_PAGES)
         if not opportunities:
             return None
 
@@ -220,7 +221,7 @@ class UltiProScraper(BaseScraper):
 
     def _parse_html(self, html):
         """Fallback: parse HTML for job listings."""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self.parse_html(html)
         jobs = []
 
         # UltiPro uses various selectors for job cards
@@ -5,13 +5,27 @@ Scrapes job postings from Workday-based career sites.
 Workday sites use a common API structure that can be accessed directly.
 """
 
+import contextlib
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from scrapers.base_scraper import BaseScraper
+from scrapers.pagination import Page, DEFAULT_PAGE_CONCURRENCY
+
+
+PAGE_SIZE = 20
+
+# Tenants above this many postings are split by facet, since deep offsets degrade
+DEFAULT_FACET_PARTITION_THRESHOLD = 1000
+MAX_FACET_DEPTH = 2
 
 
 class WorkdayScraper(BaseScraper):
     """Scraper for Workday-based career sites."""
 
+    # Limits requests in flight for one company (set per scrape)
+    _request_slots = None
+
     def scrape(self):
         """
         Scrape jobs from Workday API.
@@ -21,6 +35,11 @@ class WorkdayScraper(BaseScraper):
         """
         self.log("Starting Workday scrape...")
 
+        # One request budget for the whole company: facet values and their pages
+        # are crawled on separate threads, but only this many requests are in flight
+        concurrency = self.config.get('page_concurrency', DEFAULT_PAGE_CONCURRENCY)
+        self._request_slots = threading.BoundedSemaphore(max(1, concurrency or 1))
+
         # Get API base URL from config, or construct it from the main URL
         api_url = self.config.get('api_base')
 
@@ -41,28 +60,224 @@ class WorkdayScraper(BaseScraper):
                 self.log(f"Failed to construct API URL: {e}", "ERROR")
                 return []
 
+        # The first page tells us the total, so the remaining offsets are known up front
+        self.log("Fetching jobs (offset: 0)...")
+        first_page = self._fetch_page(api_url, 0, PAGE_SIZE)
+
+        if first_page is None:
+            self.log("Failed to fetch jobs from API", "ERROR")
+            return []
+
+        if not first_page.get('jobPostings'):
+            self.log("No more jobs found")
+            return []
+
+        # Only trust total from the first response (subsequent pages may return 0)
+        total_jobs = first_page.get('total', 0) or len(first_page['jobPostings'])
+
+        # Large tenants are split into facet-scoped queries that run in parallel
+        postings = None
+        threshold = self.config.get('facet_partition_threshold', DEFAULT_FACET_PARTITION_THRESHOLD)
+        if total_jobs > threshold:
+            postings = self._crawl_by_facets(api_url, {}, first_page, total_jobs)
+
+        if postings is None:
+            postings = self._paginate(api_url, {}, first_page, total_jobs)
+
+        # Merge results, de-duplicating postings that shifted between pages or facets
         jobs = []
-        offset = 0
-        limit = 20
-        total_fetched = 0
-        total_jobs = None
-
-        while True:
-            # Workday API typically uses POST with JSON payload
-            payload = {
-                "appliedFacets": {},
-                "limit": limit,
-                "offset": offset,
-                "searchText": ""
-            }
+        seen_paths = set()
+        for job in postings:
+            path = job.get('externalPath')
+            if path:
+                if path in seen_paths:
+                    continue
+                seen_paths.add(path)
 
-            headers = {
-                'Accept': 'application/json',
-                'Content-Type': 'application/json',
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+            job_info = self._parse_job(job)
+            if job_info:
+                jobs.append(job_info)
+
+        self.log(f"Fetched {len(jobs)}/{total_jobs} jobs")
+
+        self.log(f"Completed: {len(jobs)} jobs scraped")
+        return jobs
+
+    def _paginate(self, api_url, applied_facets, first_page, total):
+        """
+        Fetch all remaining pages of a query concurrently.
+
+        Args:
+            api_url (str): Workday jobs API URL
+            applied_facets (dict): Facet filters for the query
+            first_page (dict): Already-fetched response for offset 0
+            total (int): Total postings reported by the first page
+
+        Returns:
+            list: Raw job postings in offset order
+        """
+        def fetch(offset):
+            data = self._fetch_page(api_url, offset, PAGE_SIZE, applied_facets)
+            return Page(data.get('jobPostings', [])) if data is not None else None
+
+        # Only trust total from the first response (subsequent pages may return 0)
+        return self.paginate(fetch, page_size=PAGE_SIZE,
+                             first=Page(first_page.get('jobPostings', []), total))
+
+    def _crawl_by_facets(self, api_url, applied_facets, first_page, total, depth=0):
+        """
+        Crawl a query as independent facet-scoped queries run in parallel.
+
+        Facet values that are still too large are split again by another facet,
+        up to MAX_FACET_DEPTH levels. Every level checks that its union covers
+        the query's total and logs any shortfall.
+
+        Args:
+            api_url (str): Workday jobs API URL
+            applied_facets (dict): Facet filters already applied
+            first_page (dict): Response for offset 0 (carries the facet tree)
+            total (int): Total postings for the query
+            depth (int): Current partition depth
+
+        Returns:
+            list or None: Raw job postings, or None if no usable facet was found
+        """
+        facet = self._choose_partition_facet(first_page.get('facets', []), total, applied_facets)
+        if not facet:
+            self.log("No facet covers all jobs, using offset pagination", "WARNING")
+            return None
+
+        param, values = facet
+        threshold = self.config.get('facet_partition_threshold', DEFAULT_FACET_PARTITION_THRESHOLD)
+        self.log(f"Partitioning {total} jobs by facet '{param}' ({len(values)} values)...")
+
+        def crawl_value(value):
+            scoped = dict(applied_facets)
+            scoped[param] = [value['id']]
+
+            page = self._fetch_page(api_url, 0, PAGE_SIZE, scoped)
+            if page is None:
+                self.log(f"Failed to fetch facet {param}={value.get('descriptor')}", "WARNING")
+                return []
+
+            value_total = page.get('total', 0) or len(page.get('jobPostings', []))
+            if value_total > threshold and depth + 1 < MAX_FACET_DEPTH:
+                nested = self._crawl_by_facets(api_url, scoped, page, value_total, depth + 1)
+                if nested is not None:
+                    return nested
+
+            return self._paginate(api_url, scoped, page, value_total)
+
+        # Requests in flight are limited by the company's request budget, not by this pool
+        concurrency = self.config.get('page_concurrency', DEFAULT_PAGE_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=max(1, concurrency or 1)) as executor:
+            postings = [job for value_postings in executor.map(crawl_value, values) for job in value_postings]
+
+        # The union should match the query's total. Re-crawling the query
+        # unfiltered would repeat every request and hit the deep-offset
+        # ceiling again, so a shortfall is only reported.
+        found = len({p['externalPath'] for p in postings if p.get('externalPath')})
+        scope = ', '.join(f"{k}={v}" for k, v in applied_facets.items()) or 'all jobs'
+        if found < total:
+            self.log(f"Facet partition of {scope} found {found}/{total} jobs", "WARNING")
+        else:
+            self.log(f"Facet partition of {scope} covered all {total} jobs")
+
+        return postings
 
-            self.log(f"Fetching jobs (offset: {offset})...")
+    def _choose_partition_facet(self, facets, total, applied_facets):
+        """
+        Pick the facet to split a query by.
+
+        A facet is usable only if its value counts add up to at least the total,
+        i.e. every posting falls under some value. The configured
+        'partition_facet' wins; otherwise the facet with the smallest largest
+        value is used, since it splits the work most evenly.
+
+        Args:
+            facets (list): Facet tree from a Workday response
+            total (int): Total postings for the query
+            applied_facets (dict): Facets already applied (not reused)
+
+        Returns:
+            tuple or None: (facet parameter, list of values) or None
+        """
+        preferred = self.config.get('partition_facet')
+        candidates = []
+
+        for param, values in self._flatten_facets(facets).items():
+            if param in applied_facets:
+                continue
+
+            values = [v for v in values if v.get('count', 0) > 0]
+            counts = [v['count'] for v in values]
+            if len(values) < 2 or sum(counts) < total:
+                continue
+
+            if param == preferred:
+                return param, values
+            candidates.append((max(counts), param, values))
+
+        if not candidates:
+            return None
+
+        _, param, values = min(candidates, key=lambda c: c[0])
+        return param, values
+
+    def _flatten_facets(self, facets):
+        """
+        Flatten Workday's facet tree into {facetParameter: [values]}.
+
+        Some facets (e.g. locationMainGroup) nest sub-facets inside their values.
+
+        Args:
+            facets (list): Facet tree from a Workday response
+
+        Returns:
+            dict: Facet parameter to list of value dicts (id, descriptor, count)
+        """
+        flat = {}
+        for facet in facets or []:
+            values = []
+            for value in facet.get('values', []):
+                if value.get('facetParameter') and 'values' in value:
+                    flat.update(self._flatten_facets([value]))
+                elif value.get('id'):
+                    values.append(value)
+
+            if facet.get('facetParameter') and values:
+                flat[facet['facetParameter']] = values
+
+        return flat
+
+    def _fetch_page(self, api_url, offset, limit, applied_facets=None):
+        """
+        Fetch a single page of job postings.
+
+        Args:
+            api_url (str): Workday jobs API URL
+            offset (int): Offset of the first posting
+            limit (int): Page size
+            applied_facets (dict): Optional facet filters, e.g. {'locations': [id]}
+
+        Returns:
+            dict or None: Parsed JSON response, or None if the request failed
+        """
+        # Workday API typically uses POST with JSON payload
+        payload = {
+            "appliedFacets": applied_facets or {},
+            "limit": limit,
+            "offset": offset,
+            "searchText": ""
+        }
+
+        headers = {
+            'Accept': 'application/json',
+            'Content-Type': 'application/json',
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+
+        with self._request_slots or contextlib.nullcontext():
             response = self.make_request(
                 api_url,
                 method='POST',
@@ -70,73 +285,56 @@ class WorkdayScraper(BaseScraper):
                 json=payload
             )
 
-            if not response:
-                self.log("Failed to fetch jobs from API", "ERROR")
-                break
+        if not response:
+            return None
 
-            try:
-                data = response.json()
-            except json.JSONDecodeError as e:
-                self.log(f"Failed to parse JSON response: {e}", "ERROR")
-                break
-
-            # Extract jobs from response
-            job_postings = data.get('jobPostings', [])
-
-            if not job_postings:
-                self.log("No more jobs found")
-                break
-
-            for job in job_postings:
-                try:
-                    title = job.get('title', 'Not specified')
-
-                    # Extract location
-                    locations = job.get('locationsText', 'Not specified')
-                    if isinstance(locations, list):
-                        locations = ', '.join(locations)
-
-                    # Extract other fields
-                    posted_date = job.get('postedOn', 'Not specified')
-
-                    # Check if remote
-                    remote = 'No'
-                    if 'remote' in str(locations).lower() or 'remote' in str(title).lower():
-                        remote = 'Yes'
-
-                    # Get job URL
-                    job_url = ''
-                    if 'externalPath' in job:
-                        job_url = f"{self.url.rstrip('/')}/{job['externalPath'].lstrip('/')}"
-
-                    job_info = {
-                        'title': title,
-                        'department': job.get('category', {}).get('label', 'Not specified') if isinstance(job.get('category'), dict) else 'Not specified',
-                        'location': locations,
-                        'posting_date': posted_date,
-                        'remote': remote,
-                        'region': 'Not specified',  # Workday doesn't always provide region
-                        'url': job_url
-                    }
-
-                    jobs.append(job_info)
-                    total_fetched += 1
-
-                except Exception as e:
-                    self.log(f"Error parsing job: {e}", "WARNING")
-                    continue
+        try:
+            return response.json()
+        except json.JSONDecodeError as e:
+            self.log(f"Failed to parse JSON response (offset: {offset}): {e}", "ERROR")
+            return None
+
+    def _parse_job(self, job):
+        """
+        Convert a Workday job posting into the standard job format.
 
-            # Check if there are more pages
-            # Only set total_jobs from the first response (subsequent pages may return 0)
-            page_total = data.get('total', 0)
-            if total_jobs is None and page_total > 0:
-                total_jobs = page_total
-            self.log(f"Fetched {total_fetched}/{total_jobs} jobs")
+        Args:
+            job (dict): Job posting from the Workday API
 
-            if total_fetched >= total_jobs:
-                break
+        Returns:
+            dict or None: Job dictionary, or None if it could not be parsed
+        """
+        try:
+            title = job.get('title', 'Not specified')
 
-            offset += limit
+            # Extract location
+            locations = job.get('locationsText', 'Not specified')
+            if isinstance(locations, list):
+                locations = ', '.join(locations)
 
-        self.log(f"Completed: {len(jobs)} jobs scraped")
-        return jobs
+            # Extract other fields
+            posted_date = job.get('postedOn', 'Not specified')
+
+            # Check if remote
+            remote = 'No'
+            if 'remote' in str(locations).lower() or 'remote' in str(title).lower():
+                remote = 'Yes'
+
+            # Get job URL
+            job_url = ''
+            if 'externalPath' in job:
+                job_url = f"{self.url.rstrip('/')}/{job['externalPath'].lstrip('/')}"
+
+            return {
+                'title': title,
+                'department': job.get('category', {}).get('label', 'Not specified') if isinstance(job.get('category'), dict) else 'Not specified',
+                'location': locations,
+                'posting_date': posted_date,
+                'remote': remote,
+                'region': 'Not specified',  # Workday doesn't always provide region
+                'url': job_url
+            }
+
+        except Exception as e:
+            self.log(f"Error parsing job: {e}", "WARNING")
+            return None
@@ -5,55 +5,18 @@ Scrapes job postings from Yardi careers page.
 Uses headless browser with anti-detection measures.
 """
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from scrapers.headless_scraper import HeadlessScraper
-import time
 import re
 
 
 class YardiScraper(HeadlessScraper):
     """Scraper for Yardi careers site."""
 
-    def _setup_driver(self):
-        """Set up Chrome driver with anti-detection measures."""
-        if self.driver:
-            return
+    # Anti-detection Chrome profile (see scrapers.browser_pool.PROFILES)
+    browser_profile = 'stealth'
 
-        self.log("Setting up headless Chrome browser with anti-detection...")
-
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
-
-        chrome_options = Options()
-        chrome_options.add_argument('--headless=new')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-
-        try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-
-            # Override webdriver detection
-            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-                'source': '''
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    })
-                '''
-            })
-
-            self.log("Browser ready")
-        except Exception as e:
-            self.log(f"Failed to setup browser: {e}", "ERROR")
-            raise
+    # Wait for the job board's requests to finish rather than a fixed delay
+    readiness = {'condition': 'network_idle', 'timeout': 20}
 
     def _scrape_jobs(self):
         """
@@ -69,15 +32,14 @@ class YardiScraper(HeadlessScraper):
 
         # Load careers page
         url = self.config.get('url', 'https://careers.yardi.com/openings/')
-        self.driver.get(url)
         self.log(f"Loading: {url}")
-        time.sleep(8)
+        self.load_page(url)
 
         # Scroll to load all jobs
         self._scroll_to_load_all()
 
         # Find all links on the page
-        links = self.driver.find_elements(By.CSS_SELECTOR, 'a')
+        links = self.extract_rows('a')
         self.log(f"Found {len(links)} total links")
 
         # Job title keywords to identify job listings
@@ -88,8 +50,8 @@ class YardiScraper(HeadlessScraper):
 
         for link in links:
             try:
-                href = link.get_attribute('href') or ''
-                text = link.text.strip()
+                href = link['url'] or ''
+                text = (link['text'] or '').strip()
 
                 # Skip non-job links
                 if not text or len(text) < 10:
@@ -156,14 +118,13 @@ class YardiScraper(HeadlessScraper):
             last_height = self.driver.execute_script("return document.body.scrollHeight")
             for _ in range(10):  # Max 10 scroll attempts
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(1)
+                self.wait_until_ready(quiet=0.5, timeout=3)
                 new_height = self.driver.execute_script("return document.body.scrollHeight")
                 if new_height == last_height:
                     break
                 last_height = new_height
             # Scroll back to top
             self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
         except Exception as e:
             self.log(f"Scroll failed: {e}", "WARNING")
 
@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+Snapshot Store
+
+Delta-encoded history of each company's daily job CSVs, kept in
+companies/<slug>/snapshots/. Each segment file <date>.jsonl starts with a
+full keyframe of that day's rows, followed by one line per later day holding
+only what changed since the day before: difflib opcodes over the rows, so
+row order is preserved, with rows whose only change is a field or two (such
+as Workday's relative "Posted 3 Days Ago" dates) stored as field patches.
+A new segment is started every KEYFRAME_INTERVAL days, when the columns
+change, or when a delta would not be much smaller than a keyframe.
+
+Any stored day can be rebuilt as the exact bytes of its original
+{slug}_jobs_{date}.csv. Raw CSVs are only removed after that has been
+verified, and the most recent KEEP_CSV_FILES stay on disk for the scripts
+that read them directly.
+
+Usage:
+    python snapshot_store.py convert                  # Store all companies' CSV history
+    python snapshot_store.py convert veeva --prune    # ...and remove the verified old CSVs
+    python snapshot_store.py export veeva 2026-02-01  # Rebuild a day's CSV
+    python snapshot_store.py dates veeva              # List stored days
+"""
+
+import argparse
+import csv
+import difflib
+import io
+import json
+import os
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+
+SNAPSHOT_DIR = 'snapshots'
+
+# Days per segment (one keyframe, then deltas)
+KEYFRAME_INTERVAL = 30
+
+# A day whose delta is larger than this share of a keyframe becomes a keyframe
+MAX_DELTA_RATIO = 0.5
+
+# Daily CSVs kept on disk after they are stored
+KEEP_CSV_FILES = 7
+
+# Columns ignored when matching a row to the previous day's, because their
+# text changes daily ("Posted 3 Days Ago"); their changes are stored as patches
+VOLATILE_COLUMNS = ('posting_date',)
+
+
+def snapshot_csv_pattern(company_slug):
+    """
+    Get the pattern of a company's daily job CSV file names.
+
+    Args:
+        company_slug (str): Company slug
+
+    Returns:
+        re.Pattern: Matches {slug}_jobs_{date}.csv, capturing the date
+    """
+    return re.compile(rf'^{re.escape(company_slug)}_jobs_(\d{{4}}-\d{{2}}-\d{{2}})\.csv$')
+
+
+def detect_newline(csv_file):
+    """
+    Get the line terminator a CSV file was written with.
+
+    Args:
+        csv_file (Path): CSV file
+
+    Returns:
+        str: '\r\n' (the csv module's default) or '\n'
+    """
+    with open(csv_file, 'rb') as f:
+        first_line = f.readline()
+    return '\n' if first_line.endswith(b'\n') and not first_line.endswith(b'\r\n') else '\r\n'
+
+
+def read_csv_rows(csv_file):
+    """
+    Read a CSV file as a header and rows of fields.
+
+    Args:
+        csv_file (Path): CSV file
+
+    Returns:
+        tuple: (header list, list of row lists); header is None for an empty file
+    """
+    with open(csv_file, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        return header, [row for row in reader]
+
+
+def render_csv(header, rows, newline='\r\n'):
+    """
+    Render a snapshot as CSV text, the way the scrapers write it.
+
+    Args:
+        header (list): Column names
+        rows (list): Row lists
+        newline (str): Line terminator
+
+    Returns:
+        str: CSV text
+    """
+    buffer = io.StringIO(newline='')
+    writer = csv.writer(buffer, lineterminator=newline)
+    writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def diff_rows(previous, current, volatile=()):
+    """
+    Encode the change from one day's rows to the next.
+
+    Rows are matched on all but the volatile columns. Matched rows and
+    blocks of rows replaced one-for-one are stored as field patches, so a
+    row whose posting date text changed costs a few bytes instead of a row.
+
+    Args:
+        previous (list): Previous day's rows
+        current (list): Current day's rows
+        volatile (iterable): Indexes of columns ignored for matching
+
+    Returns:
+        list: Operations on previous, in row order. [start, end, new_rows]
+            replaces previous[start:end]; [start, patches] sets fields, with
+            patches a list of [row offset, column, value]
+    """
+    volatile = set(volatile)
+
+    def key(row):
+        return tuple(field for column, field in enumerate(row) if column not in volatile)
+
+    matcher = difflib.SequenceMatcher(None, [key(r) for r in previous],
+                                      [key(r) for r in current], autojunk=False)
+    ops = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        pairs = list(zip(previous[i1:i2], current[j1:j2]))
+        if tag in ('equal', 'replace') and i2 - i1 == j2 - j1 and all(len(old) == len(new) for old, new in pairs):
+            patches = [[offset, column, value]
+                       for offset, (old, new) in enumerate(pairs)
+                       for column, (field, value) in enumerate(zip(old, new)) if field != value]
+            if patches:
+                ops.append([i1, patches])
+        else:
+            ops.append([i1, i2, current[j1:j2]])
+    return ops
+
+
+def apply_delta(rows, ops):
+    """
+    Apply diff_rows() operations to a day's rows.
+
+    Args:
+        rows (list): Previous day's rows
+        ops (list): Operations from diff_rows()
+
+    Returns:
+        list: The next day's rows
+    """
+    rows = list(rows)
+    for op in reversed(ops):
+        if len(op) == 2:
+            start, patches = op
+            for offset, column, value in patches:
+                row = rows[start + offset] = list(rows[start + offset])
+                row[column] = value
+        else:
+            start, end, new_rows = op
+            rows[start:end] = new_rows
+    return rows
+
+
+class SnapshotStore:
+    """Keyframe + delta history of one company's daily snapshots."""
+
+    def __init__(self, company_dir):
+        """
+        Initialize the store (nothing is created until the first save).
+
+        Args:
+            company_dir (Path): Company directory
+        """
+        self.company_dir = Path(company_dir)
+        self.path = self.company_dir / SNAPSHOT_DIR
+
+    def segments(self):
+        """
+        List the segment files.
+
+        Returns:
+            list: Segment paths, oldest first
+        """
+        if not self.path.exists():
+            return []
+        return sorted(self.path.glob('*.jsonl'))
+
+    @staticmethod
+    def _read_segment(segment):
+        with open(segment, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def _write_segment(self, segment, entries):
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp_file = segment.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+        os.replace(tmp_file, segment)
+
+    @staticmethod
+    def _replay(entries):
+        """
+        Rebuild every day of a segment.
+
+        Yields:
+            tuple: (date, (header, rows, newline))
+        """
+        header, rows, newline = None, None, None
+        for entry in entries:
+            if 'rows' in entry:
+                header, rows, newline = entry['header'], entry['rows'], entry['newline']
+            else:
+                rows = apply_delta(rows, entry['ops'])
+            yield entry['date'], (header, rows, newline)
+
+    def dates(self):
+        """
+        List the stored days.
+
+        Returns:
+            list: Dates (YYYY-MM-DD), oldest first
+        """
+        return [entry['date'] for segment in self.segments() for entry in self._read_segment(segment)]
+
+    def load(self, date):
+        """
+        Rebuild a day's snapshot.
+
+        Args:
+            date (str): Date (YYYY-MM-DD)
+
+        Returns:
+            tuple or None: (header, rows, newline), or None if the day is not stored
+        """
+        segments = [s for s in self.segments() if s.stem <= date]
+        if not segments:
+            return None
+
+        for day, snapshot in self._replay(self._read_segment(segments[-1])):
+            if day == date:
+                return snapshot
+        return None
+
+    def export_csv(self, date, output_file):
+        """
+        Write a stored day as a CSV file.
+
+        Args:
+            date (str): Date (YYYY-MM-DD)
+            output_file (Path): CSV file to write
+
+        Returns:
+            bool: True if the day was stored and written
+        """
+        snapshot = self.load(date)
+        if snapshot is None:
+            return False
+
+        with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            f.write(render_csv(*snapshot))
+        return True
+
+    def matches_csv(self, date, csv_file):
+        """
+        Check that a stored day rebuilds to exactly the bytes of a CSV file.
+
+        Args:
+            date (str): Date (YYYY-MM-DD)
+            csv_file (Path): Original CSV file
+
+        Returns:
+            bool: True if the stored day is identical to the file
+        """
+        snapshot = self.load(date)
+        return snapshot is not None and render_csv(*snapshot).encode('utf-8') == csv_file.read_bytes()
+
+    def save(self, date, header, rows, newline='\r\n'):
+        """
+        Store a day's snapshot, as a delta against the previous day when possible.
+
+        Saving the latest stored day again replaces it. Days before the
+        latest stored day cannot be added.
+
+        Args:
+            date (str): Date (YYYY-MM-DD)
+            header (list): Column names
+            rows (list): Row lists
+            newline (str): Line terminator of the CSV file
+
+        Returns:
+            str: 'keyframe' or 'delta'
+        """
+        segments = self.segments()
+        entries = self._read_segment(segments[-1]) if segments else []
+
+        if entries and entries[-1]['date'] == date:
+            entries.pop()
+        if entries and entries[-1]['date'] > date:
+            raise ValueError(f"{self.path}: {date} is before the latest stored day {entries[-1]['date']}")
+
+        if entries:
+            _, (previous_header, previous_rows, previous_newline) = list(self._replay(entries))[-1]
+            volatile = [column for column, name in enumerate(header) if name in VOLATILE_COLUMNS]
+            ops = diff_rows(previous_rows, rows, volatile)
+            if (previous_header == header and previous_newline == newline
+                    and len(entries) < KEYFRAME_INTERVAL
+                    and len(json.dumps(ops)) <= MAX_DELTA_RATIO * len(json.dumps(rows))):
+                entries.append({'date': date, 'ops': ops})
+                self._write_segment(segments[-1], entries)
+                return 'delta'
+        elif segments:
+            # The replaced day was the segment's keyframe
+            segments[-1].unlink()
+
+        keyframe = {'date': date, 'header': header, 'newline': newline, 'rows': rows}
+        self._write_segment(self.path / f"{date}.jsonl", [keyframe])
+        return 'keyframe'
+
+    def save_csv(self, date, csv_file):
+        """
+        Store a day's CSV file.
+
+        Args:
+            date (str): Date (YYYY-MM-DD)
+            csv_file (Path): The day's {slug}_jobs_{date}.csv
+
+        Returns:
+            str or None: 'keyframe' or 'delta', or None for an empty file
+        """
+        header, rows = read_csv_rows(csv_file)
+        if header is None:
+            return None
+        return self.save(date, header, rows, detect_newline(csv_file))
+
+
+def list_snapshot_csvs(company_dir, company_slug):
+    """
+    List a company's daily job CSV files.
+
+    Args:
+        company_dir (Path): Company directory
+        company_slug (str): Company slug
+
+    Returns:
+        list: (date, Path) tuples, oldest first
+    """
+    pattern = snapshot_csv_pattern(company_slug)
+    files = []
+    for f in company_dir.iterdir():
+        match = pattern.match(f.name)
+        if match:
+            files.append((match.group(1), f))
+    return sorted(files)
+
+
+def prune_csvs(store, company_dir, company_slug, keep=KEEP_CSV_FILES):
+    """
+    Delete daily CSVs that are stored, except for the most recent ones.
+
+    A file is only deleted if its stored day rebuilds to identical bytes.
+
+    Args:
+        store (SnapshotStore): Company's snapshot store
+        company_dir (Path): Company directory
+        company_slug (str): Company slug
+        keep (int): Most recent CSV files to keep
+
+    Returns:
+        int: Number of files deleted
+    """
+    files = list_snapshot_csvs(company_dir, company_slug)
+    deleted = 0
+    for date, csv_file in files[:max(len(files) - keep, 0)]:
+        if store.matches_csv(date, csv_file):
+            csv_file.unlink()
+            deleted += 1
+    return deleted
+
+
+def archive_snapshot(company_slug, rows=None):
+    """
+    Store today's CSV in the company's snapshot store and prune old CSVs.
+
+    Args:
+        company_slug (str): Company slug (folder name)
+        rows (list): Today's rows as dictionaries, if already read
+
+    Returns:
+        bool: True if today's snapshot was stored
+    """
+    company_dir = Path('companies') / company_slug
+    today = datetime.now().strftime('%Y-%m-%d')
+    csv_file = company_dir / f"{company_slug}_jobs_{today}.csv"
+
+    if not csv_file.exists():
+        print(f"[ERROR] Today's job file not found: {csv_file}")
+        return False
+
+    print(f"\nArchiving snapshot for: {company_slug}")
+    print("-" * 60)
+
+    if rows:
+        header = list(rows[0].keys())
+        records = [[row[column] for column in header] for row in rows]
+    else:
+        header, records = read_csv_rows(csv_file)
+        if header is None:
+            print("  Empty job file, nothing to archive")
+            return False
+
+    store = SnapshotStore(company_dir)
+    try:
+        kind = store.save(today, header, records, detect_newline(csv_file))
+    except ValueError as e:
+        print(f"  {e}")
+        return False
+
+    if not store.matches_csv(today, csv_file):
+        # Not written the way the scrapers write CSVs; keep the file as the source
+        print(f"  [WARNING] Stored snapshot differs from {csv_file.name}, raw CSVs will be kept")
+        return True
+
+    print(f"  Stored {today} as {kind} ({len(records)} rows)")
+    deleted = prune_csvs(store, company_dir, company_slug)
+    if deleted:
+        print(f"  Removed {deleted} old CSV files (kept in {store.path})")
+
+    return True
+
+
+def convert_company(company_dir, prune=False, keep=KEEP_CSV_FILES):
+    """
+    Store a company's existing CSV history.
+
+    Days already stored are skipped, so the conversion can be rerun.
+
+    Args:
+        company_dir (Path): Company directory
+        prune (bool): Delete the verified CSVs, except the most recent ones
+        keep (int): Most recent CSV files to keep when pruning
+
+    Returns:
+        tuple: (days stored, days that did not rebuild identically, CSVs deleted)
+    """
+    slug = company_dir.name
+    store = SnapshotStore(company_dir)
+    stored_dates = store.dates()
+    latest = stored_dates[-1] if stored_dates else ''
+
+    added, mismatched = 0, []
+    for date, csv_file in list_snapshot_csvs(company_dir, slug):
+        if date <= latest:
+            continue
+        if store.save_csv(date, csv_file) is None:
+            continue
+        added += 1
+        if not store.matches_csv(date, csv_file):
+            mismatched.append(date)
+
+    deleted = prune_csvs(store, company_dir, slug, keep) if prune else 0
+    return added, mismatched, deleted
+
+
+def directory_size(paths):
+    """Total size in bytes of files."""
+    return sum(p.stat().st_size for p in paths if p.is_file())
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(description='Delta-encoded storage of daily job snapshots')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert = subparsers.add_parser('convert', help='Store existing daily CSVs')
+    convert.add_argument('companies', nargs='*', help='Company slugs (default: all)')
+    convert.add_argument('--prune', action='store_true',
+                         help='Delete verified CSVs except the most recent ones')
+    convert.add_argument('--keep', type=int, default=KEEP_CSV_FILES,
+                         help=f'Most recent CSVs to keep when pruning (default: {KEEP_CSV_FILES})')
+
+    export = subparsers.add_parser('export', help="Rebuild a day's CSV")
+    export.add_argument('company', help='Company slug')
+    export.add_argument('date', help='Date (YYYY-MM-DD)')
+    export.add_argument('-o', '--output', help='Output file (default: companies/<slug>/<slug>_jobs_<date>.csv)')
+
+    dates = subparsers.add_parser('dates', help='List stored days')
+    dates.add_argument('company', help='Company slug')
+
+    args = parser.parse_args()
+    companies_dir = Path('companies')
+
+    if args.command == 'export':
+        company_dir = companies_dir / args.company
+        output = Path(args.output) if args.output else company_dir / f"{args.company}_jobs_{args.date}.csv"
+        if not SnapshotStore(company_dir).export_csv(args.date, output):
+            print(f"[ERROR] {args.date} is not stored for {args.company}")
+            sys.exit(1)
+        print(f"Wrote {output}")
+        return
+
+    if args.command == 'dates':
+        for date in SnapshotStore(companies_dir / args.company).dates():
+            print(date)
+        return
+
+    if args.companies:
+        company_dirs = [companies_dir / slug for slug in args.companies]
+    else:
+        company_dirs = sorted(d for d in companies_dir.iterdir() if d.is_dir())
+
+    csv_bytes = directory_size(p for d in company_dirs for _, p in list_snapshot_csvs(d, d.name))
+    total_added = total_deleted = 0
+
+    for company_dir in company_dirs:
+        if not company_dir.is_dir():
+            print(f"[ERROR] Company directory not found: {company_dir}")
+            continue
+        added, mismatched, deleted = convert_company(company_dir, args.prune, args.keep)
+        total_added += added
+        total_deleted += deleted
+        if added or deleted:
+            print(f"{company_dir.name}: {added} days stored, {deleted} CSVs removed")
+        if mismatched:
+            print(f"  [WARNING] Not identical when rebuilt (CSVs kept): {', '.join(mismatched)}")
+
+    snapshot_bytes = directory_size(p for d in company_dirs for p in SnapshotStore(d).segments())
+    print(f"\nStored {total_added} days, removed {total_deleted} CSVs")
+    print(f"Daily CSVs before: {csv_bytes / 1e6:.1f} MB, snapshot store: {snapshot_bytes / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,15 +27,27 @@ def count_jobs_by_department(jobs_file):
     if not jobs_file.exists():
         return None
 
+    with open(jobs_file, 'r', encoding='utf-8') as f:
+        return count_departments(csv.DictReader(f))
+
+
+def count_departments(rows):
+    """
+    Count job rows by department.
+
+    Args:
+        rows (iterable): Job dictionaries (CSV rows)
+
+    Returns:
+        dict: Dictionary with department counts and total
+    """
     department_counts = defaultdict(int)
     total = 0
 
-    with open(jobs_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            dept = row.get('department', 'Unknown')
-            department_counts[dept] += 1
-            total += 1
+    for row in rows:
+        dept = row.get('department', 'Unknown')
+        department_counts[dept] += 1
+        total += 1
 
     return {
         'total': total,
@@ -91,12 +103,13 @@ def save_daily_count(history_file, date, total_count, department_counts):
     print(f"  Saved job count for {date}: {total_count} total jobs")
 
 
-def track_counts_for_company(company_slug):
+def track_counts_for_company(company_slug, rows=None):
     """
     Track job counts for a specific company.
 
     Args:
         company_slug (str): Company slug (folder name)
+        rows (list): Today's job rows, if already read (otherwise today's CSV is read)
 
     Returns:
         bool: True if successful, False otherwise
@@ -118,7 +131,10 @@ def track_counts_for_company(company_slug):
     print("-" * 60)
 
     # Count today's jobs
-    job_data = count_jobs_by_department(jobs_file)
+    if rows is None:
+        job_data = count_jobs_by_department(jobs_file)
+    else:
+        job_data = count_departments(rows)
 
     if not job_data:
         print("  Could not read job data")
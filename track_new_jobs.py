@@ -3,16 +3,19 @@
 New Jobs Tracker (Multi-Company Version)
 
 Compares today's job scrape with previous data to identify new job postings.
+Every job seen is kept in the company's job store (companies/<slug>/jobs.db).
 Can be run for a specific company or all companies.
 """
 
 import csv
 import os
-import json
 import sys
 from datetime import datetime
 from pathlib import Path
 
+from job_fingerprint import FingerprintIndex, job_fingerprint, report_collisions
+from job_store import JobStore
+
 
 def load_jobs_from_csv(filepath):
     """
@@ -22,23 +25,35 @@ def load_jobs_from_csv(filepath):
         filepath (Path): Path to CSV file
 
     Returns:
-        tuple: (set of job identifiers, list of job dicts)
+        tuple: (FingerprintIndex of the jobs, list of job dicts)
     """
     if not filepath.exists():
-        return set(), []
+        return FingerprintIndex(), []
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return index_jobs(csv.DictReader(f))
+
+
+def index_jobs(rows):
+    """
+    Fingerprint job postings.
+
+    Args:
+        rows (iterable): Job dictionaries (CSV rows)
 
-    jobs_set = set()
+    Returns:
+        tuple: (FingerprintIndex of the jobs, list of job dicts)
+    """
+    jobs_index = FingerprintIndex()
     jobs_list = []
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Create a unique identifier for each job posting
-            job_id = (row.get('title', ''), row.get('department', ''), row.get('location', ''))
-            jobs_set.add(job_id)
-            jobs_list.append(row)
+    for row in rows:
+        # Fingerprint of the normalized (title, department, location)
+        jobs_index.add(row)
+        jobs_list.append(row)
 
-    return jobs_set, jobs_list
+    report_collisions(jobs_index)
+    return jobs_index, jobs_list
 
 
 def find_new_jobs(current_jobs, previous_jobs):
@@ -46,11 +61,11 @@ def find_new_jobs(current_jobs, previous_jobs):
     Find jobs that appear in current but not in previous.
 
     Args:
-        current_jobs (set): Set of current job identifiers
-        previous_jobs (set): Set of previous job identifiers
+        current_jobs (set): Set of current job fingerprints
+        previous_jobs (set): Set of previous job fingerprints
 
     Returns:
-        set: Set of new job identifiers
+        set: Set of new job fingerprints
     """
     return current_jobs - previous_jobs
 
@@ -60,7 +75,7 @@ def save_new_jobs_csv(new_job_ids, all_current_jobs, output_file):
     Save new jobs to a CSV file.
 
     Args:
-        new_job_ids (set): Set of new job identifiers
+        new_job_ids (set): Set of new job fingerprints
         all_current_jobs (list): List of all current job dictionaries
         output_file (Path): Output filepath
     """
@@ -68,11 +83,11 @@ def save_new_jobs_csv(new_job_ids, all_current_jobs, output_file):
         print("  No new jobs found.")
         return
 
-    # Deduplicate: only keep the first row matching each identity tuple
+    # Deduplicate: only keep the first row matching each fingerprint
     seen = set()
     new_jobs = []
     for job in all_current_jobs:
-        job_id = (job.get('title', ''), job.get('department', ''), job.get('location', ''))
+        job_id = job_fingerprint(job)
         if job_id in new_job_ids and job_id not in seen:
             seen.add(job_id)
             new_jobs.append(job)
@@ -87,43 +102,19 @@ def save_new_jobs_csv(new_job_ids, all_current_jobs, output_file):
     print(f"  Saved {len(new_jobs)} new job postings to {output_file}")
 
 
-def update_tracking_database(company_dir, current_jobs_set):
+def update_tracking_database(store, current_jobs, today):
     """
-    Update the tracking database by MERGING current jobs into the cumulative history.
-    Jobs are never removed from the tracking DB -- this prevents false "new" alerts
+    Record today's jobs in the company's job store.
+    Jobs are never removed from the store -- this prevents false "new" alerts
     when a job disappears from a scrape (pagination, site issues) then reappears.
 
     Args:
-        company_dir (Path): Company directory
-        current_jobs_set (set): Set of current job identifiers
+        store (JobStore): Company's job store
+        current_jobs (FingerprintIndex): Today's jobs
+        today (str): Today's date in YYYY-MM-DD format
     """
-    db_file = company_dir / 'jobs_tracking.json'
-
-    # Load existing cumulative history
-    existing_jobs = set()
-    if db_file.exists():
-        with open(db_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        existing_jobs = set(tuple(job) for job in data.get('jobs', []))
-
-    # Merge: union of existing + current (never lose a job we've seen before)
-    all_seen_jobs = existing_jobs | current_jobs_set
-
-    # Convert set of tuples to list of lists for JSON serialization
-    jobs_list = [list(job) for job in all_seen_jobs]
-
-    tracking_data = {
-        'last_updated': datetime.now().isoformat(),
-        'job_count': len(jobs_list),
-        'active_count': len(current_jobs_set),
-        'jobs': jobs_list
-    }
-
-    with open(db_file, 'w', encoding='utf-8') as f:
-        json.dump(tracking_data, f, indent=2)
-
-    new_in_db = len(all_seen_jobs) - len(existing_jobs)
-    print(f"  Updated tracking database: {len(all_seen_jobs)} total seen ({len(current_jobs_set)} active, {new_in_db} newly added)")
+    new_in_db = store.record_snapshot(current_jobs, today)
+    print(f"  Updated tracking database: {store.count()} total seen ({len(current_jobs)} active, {new_in_db} newly added)")
 
 
 def find_previous_csv(company_dir, company_slug, today):
@@ -159,44 +150,40 @@ def find_previous_csv(company_dir, company_slug, today):
     return previous_files[0][1]
 
 
-def load_tracking_database(company_dir, company_slug=None, today=None):
+def seed_from_previous_csv(store, company_dir, company_slug, today):
     """
-    Load the tracking database, falling back to most recent CSV if no database exists.
+    Record the most recent CSV before today in a newly created job store.
+
+    A store is created on the first run, and again if the file was lost
+    (the workflows keep it in a cache, not in git). Without the previous
+    day's jobs, everything listed since the imported jobs_tracking.json (or
+    everything at all) would be reported as new.
 
     Args:
+        store (JobStore): Newly created store
         company_dir (Path): Company directory
-        company_slug (str): Company slug (needed for CSV fallback)
-        today (str): Today's date (needed for CSV fallback)
+        company_slug (str): Company slug
+        today (str): Today's date in YYYY-MM-DD format
 
     Returns:
-        set: Set of previously tracked job identifiers
+        int: Number of jobs added to the store
     """
-    db_file = company_dir / 'jobs_tracking.json'
-
-    if db_file.exists():
-        with open(db_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        # Convert list of lists back to set of tuples
-        jobs_set = set(tuple(job) for job in data.get('jobs', []))
-        return jobs_set
+    previous_csv = find_previous_csv(company_dir, company_slug, today)
+    if not previous_csv:
+        return 0
 
-    # No tracking database - try to find previous CSV as baseline
-    if company_slug and today:
-        previous_csv = find_previous_csv(company_dir, company_slug, today)
-        if previous_csv:
-            print(f"  No tracking database, using previous CSV as baseline: {previous_csv.name}")
-            jobs_set, _ = load_jobs_from_csv(previous_csv)
-            return jobs_set
+    print(f"  New tracking database, using previous CSV as baseline: {previous_csv.name}")
+    jobs_index, _ = load_jobs_from_csv(previous_csv)
+    return store.record_snapshot(jobs_index, previous_csv.stem[-len(today):])
 
-    return set()
 
-
-def track_company(company_slug):
+def track_company(company_slug, rows=None):
     """
     Track new jobs for a specific company.
 
     Args:
         company_slug (str): Company slug (folder name)
+        rows (list): Today's job rows, if already read (otherwise today's CSV is read)
 
     Returns:
         bool: True if successful, False otherwise
@@ -218,32 +205,36 @@ def track_company(company_slug):
     print("-" * 60)
 
     # Load current jobs
-    current_jobs_set, current_jobs_list = load_jobs_from_csv(today_file)
-    print(f"  Current jobs: {len(current_jobs_set)}")
-
-    # Load previous jobs from tracking database (or fallback to previous CSV)
-    previous_jobs_set = load_tracking_database(company_dir, company_slug, today)
-
-    if not previous_jobs_set:
-        print("  No previous data found (first run)")
-        print("  Treating all current jobs as new")
-        # On first run, all jobs are new — write them to the _new_ file
-        new_jobs_set = current_jobs_set
-    else:
-        print(f"  Previous jobs: {len(previous_jobs_set)}")
-        # Find new jobs
-        new_jobs_set = find_new_jobs(current_jobs_set, previous_jobs_set)
-    print(f"  New jobs detected: {len(new_jobs_set)}")
-
-    # Save new jobs to CSV
-    if new_jobs_set:
-        output_file = company_dir / f"{company_slug}_jobs_new_{today}.csv"
-        save_new_jobs_csv(new_jobs_set, current_jobs_list, output_file)
+    if rows is None:
+        current_jobs, current_jobs_list = load_jobs_from_csv(today_file)
     else:
-        print("  No new jobs since last run")
-
-    # Update tracking database
-    update_tracking_database(company_dir, current_jobs_set)
+        current_jobs, current_jobs_list = index_jobs(rows)
+    print(f"  Current jobs: {len(current_jobs)}")
+
+    with JobStore(company_dir) as store:
+        if store.created:
+            seed_from_previous_csv(store, company_dir, company_slug, today)
+
+        if store.is_empty():
+            print("  No previous data found (first run)")
+            print("  Treating all current jobs as new")
+            # On first run, all jobs are new — write them to the _new_ file
+            new_jobs_set = current_jobs.fingerprints()
+        else:
+            print(f"  Previous jobs: {store.count()}")
+            # Find new jobs (anti-join against every job ever seen)
+            new_jobs_set = store.find_new(current_jobs)
+        print(f"  New jobs detected: {len(new_jobs_set)}")
+
+        # Save new jobs to CSV
+        if new_jobs_set:
+            output_file = company_dir / f"{company_slug}_jobs_new_{today}.csv"
+            save_new_jobs_csv(new_jobs_set, current_jobs_list, output_file)
+        else:
+            print("  No new jobs since last run")
+
+        # Update tracking database
+        update_tracking_database(store, current_jobs, today)
 
     return True
 